@@ -95,5 +95,5 @@ class AppConfig(BaseModel):
     def load(cls, path: str | Path = APP_CONFIG_PATH) -> "AppConfig":
         return load_toml_config(cls, path)
 
-    def save(self, path: str | Path = APP_CONFIG_PATH) -> None:
-        save_toml_config(self, path)
+    def save(self, path: str | Path = APP_CONFIG_PATH, *, raise_on_error: bool = False) -> None:
+        save_toml_config(self, path, raise_on_error=raise_on_error)
@@ -30,7 +30,7 @@ class ElectricProperties(Enum):
         return self.display_name
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ElectricMeasurement:
     """電力測定データDTO"""
 
@@ -1,3 +1,4 @@
+import functools
 import math
 from dataclasses import dataclass, field
 
@@ -9,6 +10,34 @@ from .prefix_registry import PREFIX_REGISTRY
 _DEFAULT_PREFIX_TOL = 1e-6
 
 
+@functools.cache
+def _parse_unit(unit: str) -> tuple[float, str, str, str]:
+    """
+    単位文字列を解析して (SI換算係数, 単位記号, 接頭辞, 単位) を返す
+
+    単位の定義は固定なので、同じ単位文字列は2回目以降キャッシュを返す (生成のたびに解析しない)。
+    """
+    prefix, base = split_unit(unit, PREFIX_REGISTRY.known_prefixes)
+    PREFIX_REGISTRY.validate(prefix, base)  # %, ppm などに単位が存在するかチェック
+
+    unit_type = UNIT_BY_SYMBOL[base]
+    return PREFIX_REGISTRY.get(prefix).scale, unit_type.symbol, prefix, base
+
+
+@functools.cache
+def _prefix_scale(prefix: str, unit: str) -> float:
+    """単位に対する接頭辞の換算係数 (組み合わせが不正なら ValueError)"""
+    PREFIX_REGISTRY.validate(prefix, unit)
+    return PREFIX_REGISTRY.get(prefix).scale
+
+
+@functools.cache
+def _display_suffix(prefix: str, unit: str) -> str:
+    """数値の後ろに付ける表示用の単位 (" mV" など。表示するものが無ければ空文字)"""
+    unit_str = prefix if PREFIX_REGISTRY.get(prefix).unit_hidden else f"{prefix}{unit}"
+    return f" {unit_str}" if unit_str else ""
+
+
 @dataclass
 class Quantity[T]:
     _value_si: float = field(init=False)  # 接頭辞無しでの値
@@ -16,13 +45,10 @@ class Quantity[T]:
     display_prefix: str = field(init=False)
 
     def __init__(self, value: float = 0.0, unit: str = "") -> None:
-        prefix, base = split_unit(unit, PREFIX_REGISTRY.known_prefixes)
-        PREFIX_REGISTRY.validate(prefix, base)  # %, ppm などに単位が存在するかチェック
-
-        unit_type = UNIT_BY_SYMBOL[base]
+        scale, symbol, prefix, base = _parse_unit(unit)
 
-        self._value_si = value * PREFIX_REGISTRY.get(prefix).scale
-        self.unit = unit_type.symbol
+        self._value_si = value * scale
+        self.unit = symbol
         self.display_prefix = prefix
         self.display_unit = base
 
@@ -42,8 +68,7 @@ class Quantity[T]:
 
     def value_as(self, prefix: str = "") -> float:
         """指定の接頭辞で値を取得"""
-        PREFIX_REGISTRY.validate(prefix, self.unit)
-        return self._value_si / PREFIX_REGISTRY.get(prefix).scale
+        return self._value_si / _prefix_scale(prefix, self.unit)
 
     def isclose(
         self, other: "Quantity", *, rel_tol: float = 0.0, abs_tol: float | None = None
@@ -67,28 +92,12 @@ class Quantity[T]:
 
     # === 表示
 
-    def _get_unit_suffix(self) -> str:
-        """表示用の単位接尾辞を取得。設定により単位が隠されている場合は空文字を返す。"""
-        spec = PREFIX_REGISTRY.get(self.display_prefix)
-        if spec.unit_hidden:
-            return ""
-
-        return self.unit
-
     def __format__(self, format_spec: str) -> str:
         """f-string 時に呼ばれる"""
         value = self.value_as(self.display_prefix)
-        formatted_value = format(value, format_spec)  # f-string で指定されたフォーマットを適用
-        unit_str = f"{self.display_prefix}{self._get_unit_suffix()}"
-
-        if unit_str == "":
-            return f"{formatted_value}"
-        return f"{formatted_value} {self.display_prefix}{self._get_unit_suffix()}"
+        # f-string で指定されたフォーマットを適用 (単位部分は接頭辞・単位ごとにキャッシュ済み)
+        return format(value, format_spec) + _display_suffix(self.display_prefix, self.unit)
 
     def __str__(self) -> str:
         value = self.value_as(self.display_prefix)
-        unit_str = f"{self.display_prefix}{self._get_unit_suffix()}"
-
-        if unit_str == "":
-            return f"{value}"
-        return f"{value} {self.display_prefix}{self._get_unit_suffix()}"
+        return f"{value}{_display_suffix(self.display_prefix, self.unit)}"
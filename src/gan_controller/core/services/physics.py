@@ -4,6 +4,9 @@ from gan_controller.core.constants import (
     SPEED_OF_LIGHT,
 )
 
+# QE[%] = I / (P * lambda[nm]) * (h * c / (e * 1e-9) * 100) の定数部分 (測定ごとに計算しない)
+_QE_PERCENT_FACTOR = PLANCK_CONSTANT * SPEED_OF_LIGHT / (ELEMENTARY_CHARGE * 1e-9) * 100.0
+
 
 def calculate_quantum_efficiency(
     current_amp: float, laser_power_watt: float, wavelength_nm: float
@@ -30,14 +33,5 @@ def calculate_quantum_efficiency(
     if laser_power_watt == 0 or wavelength_nm == 0:
         return 0.0
 
-    # 波長を nm -> m に変換
-    wavelength_m = wavelength_nm * 1e-9
-
-    # 分子: I * h * c
-    numerator = current_amp * PLANCK_CONSTANT * SPEED_OF_LIGHT
-
-    # 分母: e * P * lambda
-    denominator = ELEMENTARY_CHARGE * laser_power_watt * wavelength_m
-
-    # 結果計算
-    return (numerator / denominator) * 100.0
+    # 定数部分 (h * c / e、nm -> m 変換、% 換算) は事前計算済み
+    return current_amp * _QE_PERCENT_FACTOR / (laser_power_watt * wavelength_nm)
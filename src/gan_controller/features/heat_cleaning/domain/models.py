@@ -130,7 +130,7 @@ class Wait(Sequence):
 # =============================================================================
 # Result Data
 # =============================================================================
-@dataclass
+@dataclass(slots=True)
 class HCExperimentResult(ExperimentResult):
     """HeatCleaningの1ステップごとの結果データ"""
 
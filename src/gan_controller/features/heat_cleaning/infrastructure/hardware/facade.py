@@ -1,5 +1,4 @@
 from gan_controller.core.domain.app_config import DevicesConfig
-from gan_controller.core.domain.electricity import ElectricMeasurement
 from gan_controller.core.domain.quantity import (
     Ampere,
     Current,
@@ -52,10 +51,11 @@ class HCHardwareFacade(IHCHardwareFacade):
     def read_metrics(self) -> HCExperimentResult:
         """インターフェースの実装: 測定値を集めてResultオブジェクトを作る"""
         # 1. 圧力の計算 (電圧 -> 圧力変換)
-        ext_val = self._dev.logger.read_voltage(self._config.gm10.ext_ch)
+        #    (EXT/SIPは1回のクエリでまとめて取得)
+        ext_val, sip_val = self._dev.logger.read_voltages(
+            (self._config.gm10.ext_ch, self._config.gm10.sip_ch)
+        )
         ext_pressure = Pressure(calc_ext_pressure_from_voltage(ext_val.base_value))
-
-        sip_val = self._dev.logger.read_voltage(self._config.gm10.sip_ch)
         sip_pressure = Pressure(calc_sip_pressure_from_voltage(sip_val.base_value))
 
         # 2. 温度の取得 (接続されていない場合はnan)
@@ -64,17 +64,9 @@ class HCHardwareFacade(IHCHardwareFacade):
         else:
             case_temp = Temperature(float("nan"))
 
-        # 3. 電源情報の取得
-        hc_elec = ElectricMeasurement(
-            current=self._dev.hps.measure_current(),
-            voltage=self._dev.hps.measure_voltage(),
-            power=self._dev.hps.measure_power(),
-        )
-        amd_elec = ElectricMeasurement(
-            current=self._dev.aps.measure_current(),
-            voltage=self._dev.aps.measure_voltage(),
-            power=self._dev.aps.measure_power(),
-        )
+        # 3. 電源情報の取得 (V/I/P を1回のクエリで取得)
+        hc_elec = self._dev.hps.measure_all()
+        amd_elec = self._dev.aps.measure_all()
 
         # Resultオブジェクトの生成
         # sequence_indexなどはRunner側で埋めるため、仮として初期値やNoneを入れておく
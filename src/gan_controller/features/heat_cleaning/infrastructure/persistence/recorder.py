@@ -92,35 +92,40 @@ class HCLogRecorder:
         comment = self.config.log.comment
 
         # === Header Writing (Identical to reference) ===
-        lf.write("#Heat Cleaning monitor\n")
-        lf.write("\n")
-        lf.write(f"#Protocol:\t{lf.protocol}\n")
-        lf.write("\n")
-
-        lf.write("#Measurement\n")
-        lf.write(f"#Number:\t{lf.number}\n")
-        lf.write(f"#Date:\t{start_time.strftime('%Y/%m/%d')}\n")
-        lf.write(f"#Time:\t{start_time.strftime('%H:%M:%S')}\n")
-        lf.write(f"#Encode:\t{lf.encoding}\n")
-        lf.write("\n")
-
-        lf.write("#Condition\n")
+        # 書き込みごとにファイルを開くため、全行をまとめて1回で書き込む
+        lines = [
+            "#Heat Cleaning monitor\n",
+            "\n",
+            f"#Protocol:\t{lf.protocol}\n",
+            "\n",
+            "#Measurement\n",
+            f"#Number:\t{lf.number}\n",
+            f"#Date:\t{start_time.strftime('%Y/%m/%d')}\n",
+            f"#Time:\t{start_time.strftime('%H:%M:%S')}\n",
+            f"#Encode:\t{lf.encoding}\n",
+            "\n",
+            "#Condition\n",
+        ]
         if hc_enabled:
-            lf.write(f"#HC_CURRENT:\t{hc_current}[A]\n")
+            lines.append(f"#HC_CURRENT:\t{hc_current}[A]\n")
         if amd_enabled:
-            lf.write(f"#AMD_CURRENT:\t{amd_current}[A]\n")
+            lines.append(f"#AMD_CURRENT:\t{amd_current}[A]\n")
         # シーケンス
-        for index, sequence in enumerate(self.config.get_sequences()):
-            lf.write(f"#Sequence{index + 1}:\t{sequence}\n")
-        lf.write("\n")
+        lines.extend(
+            f"#Sequence{index + 1}:\t{sequence}\n"
+            for index, sequence in enumerate(self.config.get_sequences())
+        )
+        lines.append("\n")
 
-        lf.write("#Comment\n")
-        lf.write(f"#{comment}\n")
-        lf.write("\n")
+        lines.append("#Comment\n")
+        lines.append(f"#{comment}\n")
+        lines.append("\n")
 
-        lf.write("#Data\n")
+        lines.append("#Data\n")
         header_row = "\t".join([c.header for c in self.columns])
-        lf.write(header_row + "\n")
+        lines.append(header_row + "\n")
+
+        lf.write("".join(lines))
 
     def record_data(self, result: HCExperimentResult) -> None:
         """測定結果を1行記録"""
@@ -49,7 +49,6 @@ class HeatCleaningMainView(QWidget):
 
     def _init_ui(self) -> None:
         self._main_layout = QHBoxLayout(self)
-        self.setLayout(self._main_layout)
 
         self._main_layout.addWidget(self._left_panel())
         self._main_layout.addWidget(self._right_panel())
@@ -98,11 +97,11 @@ class HeatCleaningMainView(QWidget):
         """ショートカットキーの設定"""
         # Ctrl+S -> 上書き保存
         self.shortcut_save = QShortcut(QKeySequence("Ctrl+S"), self)
-        self.shortcut_save.activated.connect(self.save_action_requested.emit)
+        self.shortcut_save.activated.connect(self.save_action_requested)
 
         # Ctrl+Shift+S -> 名前を付けて保存
         self.shortcut_save_as = QShortcut(QKeySequence("Ctrl+Shift+S"), self)
-        self.shortcut_save_as.activated.connect(self.save_as_requested.emit)
+        self.shortcut_save_as.activated.connect(self.save_as_requested)
 
     # =============================================================================
 
@@ -31,7 +31,6 @@ class HCConditionPanel(QGroupBox):
         super().__init__("Protocol Sequences", parent)
 
         main_layout = QVBoxLayout(self)
-        self.setLayout(main_layout)
 
         sequence_layout = self._create_sequences_layout()
         setting_layout = self._create_settings_layout()
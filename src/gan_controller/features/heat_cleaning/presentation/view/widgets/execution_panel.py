@@ -41,5 +41,5 @@ class HCExecutionPanel(QGroupBox):
     def _connect_signal(self) -> None:
         """シグナル設定"""
         # クリック時のシグナル接続
-        self.start_button.clicked.connect(self.start_requested.emit)
-        self.stop_button.clicked.connect(self.stop_requested.emit)
+        self.start_button.clicked.connect(self.start_requested)
+        self.stop_button.clicked.connect(self.stop_requested)
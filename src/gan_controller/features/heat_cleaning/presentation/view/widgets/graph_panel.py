@@ -1,15 +1,12 @@
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
 from gan_controller.features.heat_cleaning.domain.models import HCExperimentResult
-from gan_controller.presentation.components.widgets import DualAxisGraph, GraphData
+from gan_controller.presentation.components.widgets import DualAxisGraph
 
 
 class HCGraphPanel(QWidget):
     """実行制御およびモニタリング表示用ウィジェット"""
 
-    _history_power: GraphData
-    _history_pressure: GraphData
-
     graph_power: DualAxisGraph
     graph_pressure: DualAxisGraph
 
@@ -19,10 +16,6 @@ class HCGraphPanel(QWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        # 履歴データ (全データ) をここに保持
-        self._history_power = GraphData()
-        self._history_pressure = GraphData()
-
         layout = QVBoxLayout(self)
 
         self.graph_power = DualAxisGraph()
@@ -31,6 +24,7 @@ class HCGraphPanel(QWidget):
         self.graph_power.set_axis_labels(
             x_label="Time (h)", left_label="Temperature (°C)", right_label="Power (W)"
         )
+        self.graph_power.set_max_draw_points(self.MAX_PLOT_POINTS)
 
         self.graph_pressure = DualAxisGraph()
         self.graph_pressure.setMinimumSize(500, 300)
@@ -39,6 +33,7 @@ class HCGraphPanel(QWidget):
             x_label="Time (h)", left_label="Temperature (°C)", right_label="Pressure (Pa)"
         )
         self.graph_pressure.set_axis_scale("right", "log")
+        self.graph_pressure.set_max_draw_points(self.MAX_PLOT_POINTS)
 
         layout.addWidget(self.graph_power)
         layout.addSpacing(10)
@@ -64,39 +59,29 @@ class HCGraphPanel(QWidget):
 
     def clear_graph(self) -> None:
         """グラフデータをクリアして再初期化"""
-        self._history_power = GraphData()
-        self._history_pressure = GraphData()
-
         self.graph_power.clear_view()
         self.graph_pressure.clear_view()
 
         self._init_lines()  # ライン再設定
 
     def append_data(self, result: HCExperimentResult) -> None:
-        t = result.timestamp_total
-
-        # データ追加
-        self._history_power.append_point(
-            x_value=t.value_as("hour"),
-            y_values={
-                "temp": result.temperature_case.base_value,
+        """1点追加 (グラフ側の保持データに追記し、間引きと差分描画はグラフに任せる)"""
+        t_hour = result.timestamp_total.value_as("hour")
+        temp = result.temperature_case.base_value
+
+        self.graph_power.append_point(
+            t_hour,
+            {
+                "temp": temp,
                 "heater_power": result.electricity_hc.power.base_value,
                 "amd_power": result.electricity_amd.power.base_value,
             },
         )
-        self._history_pressure.append_point(
-            x_value=t.value_as("hour"),
-            y_values={
-                "temp": result.temperature_case.base_value,
+        self.graph_pressure.append_point(
+            t_hour,
+            {
+                "temp": temp,
                 "ext_pres": result.pressure_ext.base_value,
                 "sip_pres": result.pressure_sip.base_value,
             },
         )
-
-        # データが多い場合の間引き処理
-        disp_power = self._history_power.get_downsampled_data(self.MAX_PLOT_POINTS)
-        disp_pressure = self._history_pressure.get_downsampled_data(self.MAX_PLOT_POINTS)
-
-        # グラフ更新
-        self.graph_power.update_plot(disp_power)
-        self.graph_pressure.update_plot(disp_pressure)
@@ -18,7 +18,6 @@ class HCProtocolSelectorPanel(QWidget):
             super().__init__()
 
         main_layout = QHBoxLayout(self)
-        self.setLayout(main_layout)
 
         self.protocol_combo = QComboBox()
         self.save_button = QPushButton("保存")
@@ -31,8 +30,8 @@ class HCProtocolSelectorPanel(QWidget):
         self._connect_signals()
 
     def _connect_signals(self) -> None:
-        self.protocol_combo.currentTextChanged.connect(self.protocol_changed.emit)
-        self.save_button.clicked.connect(self.protocol_saved.emit)
+        self.protocol_combo.currentTextChanged.connect(self.protocol_changed)
+        self.save_button.clicked.connect(self.protocol_saved)
 
     def set_protocol_items(self, texts: list[str]) -> None:
         """プルダウンの項目をリセットして設定する"""
@@ -187,16 +187,16 @@ class ManualOperationMainView(QWidget):
         return group
 
     def _connect_signals(self) -> None:
-        self.gm10_connect_button.clicked.connect(self.gm10_connect_requested.emit)
-        self.gm10_disconnect_button.clicked.connect(self.gm10_disconnect_requested.emit)
-        self.pwux_connect_button.clicked.connect(self.pwux_connect_requested.emit)
-        self.pwux_disconnect_button.clicked.connect(self.pwux_disconnect_requested.emit)
-        self.laser_connect_button.clicked.connect(self.laser_connect_requested.emit)
-        self.laser_disconnect_button.clicked.connect(self.laser_disconnect_requested.emit)
-        self.pwux_read_button.clicked.connect(self.pwux_read_requested.emit)
-        self.pwux_pointer_checkbox.toggled.connect(self.pwux_pointer_toggled.emit)
-        self.laser_set_button.clicked.connect(self.laser_set_requested.emit)
-        self.laser_emission_checkbox.toggled.connect(self.laser_emission_toggled.emit)
+        self.gm10_connect_button.clicked.connect(self.gm10_connect_requested)
+        self.gm10_disconnect_button.clicked.connect(self.gm10_disconnect_requested)
+        self.pwux_connect_button.clicked.connect(self.pwux_connect_requested)
+        self.pwux_disconnect_button.clicked.connect(self.pwux_disconnect_requested)
+        self.laser_connect_button.clicked.connect(self.laser_connect_requested)
+        self.laser_disconnect_button.clicked.connect(self.laser_disconnect_requested)
+        self.pwux_read_button.clicked.connect(self.pwux_read_requested)
+        self.pwux_pointer_checkbox.toggled.connect(self.pwux_pointer_toggled)
+        self.laser_set_button.clicked.connect(self.laser_set_requested)
+        self.laser_emission_checkbox.toggled.connect(self.laser_emission_toggled)
 
     # =============================================================================
 
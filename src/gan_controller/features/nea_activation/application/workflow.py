@@ -1,19 +1,25 @@
 import datetime
-import queue
+import logging
+import threading
 import time
+from collections import deque
+from typing import NamedTuple
 
 import pyvisa
 import pyvisa.constants
 
 from gan_controller.core.constants import JST
-from gan_controller.core.domain.quantity import Ampere, Current, Quantity, Volt
+from gan_controller.core.domain.quantity import Ampere, Current, Ohm, Quantity, Volt
 from gan_controller.features.nea_activation.domain.config import (
     NEAConditionConfig,
     NEAConfig,
     NEAControlConfig,
 )
 from gan_controller.features.nea_activation.domain.interface import INEAHardwareFacade
-from gan_controller.features.nea_activation.domain.models import NEAExperimentResult
+from gan_controller.features.nea_activation.domain.models import (
+    NEAExperimentResult,
+    NEASensorReadings,
+)
 from gan_controller.features.nea_activation.infrastructure.hardware.backend import (
     NEAHardwareBackend,
 )
@@ -25,31 +31,67 @@ from gan_controller.presentation.async_runners.interfaces import (
     IExperimentWorkflow,
 )
 
-WAIT_CHECK_INTERVAL_SEC = 0.1
+logger = logging.getLogger(__name__)
+
+
+class _ConditionCache(NamedTuple):
+    """測定ループで毎回参照する測定条件 (実験中は変わらないため事前に展開しておく)"""
+
+    stabilization_sec: float
+    integration_count: int
+    integration_interval_sec: float
+    shunt_resistance: Quantity[Ohm]
+    is_fixed_background: bool
+    fixed_background_volt: Quantity[Volt]
+    fixed_background_pc: Quantity[Ampere]
+
+    @classmethod
+    def from_config(cls, condition: NEAConditionConfig) -> "_ConditionCache":
+        shunt_resistance = condition.shunt_resistance
+        fixed_background_volt = condition.fixed_background_volt
+        return cls(
+            stabilization_sec=condition.stabilization_time.base_value,
+            integration_count=int(condition.integration_count.base_value),
+            integration_interval_sec=condition.integration_interval.base_value,
+            shunt_resistance=shunt_resistance,
+            is_fixed_background=condition.is_fixed_background,
+            fixed_background_volt=fixed_background_volt,
+            fixed_background_pc=Current(
+                fixed_background_volt.base_value / shunt_resistance.base_value
+            ),
+        )
 
 
 class NEAActivationWorkflow(IExperimentWorkflow):
+    TIMEOUT_WARNING_INTERVAL_NS = 1_000_000_000  # タイムアウト警告の最短間隔 (1秒)
+
     _backend: NEAHardwareBackend
     _recorder: NEALogRecorder
     _config: NEAConfig
 
-    _request_queue: queue.Queue  # スレッド通信用キュー
+    _request_queue: deque[NEAControlConfig]  # スレッド通信用 (最新の1件のみ保持)
+    _cond: _ConditionCache  # 実験中は変わらない条件設定 (開始時に1回だけ変換)
 
     def __init__(
         self,
         backend: NEAHardwareBackend,
         recorder: NEALogRecorder,
         config: NEAConfig,
-        request_queue: queue.Queue,  # パラメータ更新用
+        request_queue: deque[NEAControlConfig],  # パラメータ更新用
     ) -> None:
         self._backend = backend
         self._recorder = recorder
         self._config = config
 
         self._request_queue = request_queue
+        self._cond = _ConditionCache.from_config(config.condition)
 
         self._observer: IExperimentObserver | None = None
 
+        # タイムアウト警告の間引き用
+        self._last_timeout_warning_ns: int | None = None
+        self._suppressed_timeouts = 0
+
     def execute(self, observer: IExperimentObserver) -> None:
         """メインループ"""
         self._observer = observer
@@ -57,7 +99,7 @@ class NEAActivationWorkflow(IExperimentWorkflow):
         try:
             start_time = datetime.datetime.now(JST)
             self._recorder.record_header(start_time)
-            print(f"\033[32m{start_time:%Y/%m/%d %H:%M:%S} Experiment start\033[0m")
+            logger.info("%s Experiment start", f"{start_time:%Y/%m/%d %H:%M:%S}")
 
             # backendのコンテキスト管理
             with self._backend, self._backend.get_facade() as facade:
@@ -66,18 +108,20 @@ class NEAActivationWorkflow(IExperimentWorkflow):
                 self._measurement_loop(facade)
 
         finally:
+            self._recorder.close()  # 書き込み待ちのログを全て書き出す
+
             finish_time = datetime.datetime.now(JST)
-            print(f"\033[31m{finish_time:%Y/%m/%d %H:%M:%S} Finish\033[0m")
+            logger.info("%s Finish", f"{finish_time:%Y/%m/%d %H:%M:%S}")
 
             self._observer.on_finished()
 
     def _measurement_loop(self, facade: INEAHardwareFacade) -> None:
         """計測ループ"""
-        start_perf = time.perf_counter()  # 開始時間 (高分解能)
+        start_ns = time.perf_counter_ns()  # 開始時間 (高分解能、整数ns)
 
         # メインループ
         while not self._should_stop():
-            if not self._execute_single_measurement_with_error_handling(facade, start_perf):
+            if not self._execute_single_measurement_with_error_handling(facade, start_ns):
                 break
 
     # =================================================================
@@ -106,7 +150,7 @@ class NEAActivationWorkflow(IExperimentWorkflow):
     # 内部ロジック
     # =================================================================
 
-    def _execute_single_measurement(self, facade: INEAHardwareFacade, start_perf: float) -> bool:
+    def _execute_single_measurement(self, facade: INEAHardwareFacade, start_ns: int) -> bool:
         """
         1回分の測定サイクルを実行
 
@@ -114,34 +158,31 @@ class NEAActivationWorkflow(IExperimentWorkflow):
             bool: 測定が完了したらTrue, 中断されたらFalse
 
         """
-        elapsed_perf = time.perf_counter() - start_perf
+        # 差分は整数nsで取り、秒への変換は最後に1回だけ (長時間でも精度が落ちない)
+        elapsed_perf = (time.perf_counter_ns() - start_ns) * 1e-9
         self._process_pending_requests(facade, elapsed_perf)  # 設定に変更があるか確認
 
-        print("\033[32m" + f"{elapsed_perf:.1f}[s]\t" + "\033[0m")
+        logger.info("%.1f[s]", elapsed_perf)
 
-        condition = self._config.condition
-        stabilization_duration_sec = condition.stabilization_time.base_value
-        shunt_resistance = condition.shunt_resistance
-        integration_count = int(condition.integration_count.base_value)
-        integration_interval_sec = condition.integration_interval.base_value
+        cond = self._cond
 
         # 出力状態測定 (Bright)
-        if not condition.is_fixed_background:
+        if not cond.is_fixed_background:
             facade.set_laser_emission(True)  # レーザー出力開始
         # 安定するまで待機
-        if not self._wait_interruptable(stabilization_duration_sec):
+        if not self._wait_interruptable(cond.stabilization_sec):
             return False  # 待機中に中断されたら終了
         bright_pc_volt, bright_pc = facade.read_photocurrent(
-            shunt_resistance,
-            integration_count,
-            integration_interval_sec,
+            cond.shunt_resistance,
+            cond.integration_count,
+            cond.integration_interval_sec,
         )
 
         # バックグラウンド測定 (Dark)
-        dark_result = self._resolve_dark_photocurrent(facade, condition)
+        dark_result = self._resolve_dark_photocurrent(facade, cond)
         if dark_result is None:
             return False
-        dark_pc_volt, dark_pc = dark_result
+        dark_pc_volt, dark_pc, sensors = dark_result
 
         result = facade.read_metrics(
             control_config=self._config.control,
@@ -151,11 +192,15 @@ class NEAActivationWorkflow(IExperimentWorkflow):
             bright_pc_voltage=bright_pc_volt,
             dark_pc=dark_pc,
             dark_pc_voltage=dark_pc_volt,
+            sensors=sensors,
         )
 
-        qe = result.quantum_efficiency
-        pc = result.photocurrent
-        print(f"{qe:.3e}, {pc:.3e}, {result.ext_pressure:.2e} (EXT)")
+        logger.info(
+            "%s, %s, %s (EXT)",
+            format(result.quantum_efficiency, ".3e"),
+            format(result.photocurrent, ".3e"),
+            format(result.ext_pressure, ".2e"),
+        )
 
         self._recorder.record_data(result, "")
         self._notify_result(result)
@@ -165,10 +210,10 @@ class NEAActivationWorkflow(IExperimentWorkflow):
     def _execute_single_measurement_with_error_handling(
         self,
         facade: INEAHardwareFacade,
-        start_perf: float,
+        start_ns: int,
     ) -> bool:
         try:
-            return self._execute_single_measurement(facade, start_perf)
+            return self._execute_single_measurement(facade, start_ns)
         except pyvisa.errors.VisaIOError as e:
             # タイムアウトは一時的な通信揺らぎとして扱い、実験全体は継続する。
             self._handle_visa_error(e)
@@ -177,30 +222,31 @@ class NEAActivationWorkflow(IExperimentWorkflow):
     def _resolve_dark_photocurrent(
         self,
         facade: INEAHardwareFacade,
-        condition: NEAConditionConfig,
-    ) -> tuple[Quantity[Volt], Quantity[Ampere]] | None:
-        """Dark測定値を返す。固定バックグラウンド時は設定値を利用する。"""
-        stabilization_duration_sec = condition.stabilization_time.base_value
-        shunt_resistance = condition.shunt_resistance
-        integration_count = int(condition.integration_count.base_value)
-        integration_interval_sec = condition.integration_interval.base_value
-
-        if condition.is_fixed_background:
-            if not self._wait_interruptable(stabilization_duration_sec):
-                return None
-            dark_pc_volt = condition.fixed_background_volt
-            dark_pc = Current(dark_pc_volt.base_value / shunt_resistance.base_value)
-            return dark_pc_volt, dark_pc
-
-        facade.set_laser_emission(False)
-        if not self._wait_interruptable(stabilization_duration_sec):
+        cond: _ConditionCache,
+    ) -> tuple[Quantity[Volt], Quantity[Ampere], NEASensorReadings] | None:
+        """
+        Dark測定値を返す。固定バックグラウンド時は設定値を利用する。
+
+        安定化待ちの間は各機器が空いているため、PC以外のセンサー値をここで先読みしておく。
+        """
+        if not cond.is_fixed_background:
+            facade.set_laser_emission(False)
+
+        completed, sensors = self._wait_interruptable_while_reading_sensors(
+            facade, cond.stabilization_sec
+        )
+        if not completed:
             return None
 
-        return facade.read_photocurrent(
-            shunt_resistance,
-            integration_count,
-            integration_interval_sec,
+        if cond.is_fixed_background:
+            return cond.fixed_background_volt, cond.fixed_background_pc, sensors
+
+        dark_pc_volt, dark_pc = facade.read_photocurrent(
+            cond.shunt_resistance,
+            cond.integration_count,
+            cond.integration_interval_sec,
         )
+        return dark_pc_volt, dark_pc, sensors
 
     def _process_pending_requests(self, facade: INEAHardwareFacade, elapsed_perf: float) -> None:
         latest_control_config = self._get_latest_config_from_queue()
@@ -212,7 +258,7 @@ class NEAActivationWorkflow(IExperimentWorkflow):
                 f"[{elapsed_perf:.1f}s] Parameters Updated: AMD = {amd_current},"
                 f"Laser = {laser_power}"
             )
-            print(msg)
+            logger.info(msg)
 
             facade.apply_control_params(latest_control_config)
             self._config.control = latest_control_config
@@ -223,7 +269,7 @@ class NEAActivationWorkflow(IExperimentWorkflow):
 
     def _wait_interruptable(self, duration_sec: float) -> bool:
         """
-        指定時間待機する。中断フラグが立ったら即座に終了する。
+        指定時間待機する。中断要求が来たら即座に終了する。
 
         Args:
             duration_sec (float): 待機する秒数
@@ -232,28 +278,68 @@ class NEAActivationWorkflow(IExperimentWorkflow):
             bool: 待機が完了した場合はTrue、中断された場合はFalse
 
         """
-        start_perf = time.perf_counter()
+        # Observerがなければ強制停止
+        if self._observer is None:
+            return False
+
+        if duration_sec <= 0:
+            return not self._should_stop()
+
+        # 中断要求 (Event) を待つ。ポーリングしないので中断は待たずに反映される
+        return not self._observer.wait_for_interruption(duration_sec)
+
+    def _wait_interruptable_while_reading_sensors(
+        self, facade: INEAHardwareFacade, duration_sec: float
+    ) -> tuple[bool, NEASensorReadings]:
+        """
+        待機と並行して別スレッドでセンサー値を読み取る。
+
+        読み取りは待機後に必ず完了を待つため、呼び出し元で機器へ同時アクセスすることはない。
+
+        Returns:
+            tuple: (待機が完了したか, 読み取ったセンサー値)
+
+        """
+        readings: list[NEASensorReadings] = []
+        errors: list[Exception] = []
 
-        while True:
-            # 経過時間をチェック
-            elapsed = time.perf_counter() - start_perf
-            remaining = duration_sec - elapsed
+        def _read() -> None:
+            try:
+                readings.append(facade.read_sensors())
+            except Exception as e:  # noqa: BLE001 (待機後に呼び出し元スレッドで再送出する)
+                errors.append(e)
 
-            if remaining <= 0:
-                return True  # 待機完了
+        reader = threading.Thread(target=_read, name="NEASensorReader", daemon=True)
+        reader.start()
+        completed = self._wait_interruptable(duration_sec)
+        reader.join()
 
-            # 中断フラグチェック
-            if self._should_stop():
-                return False  # 中断された
+        if errors:
+            raise errors[0]
+        if not readings:
+            msg = "センサー値の読み取り結果がありません"
+            raise RuntimeError(msg)
 
-            # 次のチェックまでのスリープ (残り時間とインターバルの短い方)
-            time.sleep(min(WAIT_CHECK_INTERVAL_SEC, remaining))
+        return completed, readings[0]
 
     def _handle_visa_error(self, e: pyvisa.errors.VisaIOError) -> None:
         """VISAエラーのハンドリング"""
         if e.error_code == pyvisa.constants.VI_ERROR_TMO:
-            print(f"\033[33m[WARNING] Device Timeout occurred. Retrying... ({e})\033[0m")
             # タイムアウト時は続行 (呼び出し元のループが継続する)
+            # 連続する場合に備えて、警告は一定間隔ごとにまとめて出す
+            now = time.perf_counter_ns()
+            last = self._last_timeout_warning_ns
+            if last is not None and now - last < self.TIMEOUT_WARNING_INTERVAL_NS:
+                self._suppressed_timeouts += 1
+                return
+
+            logger.warning(
+                "Device Timeout occurred. Retrying... (%s, %d suppressed)",
+                e,
+                self._suppressed_timeouts,
+            )
+            self._last_timeout_warning_ns = now
+            self._suppressed_timeouts = 0
         else:
             # それ以外は再送出
             raise e
@@ -262,15 +348,10 @@ class NEAActivationWorkflow(IExperimentWorkflow):
 
     def _get_latest_config_from_queue(self) -> NEAControlConfig | None:
         """キューから最新の設定を取り出す"""
-        if self._request_queue.empty():
-            return None
-
-        latest_params = None
         # UIで連続変更された場合は古い設定を捨て、最後の値だけを反映する。
-        while not self._request_queue.empty():
-            try:
-                latest_params = self._request_queue.get_nowait()
-            except queue.Empty:
-                break
-
-        return latest_params
+        # deque(maxlen=1) は追加時に古い値が押し出されるため、残っている1件を取り出すだけで良い。
+        # (append/pop は単一操作なのでロック不要)
+        try:
+            return self._request_queue.pop()
+        except IndexError:
+            return None
@@ -6,7 +6,10 @@ from gan_controller.features.nea_activation.domain.config import (
     NEAConditionConfig,
     NEAControlConfig,
 )
-from gan_controller.features.nea_activation.domain.models import NEAExperimentResult
+from gan_controller.features.nea_activation.domain.models import (
+    NEAExperimentResult,
+    NEASensorReadings,
+)
 
 
 class INEAHardwareFacade(IExperimentHardwareFacade):
@@ -30,6 +33,10 @@ class INEAHardwareFacade(IExperimentHardwareFacade):
     ) -> tuple[Quantity[Volt], Quantity[Ampere]]:
         """指定された条件で光電流を積分測定し、電圧値と電流値を返す"""
 
+    @abstractmethod
+    def read_sensors(self) -> NEASensorReadings:
+        """PC以外のセンサー値 (圧力、HV、AMD電源) を読み取る"""
+
     @abstractmethod
     def read_metrics(
         self,
@@ -40,5 +47,10 @@ class INEAHardwareFacade(IExperimentHardwareFacade):
         bright_pc_voltage: Quantity[Volt],
         dark_pc: Quantity[Ampere],
         dark_pc_voltage: Quantity[Volt],
+        sensors: NEASensorReadings | None = None,
     ) -> NEAExperimentResult:
-        """現在のセンサー値や電源状態を読み取り、測定済みのPC値と合わせてResultオブジェクトを生成する"""
+        """
+        現在のセンサー値や電源状態を読み取り、測定済みのPC値と合わせてResultオブジェクトを生成する
+
+        sensors が渡された場合は読み取りを省略してその値を使う
+        """
@@ -43,7 +43,17 @@ class NEAActivationState(Enum):
 # =============================================================================
 # Result Data
 # =============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
+class NEASensorReadings:
+    """PC以外のセンサー値のスナップショット (Dark待機中に先読みする)"""
+
+    ext_pressure: Quantity[Pascal]
+    sip_pressure: Quantity[Pascal]
+    extraction_voltage: Quantity[Volt]
+    amd_electricity: ElectricMeasurement
+
+
+@dataclass(slots=True)
 class NEAExperimentResult(ExperimentResult):
     """NEA活性化の測定結果 (必要そうな設定値や観測値は全て入れとく)"""
 
@@ -1,5 +1,4 @@
 from gan_controller.core.domain.app_config import DevicesConfig
-from gan_controller.core.domain.electricity import ElectricMeasurement
 from gan_controller.core.domain.quantity import (
     Ampere,
     Current,
@@ -21,7 +20,11 @@ from gan_controller.features.nea_activation.domain.config import (
     NEAControlConfig,
 )
 from gan_controller.features.nea_activation.domain.interface import INEAHardwareFacade
-from gan_controller.features.nea_activation.domain.models import NEADevices, NEAExperimentResult
+from gan_controller.features.nea_activation.domain.models import (
+    NEADevices,
+    NEAExperimentResult,
+    NEASensorReadings,
+)
 
 
 class NEAHardwareFacade(INEAHardwareFacade):
@@ -34,6 +37,11 @@ class NEAHardwareFacade(INEAHardwareFacade):
         self._config = config
         self._connect_laser = connect_laser
 
+        # 直前に機器へ書き込んだ値 (基本単位。未書き込み・不明なら None)
+        self._written_laser_power: float | None = None
+        self._written_amd_current: float | None = None
+        self._written_amd_enable: bool | None = None
+
     def setup_devices(self) -> None:
         """初期設定"""
         # レーザーの静的設定
@@ -48,18 +56,31 @@ class NEAHardwareFacade(INEAHardwareFacade):
         self._dev.aps.set_ocp(aps_config.ocp)
 
     def apply_control_params(self, params: NEAControlConfig) -> None:
-        """パラメータの適用"""
+        """
+        パラメータの適用 (前回から変わった項目のみ書き込む)
+
+        比較は実際に書き込んだ値と基本単位で厳密に行う。
+        出力OFF中の電流値は書き込まないため、出力ONへ切り替える時は必ず電流値を書き込む。
+        """
         # レーザー制御
-        if self._connect_laser:
+        laser_power = params.laser_power_sv.base_value
+        if self._connect_laser and laser_power != self._written_laser_power:
             self._dev.laser.set_channel_power(self._config.ibeam.beam_ch, params.laser_power_sv)
+            self._written_laser_power = laser_power
 
         # AMD電源の制御
         if params.amd_enable:
-            self._dev.aps.set_current(params.amd_output_current)
-            self._dev.aps.set_output(True)
-        else:
+            amd_current = params.amd_output_current.base_value
+            if not self._written_amd_enable or amd_current != self._written_amd_current:
+                self._dev.aps.set_current(params.amd_output_current)
+                self._written_amd_current = amd_current
+            if not self._written_amd_enable:
+                self._dev.aps.set_output(True)
+        elif self._written_amd_enable is not False:
             self._dev.aps.set_output(False)
 
+        self._written_amd_enable = params.amd_enable
+
     def set_laser_emission(self, enable: bool) -> None:
         if not self._connect_laser:
             return
@@ -76,6 +97,24 @@ class NEAHardwareFacade(INEAHardwareFacade):
         current_val = current_volt.base_value / shunt_r.base_value
         return current_volt, Current(current_val)
 
+    def read_sensors(self) -> NEASensorReadings:
+        """PC以外のセンサー値を読み取る"""
+        # 圧力とHVは1回のクエリでまとめて取得 (HVは後で補正)
+        gm10 = self._config.gm10
+        ext_val, sip_val, hv_raw = self._dev.logger.read_voltages(
+            (gm10.ext_ch, gm10.sip_ch, gm10.hv_ch)
+        )
+
+        # AMD電源の読み取り (V/I/P を1回のクエリで取得)
+        electricity = self._dev.aps.measure_all()
+
+        return NEASensorReadings(
+            ext_pressure=Pressure(calc_ext_pressure_from_voltage(ext_val.base_value)),
+            sip_pressure=Pressure(calc_sip_pressure_from_voltage(sip_val.base_value)),
+            extraction_voltage=Voltage(hv_raw.base_value * self.HV_READING_CORRECTION_FACTOR),
+            amd_electricity=electricity,
+        )
+
     def read_metrics(
         self,
         control_config: NEAControlConfig,
@@ -85,6 +124,7 @@ class NEAHardwareFacade(INEAHardwareFacade):
         bright_pc_voltage: Quantity[Volt],
         dark_pc: Quantity[Ampere],
         dark_pc_voltage: Quantity[Volt],
+        sensors: NEASensorReadings | None = None,
     ) -> NEAExperimentResult:
         """各種センサー読み取りとResult生成"""
         # --- 計算 ---
@@ -98,31 +138,17 @@ class NEAHardwareFacade(INEAHardwareFacade):
             current_amp=pc_val, laser_power_watt=laser_pv_watt, wavelength_nm=wavelength_nm
         )
 
-        # --- センサー読み取り ---
-        ext_val = self._dev.logger.read_voltage(self._config.gm10.ext_ch)
-        ext_pressure = Pressure(calc_ext_pressure_from_voltage(ext_val.base_value))
-
-        sip_val = self._dev.logger.read_voltage(self._config.gm10.sip_ch)
-        sip_pressure = Pressure(calc_sip_pressure_from_voltage(sip_val.base_value))
-
-        # HV読み取り (補正含む)
-        hv_raw = self._dev.logger.read_voltage(self._config.gm10.hv_ch)
-        extraction_voltage = Voltage(hv_raw.base_value * self.HV_READING_CORRECTION_FACTOR)
-
-        # AMD電源の読み取り
-        electricity = ElectricMeasurement(
-            voltage=self._dev.aps.measure_voltage(),
-            current=self._dev.aps.measure_current(),
-            power=self._dev.aps.measure_power(),
-        )
+        # --- センサー読み取り (先読み済みならそれを使う) ---
+        if sensors is None:
+            sensors = self.read_sensors()
 
         return NEAExperimentResult(
             timestamp=Time(timestamp),
             laser_power_sv=control_config.laser_power_sv,
             laser_power_pv=control_config.laser_power_pv,
-            ext_pressure=ext_pressure,
-            sip_pressure=sip_pressure,
-            extraction_voltage=extraction_voltage,
+            ext_pressure=sensors.ext_pressure,
+            sip_pressure=sensors.sip_pressure,
+            extraction_voltage=sensors.extraction_voltage,
             photocurrent=Current(pc_val),
             photocurrent_voltage=Voltage(pc_v_val),
             bright_pc=bright_pc,
@@ -130,12 +156,16 @@ class NEAHardwareFacade(INEAHardwareFacade):
             dark_pc=dark_pc,
             dark_pc_voltage=dark_pc_voltage,
             quantum_efficiency=Value(qe_val, "%"),
-            amd_electricity=electricity,
+            amd_electricity=sensors.amd_electricity,
         )
 
     def emergency_stop(self) -> None:
         """安全終了処理"""
         print("NEAFacade: Executing Emergency Stop")
+        # 機器の状態が変わるため、次回は全項目を書き込む
+        self._written_laser_power = None
+        self._written_amd_current = None
+        self._written_amd_enable = None
         if self._connect_laser:
             try:
                 self._dev.laser.set_emission(False)
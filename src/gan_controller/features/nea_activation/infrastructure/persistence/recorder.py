@@ -1,5 +1,7 @@
 import datetime
-from collections.abc import Callable
+import queue
+import threading
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,12 +22,21 @@ class LogColumn:
 
 
 class NEALogRecorder:
-    """NEA実験データの記録を担当するクラス (Recorder)"""
+    """
+    NEA実験データの記録を担当するクラス (Recorder)
+
+    ファイルへの書き込みは専用スレッドで行い、測定スレッドはエンコードしてキューに積むだけにする。
+    (エンコードエラーは呼び出し側で発生させ、書き込みスレッドを黙って止めない)
+    """
 
     def __init__(self, log_file: LogFile, config: NEAConfig) -> None:
         self.file = log_file
         self.config = config
 
+        # 書き込み待ちのエンコード済みデータ (None は終了合図)
+        self._write_queue: queue.SimpleQueue[bytes | None] = queue.SimpleQueue()
+        self._writer_thread: threading.Thread | None = None
+
         # ログデータ項目定義
         self.columns: list[LogColumn] = [
             LogColumn("Time[s]", "{:.1f}", lambda r, _: r.timestamp.base_value),
@@ -55,6 +66,82 @@ class NEALogRecorder:
             LogColumn("Event", "{}", lambda _, e: e),
         ]
 
+        # 1行分の書式と値取り出し関数をまとめておく (行ごとの format 呼び出しを1回にする)
+        self._row_template = "\t".join(c.fmt for c in self.columns) + "\n"
+        self._extractors = tuple(c.extractor for c in self.columns)
+
+    def close(self) -> None:
+        """書き込み待ちの内容を全て書き出してから書き込みスレッドを終了する"""
+        if self._writer_thread is None:
+            return
+
+        self._write_queue.put(None)
+        self._writer_thread.join()
+        self._writer_thread = None
+
+    def _write(self, content: str) -> None:
+        """書き込みスレッドに書き込みを依頼する (初回に書き込みスレッドを起動)"""
+        # エンコードは呼び出し側のスレッドで行う (失敗時は UnicodeEncodeError を送出)
+        data = content.encode(self.file.encoding)
+
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._drain, name="NEALogWriter", daemon=True
+            )
+            self._writer_thread.start()
+
+        self._write_queue.put(data)
+
+    def _drain(self) -> None:
+        """キューの内容をファイルに書き込む (書き込みスレッド)"""
+        # 終了合図を受け取ったかどうかをフォールバック後も引き継ぐため、同じイテレータを使い続ける
+        chunks = self._iter_chunks()
+        try:
+            # 実験中はファイルを開いたままにし、溜まった分ごとに1回で書き込む
+            with self.file.open_append() as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    f.flush()
+
+        except OSError as e:
+            print(f"Error writing to log file {self.file.path}: {e}")
+            # 開いたままの書き込みに失敗した場合は、1回ごとに開く書き込みで続行する
+            for chunk in chunks:
+                self._append_once(chunk)
+
+    def _append_once(self, chunk: bytes) -> None:
+        """ファイルを開いて1回だけ追記する (書き込みスレッド)"""
+        try:
+            with self.file.open_append() as f:
+                f.write(chunk)
+
+        except OSError as e:
+            print(f"Error writing to log file {self.file.path}: {e}")
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        """キューに溜まっているデータをまとめて返す (終了合図で終わる)"""
+        q = self._write_queue
+        while True:
+            content = q.get()
+            if content is None:
+                return
+
+            chunks = [content]
+            finished = False
+            while True:
+                try:
+                    content = q.get_nowait()
+                except queue.Empty:
+                    break
+                if content is None:
+                    finished = True
+                    break
+                chunks.append(content)
+
+            yield b"".join(chunks)
+            if finished:
+                return
+
     def record_header(self, start_time: datetime.datetime) -> None:
         """ヘッダー情報を記録"""
         lf = self.file
@@ -69,46 +156,39 @@ class NEALogRecorder:
         comment = self.config.log.comment
 
         # === Header Writing (Identical to reference) ===
-        lf.write("#NEA activation monitor\n")
-        lf.write("\n")
-        lf.write(f"#Protocol:\t{lf.protocol}\n")
-        lf.write("\n")
-
-        lf.write("#Measurement\n")
-        lf.write(f"#Number:\t{lf.number}\n")
-        lf.write(f"#Date:\t{start_time.strftime('%Y/%m/%d')}\n")
-        lf.write(f"#Time:\t{start_time.strftime('%H:%M:%S')}\n")
-        lf.write(f"#Encode:\t{lf.encoding}\n")
-        lf.write("\n")
-
-        lf.write("#Condition\n")
-        lf.write(f"#Wavelength:\t{wavelength:d}[nm]\n")
-        lf.write(f"#InitLaserPower(SV):\t{laser_power_sv:d}[mW]\n")
-
-        lf.write(f"#StabilizationTime:\t{stabilization_time:.1f}[s]\n")
-        lf.write(f"#IntegratedTimes:\t{integrated_count:d}[-]\n")
-        lf.write(f"#IntervalTime:\t{interval:.1f}[s]\n")
-        lf.write("\n")
-
-        lf.write("#Comment\n")
-        lf.write(f"#{comment}\n")
-        lf.write("\n")
-
-        lf.write("#Data\n")
+        # 全行をまとめて1回で書き込む
         header_row = "\t".join([c.header for c in self.columns])
-        lf.write(header_row + "\n")
+        lines = [
+            "#NEA activation monitor\n",
+            "\n",
+            f"#Protocol:\t{lf.protocol}\n",
+            "\n",
+            "#Measurement\n",
+            f"#Number:\t{lf.number}\n",
+            f"#Date:\t{start_time.strftime('%Y/%m/%d')}\n",
+            f"#Time:\t{start_time.strftime('%H:%M:%S')}\n",
+            f"#Encode:\t{lf.encoding}\n",
+            "\n",
+            "#Condition\n",
+            f"#Wavelength:\t{wavelength:d}[nm]\n",
+            f"#InitLaserPower(SV):\t{laser_power_sv:d}[mW]\n",
+            f"#StabilizationTime:\t{stabilization_time:.1f}[s]\n",
+            f"#IntegratedTimes:\t{integrated_count:d}[-]\n",
+            f"#IntervalTime:\t{interval:.1f}[s]\n",
+            "\n",
+            "#Comment\n",
+            f"#{comment}\n",
+            "\n",
+            "#Data\n",
+            header_row + "\n",
+        ]
+        self._write("".join(lines))
 
     def record_data(self, result: NEAExperimentResult, event: str = "") -> None:
         """測定結果を1行記録"""
-        row_data = []
-
-        # 定義されたカラム順にデータを抽出・フォーマット
-        for col in self.columns:
-            # extractor関数を実行して値を取得
-            raw_val = col.extractor(result, event)
-            # 指定された書式で文字列化
-            formatted_val = col.fmt.format(raw_val)
-            row_data.append(formatted_val)
-
-        # タブ区切りで書き込み
-        self.file.write("\t".join(row_data) + "\n")
+        # 定義されたカラム順にデータを抽出し、タブ区切りの1行に整形
+        values = [extractor(result, event) for extractor in self._extractors]
+        row = self._row_template.format(*values)
+
+        # 実際の書き込みは書き込みスレッドで行う
+        self._write(row)
@@ -1,42 +1,122 @@
-import queue
+from __future__ import annotations
 
-from PySide6.QtCore import Slot
+import logging
+import time
+from collections import deque
+from typing import TYPE_CHECKING
 
-from gan_controller.core.constants import LOG_DIR, NEA_CONFIG_PATH
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
+
+from gan_controller.core.constants import APP_CONFIG_PATH, LOG_DIR, NEA_CONFIG_PATH
 from gan_controller.core.domain.app_config import AppConfig
-from gan_controller.features.nea_activation.application.workflow import NEAActivationWorkflow
-from gan_controller.features.nea_activation.domain.config import NEAConfig
+from gan_controller.features.nea_activation.domain.config import NEAConfig, NEAControlConfig
 from gan_controller.features.nea_activation.domain.models import (
     NEAActivationState,
     NEAExperimentResult,
 )
-from gan_controller.features.nea_activation.infrastructure.hardware.backend import (
-    RealNEAHardwareBackend,
-    SimulationNEAHardwareBackend,
-)
-from gan_controller.features.nea_activation.infrastructure.persistence.recorder import (
-    NEALogRecorder,
-)
-from gan_controller.features.nea_activation.presentation.view import NEAActivationMainView
 from gan_controller.infrastructure.persistence.log_manager import LogManager
 from gan_controller.presentation.async_runners.manager import AsyncExperimentManager
 from gan_controller.presentation.components.tab_controller import ITabController
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from gan_controller.features.nea_activation.infrastructure.persistence.recorder import (
+        NEALogRecorder,
+    )
+    from gan_controller.features.nea_activation.presentation.view import NEAActivationMainView
+
+logger = logging.getLogger(__name__)
+
+# ログ番号プレビューのキャッシュ有効時間 [s]
+LOG_PREVIEW_CACHE_TTL_SEC = 2.0
+# ログ設定変更からプレビュー更新までの待ち時間 [ms] (連続変更をまとめる)
+LOG_PREVIEW_DEBOUNCE_MS = 150
+# 測定結果をまとめてUIに反映する間隔 [ms] (グラフ再描画は約30fpsに抑えられる)
+RESULT_FLUSH_INTERVAL_MS = 33
+
+
+class _PreviewJobSignals(QObject):
+    """_PreviewJob の結果通知用 (QRunnable は QObject ではないため分離)"""
+
+    # (リクエストID, キャッシュキー, 次の番号)
+    ready = Signal(int, object, object)
+    # (リクエストID, エラーメッセージ)
+    failed = Signal(int, str)
+
+
+class _PreviewJob(QRunnable):
+    """次のログ番号をワーカースレッドで取得するジョブ (ディレクトリ走査をUIスレッドから外す)"""
+
+    def __init__(
+        self, request_id: int, manager: LogManager, update_date: bool, major_update: bool
+    ) -> None:
+        super().__init__()
+        self.signals = _PreviewJobSignals()
+
+        self._request_id = request_id
+        self._manager = manager
+        self._update_date = update_date
+        self._major_update = major_update
+
+    def run(self) -> None:
+        try:
+            date_dir = self._manager.get_active_directory(self._update_date)
+            next_numbers = date_dir.get_next_number(major_update=self._major_update)
+        except Exception as e:  # noqa: BLE001
+            self.signals.failed.emit(self._request_id, str(e))
+            return
+
+        key = (self._manager.encoding, self._update_date, self._major_update)
+        self.signals.ready.emit(self._request_id, key, next_numbers)
+
 
 class NEAActivationController(ITabController):
     _view: NEAActivationMainView
 
-    _state: NEAActivationState
+    _state: NEAActivationState | None
+    _last_lock_state: bool | None  # 最後に通知したタブロック状態
 
     _runner_manager: AsyncExperimentManager
+    _request_queue: deque[NEAControlConfig]  # 実験中の設定更新 (最新の1件のみ保持)
+    # key: (ログディレクトリ, エンコード)
+    _log_manager_cache: dict[tuple[Path, str], LogManager]
+    # 読み込み済みのAppConfigと、読み込み時のファイル状態 (mtime, size)
+    _cached_app_config: tuple[AppConfig, tuple[float, int] | None] | None
+    # key: (encode, update_date_folder, update_major_number), value: (取得時刻, 次の番号)
+    _next_number_cache: dict[tuple[str, bool, bool], tuple[float, tuple[int, int]]]
+    _preview_timer: QTimer
+    _preview_request_id: int  # 最後に発行したプレビュー取得ジョブのID
+    _pending_results: list[NEAExperimentResult]  # UI未反映の測定結果
+    _last_saved_config_json: str | None  # ファイルと同じ内容の設定 (JSON化したもの)
+    _result_flush_timer: QTimer
 
     def __init__(self, view: NEAActivationMainView) -> None:
         super().__init__()
 
         self._view = view
+        self._state = None
+        self._last_lock_state = None
+        self._log_manager_cache = {}
+        self._cached_app_config = None
+        self._next_number_cache = {}
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(LOG_PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._update_log_preview)
+        self._preview_request_id = 0
+
+        self._last_saved_config_json = None
+
+        self._pending_results = []
+        self._result_flush_timer = QTimer(self)
+        self._result_flush_timer.setSingleShot(True)
+        self._result_flush_timer.setInterval(RESULT_FLUSH_INTERVAL_MS)
+        self._result_flush_timer.timeout.connect(self._flush_results)
 
         self._runner_manager = AsyncExperimentManager()
-        self._request_queue = queue.Queue()
+        self._request_queue = deque(maxlen=1)
 
         self._connect_view_signals()
         self._connect_manager_signals()
@@ -45,44 +125,64 @@ class NEAActivationController(ITabController):
         self._load_initial_config()
 
     def _connect_view_signals(self) -> None:
-        """UI操作を受け取るシグナルの接続"""
-        self._view.execution_panel.start_requested.connect(self.experiment_start)
-        self._view.execution_panel.stop_requested.connect(self.experiment_stop)
-        self._view.execution_panel.apply_requested.connect(self.setting_apply)
-
-        # ログ設定変更時のプレビュー更新
-        self._view.log_setting_panel.config_changed.connect(self._update_log_preview)
-        self._view.log_setting_panel.preview_refresh_requested.connect(self._update_log_preview)
+        """UI操作を受け取るシグナルの接続 (同一スレッドなので直接呼び出し)"""
+        direct = Qt.ConnectionType.DirectConnection
+        execution_panel = self._view.execution_panel
+        execution_panel.start_requested.connect(self.experiment_start, direct)
+        execution_panel.stop_requested.connect(self.experiment_stop, direct)
+        execution_panel.apply_requested.connect(self.setting_apply, direct)
+
+        # ログ設定変更時のプレビュー更新 (連続した変更は1回にまとめる)
+        log_panel = self._view.log_setting_panel
+        log_panel.config_changed.connect(self._schedule_log_preview, direct)
+        log_panel.preview_refresh_requested.connect(self._refresh_log_preview, direct)
 
     def _connect_manager_signals(self) -> None:
-        """実験ロジックからの通知を受け取るシグナルの接続"""
-        self._runner_manager.step_result_observed.connect(self.on_result)
-        self._runner_manager.error_occurred.connect(self.on_error)
-        self._runner_manager.finished.connect(self.on_finished)
-        self._runner_manager.message_logged.connect(self.on_message)
+        """
+        実験ロジックからの通知を受け取るシグナルの接続
+
+        スレッド間の受け渡しは AsyncExperimentManager 内のキュー接続で済んでおり、
+        Manager のシグナルはメインスレッドで送出されるため直接呼び出しで受ける。
+        """
+        direct = Qt.ConnectionType.DirectConnection
+        self._runner_manager.step_result_observed.connect(self.on_result, direct)
+        self._runner_manager.error_occurred.connect(self.on_error, direct)
+        self._runner_manager.finished.connect(self.on_finished, direct)
+        self._runner_manager.message_logged.connect(self.on_message, direct)
 
     def _load_initial_config(self) -> None:
         """起動時に設定ファイルを読み込んでUIにセットする"""
         config = NEAConfig.load(NEA_CONFIG_PATH)
         self._view.set_full_config(config)
+        if NEA_CONFIG_PATH.exists():
+            self._last_saved_config_json = config.model_dump_json()
         self._update_log_preview()
 
     def set_state(self, state: NEAActivationState) -> None:
         """状態変更"""
-        self._state = state
-        self._view.set_running(self._state)
+        if state != self._state:
+            self._state = state
+            self._view.set_running(self._state)
 
-        # 待機中以外なら、タブをロック
+        # 待機中以外なら、タブをロック (ロック状態が変わったときだけ通知)
         should_lock = state != NEAActivationState.IDLE
-        self.tab_lock_requested.emit(should_lock)
+        if should_lock != self._last_lock_state:
+            self._last_lock_state = should_lock
+            self.tab_lock_requested.emit(should_lock)
 
     def on_close(self) -> None:
         """アプリ終了時に設定を保存する"""
         # 現在のUIの状態からConfigオブジェクトを生成
         current_config = self._view.get_full_config()
 
-        # ファイルに保存
-        current_config.save(NEA_CONFIG_PATH)
+        # 変更があればファイルに保存
+        config_json = current_config.model_dump_json()
+        if config_json != self._last_saved_config_json:
+            current_config.save(NEA_CONFIG_PATH)
+            self._last_saved_config_json = config_json
+
+        self._cached_app_config = None
+        self._log_manager_cache.clear()
 
     # =================================================
     # View -> Runner
@@ -95,10 +195,21 @@ class NEAActivationController(ITabController):
             return
 
         self.set_state(NEAActivationState.RUNNING)
+        self._pending_results.clear()
         self._view.clear_view()  # 前回のグラフ等をクリア
+        self._clear_log_number_cache()  # 新しいログファイルが作られるため
 
         try:
-            app_config = AppConfig.load()
+            # 装置ドライバ (pyvisa等) を含むため、実験開始時に読み込む
+            from gan_controller.features.nea_activation.application.workflow import (  # noqa: PLC0415
+                NEAActivationWorkflow,
+            )
+            from gan_controller.features.nea_activation.infrastructure.hardware.backend import (  # noqa: PLC0415
+                RealNEAHardwareBackend,
+                SimulationNEAHardwareBackend,
+            )
+
+            app_config = self._get_app_config()
             nea_config = self._view.get_full_config()
 
             is_sim = getattr(app_config.common, "is_simulation_mode", False)
@@ -136,8 +247,8 @@ class NEAActivationController(ITabController):
         if self._state != NEAActivationState.RUNNING or not self._runner_manager.is_running():
             return
 
-        config = self._view.execution_panel.get_config()
-        self._request_queue.put(config)
+        config = self._view.execution_panel.get_apply_config()
+        self._request_queue.append(config)
         self._view.execution_panel.mark_applied()
 
     # =================================================
@@ -146,8 +257,21 @@ class NEAActivationController(ITabController):
 
     @Slot(object)
     def on_result(self, result: NEAExperimentResult) -> None:
-        """結果表示とログ出力処理"""
-        self._view.update_view(result)
+        """結果表示とログ出力処理 (短時間に届いた結果はまとめて反映)"""
+        self._pending_results.append(result)
+        if not self._result_flush_timer.isActive():
+            self._result_flush_timer.start()
+
+    @Slot()
+    def _flush_results(self) -> None:
+        """溜まっている測定結果をUIに反映"""
+        self._result_flush_timer.stop()
+        if not self._pending_results:
+            return
+
+        results = self._pending_results
+        self._pending_results = []
+        self._view.update_view_batch(results)
 
     @Slot(str)
     def on_error(self, message: str) -> None:
@@ -158,6 +282,9 @@ class NEAActivationController(ITabController):
     @Slot()
     def on_finished(self) -> None:
         """実験終了処理"""
+        logger.debug("NEA experiment finished")
+        self._flush_results()  # 残りの結果を反映
+        self._clear_log_number_cache()
         self.set_state(NEAActivationState.IDLE)
 
     @Slot(str)
@@ -165,12 +292,47 @@ class NEAActivationController(ITabController):
         """実験ロジックからの通知を受け取ったときの処理"""
         self.status_message_requested.emit(message, 10000)
 
+    # =================================================
+    # Config Helpers
+    # =================================================
+
+    def _get_app_config(self) -> AppConfig:
+        """AppConfigを取得 (ファイルが更新されていなければキャッシュを返す)"""
+        try:
+            stat = APP_CONFIG_PATH.stat()
+            file_state = (stat.st_mtime, stat.st_size)
+        except OSError:
+            file_state = None  # ファイル未作成 (デフォルト設定)
+
+        if self._cached_app_config is not None:
+            cached_config, cached_state = self._cached_app_config
+            if cached_state == file_state:
+                return cached_config
+
+        app_config = AppConfig.load()
+        self._cached_app_config = (app_config, file_state)
+        return app_config
+
     # =================================================
     # Log Helpers
     # =================================================
 
+    def _get_log_manager(self, encode: str) -> LogManager:
+        """LogManagerを取得 (ログディレクトリ・エンコードごとに使い回す)"""
+        key = (LOG_DIR, encode)
+        manager = self._log_manager_cache.get(key)
+        if manager is None:
+            manager = LogManager(LOG_DIR, encode)
+            self._log_manager_cache[key] = manager
+
+        return manager
+
     def _create_recorder(self, app_config: AppConfig, nea_config: NEAConfig) -> NEALogRecorder:
-        manager = LogManager(LOG_DIR, app_config.common.encode)
+        from gan_controller.features.nea_activation.infrastructure.persistence.recorder import (  # noqa: PLC0415
+            NEALogRecorder,
+        )
+
+        manager = self._get_log_manager(app_config.common.encode)
 
         # ログファイル準備
         update_date = nea_config.log.update_date_folder
@@ -182,24 +344,91 @@ class NEAActivationController(ITabController):
             major_update=major_update,
         )
 
-        print(f"Log file created: {log_file.path}")
+        logger.info("Log file created: %s", log_file.path)
         return NEALogRecorder(log_file, nea_config)
 
-    def _update_log_preview(self) -> None:
-        """現在の設定に基づいてログファイル名をプレビュー更新"""
+    @Slot()
+    def _schedule_log_preview(self) -> None:
+        """プレビュー更新を予約 (待機中に再度呼ばれたらタイマーをリセット)"""
+        self._preview_timer.start()
+
+    @Slot()
+    def _refresh_log_preview(self) -> None:
+        """
+        プレビューの更新要求 (キャッシュを使わずに取得し直す)
+
+        ログフォルダの変更やファイル削除の直後でも、古い番号を表示しないようにする。
+        """
+        self._update_log_preview(use_cache=False)
+
+    def _clear_log_number_cache(self) -> None:
+        """ログ番号キャッシュを破棄 (取得中のジョブの結果も古いものとして捨てる)"""
+        self._next_number_cache.clear()
+        self._preview_request_id += 1
+
+    def _get_cached_log_number(self, key: tuple[str, bool, bool]) -> tuple[int, int] | None:
+        """有効期限内のキャッシュ済みログ番号を取得"""
+        cached = self._next_number_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < LOG_PREVIEW_CACHE_TTL_SEC:
+            return cached[1]
+
+        return None
+
+    def _update_log_preview(self, *, use_cache: bool = True) -> None:
+        """
+        現在の設定に基づいてログファイル名をプレビュー更新
+
+        Args:
+            use_cache: 有効期限内のキャッシュがあれば、ファイルを走査せずに表示する
+
+        """
+        # 古いジョブの結果は捨てる
+        self._preview_request_id += 1
+
         try:
             # マネージャー呼び出し
-            app_config = AppConfig.load()
-            manager = LogManager(LOG_DIR, app_config.common.encode)
-
-            # 番号取得
+            app_config = self._get_app_config()
+            manager = self._get_log_manager(app_config.common.encode)
             log_config = self._view.log_setting_panel.get_config()
-            date_dir = manager.get_active_directory(log_config.update_date_folder)
-            next_numbers = date_dir.get_next_number(major_update=log_config.update_major_number)
+        except Exception as e:  # noqa: BLE001
+            self._on_preview_failed(self._preview_request_id, str(e))
+            return
 
-            number_text = f"{next_numbers[0]}.{next_numbers[1]}"
-            self._view.log_setting_panel.set_preview_text(number_text)
+        update_date = log_config.update_date_folder
+        major_update = log_config.update_major_number
+
+        # キャッシュがあればそのまま表示
+        if use_cache:
+            key = (manager.encoding, update_date, major_update)
+            next_numbers = self._get_cached_log_number(key)
+            if next_numbers is not None:
+                self._set_log_preview(next_numbers)
+                return
+
+        # 番号取得 (ファイルシステム走査) はワーカースレッドで行う
+        job = _PreviewJob(self._preview_request_id, manager, update_date, major_update)
+        job.signals.ready.connect(self._on_preview_ready, Qt.ConnectionType.QueuedConnection)
+        job.signals.failed.connect(self._on_preview_failed, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(job)
+
+    @Slot(int, object, object)
+    def _on_preview_ready(
+        self, request_id: int, key: tuple[str, bool, bool], next_numbers: tuple[int, int]
+    ) -> None:
+        if request_id < self._preview_request_id:
+            return  # 後続のリクエスト or キャッシュ破棄があったので、表示もキャッシュもしない
+
+        self._next_number_cache[key] = (time.monotonic(), next_numbers)
+        self._set_log_preview(next_numbers)
+
+    @Slot(int, str)
+    def _on_preview_failed(self, request_id: int, message: str) -> None:
+        if request_id < self._preview_request_id:
+            return
 
-        except Exception as e:  # noqa: BLE001
-            print(f"Preview update failed: {e}")
-            self._view.log_setting_panel.set_preview_text("Error")
+        logger.warning("Preview update failed: %s", message)
+        self._view.log_setting_panel.set_preview_text("Error")
+
+    def _set_log_preview(self, next_numbers: tuple[int, int]) -> None:
+        number_text = f"{next_numbers[0]}.{next_numbers[1]}"
+        self._view.log_setting_panel.set_preview_text(number_text)
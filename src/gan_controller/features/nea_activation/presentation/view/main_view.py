@@ -1,6 +1,8 @@
+from typing import ClassVar
+
+from PySide6.QtCore import QTimer, Slot
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QMessageBox, QVBoxLayout, QWidget
 
-from gan_controller.core.domain.electricity import ElectricProperties
 from gan_controller.features.nea_activation.domain.config import NEAConfig
 from gan_controller.features.nea_activation.domain.models import (
     NEAActivationState,
@@ -15,8 +17,19 @@ from .widgets import (
     NEAMeasurePanel,
 )
 
+# 測定値ラベルを更新する最短間隔 [ms] (これより速く更新しても人には読めない)
+MEASURE_LABEL_INTERVAL_MS = 50
+
 
 class NEAActivationMainView(QWidget):
+    # 状態ごとの表示
+    # (設定パネル有効, 開始ボタン有効, 停止ボタン有効, ステータス表示, 実行中)
+    _STATE_TABLE: ClassVar[dict[NEAActivationState, tuple[bool, bool, bool, str, bool]]] = {
+        NEAActivationState.IDLE: (True, True, False, "待機中", False),
+        NEAActivationState.RUNNING: (False, False, True, "実行中", True),
+        NEAActivationState.STOPPING: (False, False, False, "停止処理中", False),
+    }
+
     # === 要素
     _main_layout: QHBoxLayout
 
@@ -28,20 +41,34 @@ class NEAActivationMainView(QWidget):
     # 右側 (グラフ)
     graph_panel: NEAGraphPanel
 
+    # 測定値ラベルの間引き (間隔内に届いた結果は最新の1件だけ後で表示)
+    _measure_label_timer: QTimer
+    _pending_measure_result: NEAExperimentResult | None
+
     def __init__(self) -> None:
         super().__init__()
 
         self._init_ui()
 
+        self._pending_measure_result = None
+        self._measure_label_timer = QTimer(self)
+        self._measure_label_timer.setSingleShot(True)
+        self._measure_label_timer.setInterval(MEASURE_LABEL_INTERVAL_MS)
+        self._measure_label_timer.timeout.connect(self._flush_measure_values)
+
         self.set_running(NEAActivationState.IDLE)
 
     def _init_ui(self) -> None:
+        # 構築中の再描画を止め、全パネルを追加し終えてからまとめて更新する
+        self.setUpdatesEnabled(False)
+
         self._main_layout = QHBoxLayout(self)
-        self.setLayout(self._main_layout)
 
         self._main_layout.addWidget(self._left_panel())
         self._main_layout.addWidget(self._right_panel())
 
+        self.setUpdatesEnabled(True)
+
     def _left_panel(self) -> QFrame:
         """左側 (設定値、制御) レイアウト"""
         left_panel = QFrame()
@@ -49,6 +76,8 @@ class NEAActivationMainView(QWidget):
         left_panel.setFixedWidth(410)
 
         left_layout = QVBoxLayout(left_panel)
+        # パネル間の間隔 (既定の間隔 6 + 10 + 6 と同じ見た目。スペーサーを挟まずに済む)
+        left_layout.setSpacing(22)
 
         self.condition_setting_panel = NEAConditionSettingsPanel()
         self.log_setting_panel = NEALogSettingPanel()
@@ -56,11 +85,8 @@ class NEAActivationMainView(QWidget):
         self.measure_panel = NEAMeasurePanel()
 
         left_layout.addWidget(self.condition_setting_panel)
-        left_layout.addSpacing(10)
         left_layout.addWidget(self.log_setting_panel)
-        left_layout.addSpacing(10)
         left_layout.addWidget(self.execution_panel)
-        left_layout.addSpacing(10)
         left_layout.addWidget(self.measure_panel)
         left_layout.addStretch()
 
@@ -84,37 +110,33 @@ class NEAActivationMainView(QWidget):
 
     def set_running(self, state: NEAActivationState) -> None:
         """実験表示 (ボタン) 切り替え"""
-        if state == NEAActivationState.IDLE:
-            self.condition_setting_panel.setEnabled(True)
-            self.log_setting_panel.setEnabled(True)
-            self.execution_panel.start_button.setEnabled(True)
-            self.execution_panel.stop_button.setEnabled(False)
-            self.measure_panel.set_status("待機中", False)
-            self.execution_panel.set_dirty_tracking(False)
-            return
-
-        if state == NEAActivationState.RUNNING:
-            self.condition_setting_panel.setEnabled(False)
-            self.log_setting_panel.setEnabled(False)
-            self.execution_panel.start_button.setEnabled(False)
-            self.execution_panel.stop_button.setEnabled(True)
-            self.measure_panel.set_status("実行中", True)
-            self.execution_panel.set_dirty_tracking(True)
-            self.execution_panel.mark_applied()
-            return
+        settings_enabled, start_enabled, stop_enabled, status_text, is_running = (
+            self._STATE_TABLE[state]
+        )
 
-        self.condition_setting_panel.setEnabled(False)
-        self.log_setting_panel.setEnabled(False)
-        self.execution_panel.start_button.setEnabled(False)
-        self.execution_panel.stop_button.setEnabled(False)
-        self.measure_panel.set_status("停止処理中", False)
-        self.execution_panel.set_dirty_tracking(False)
+        execution_panel = self.execution_panel
+        self.condition_setting_panel.setEnabled(settings_enabled)
+        self.log_setting_panel.setEnabled(settings_enabled)
+        execution_panel.start_button.setEnabled(start_enabled)
+        execution_panel.stop_button.setEnabled(stop_enabled)
+        self.measure_panel.set_status(status_text, is_running)
+        execution_panel.set_dirty_tracking(is_running)
+        if is_running:
+            execution_panel.mark_applied()
 
     def update_view(self, result: NEAExperimentResult) -> None:
         """結果をUIに反映"""
-        self._update_measure_values(result)
+        self._show_measure_values(result)
         self.graph_panel.append_data(result)
 
+    def update_view_batch(self, results: list[NEAExperimentResult]) -> None:
+        """複数の結果をまとめてUIに反映 (数値表示は最新の結果のみ)"""
+        if not results:
+            return
+
+        self._show_measure_values(results[-1])
+        self.graph_panel.append_batch(results)
+
     def clear_view(self) -> None:
         """グラフや表示を初期化"""
         self.graph_panel.clear_graph()
@@ -122,24 +144,42 @@ class NEAActivationMainView(QWidget):
     def show_error(self, msg: str) -> None:
         QMessageBox.warning(self, "エラー", msg)
 
+    def _show_measure_values(self, result: NEAExperimentResult) -> None:
+        """測定値ラベルを更新 (前回の更新から間隔が空いていなければ、間隔明けに最新値を表示)"""
+        if self._measure_label_timer.isActive():
+            self._pending_measure_result = result
+            return
+
+        self._update_measure_values(result)
+        self._measure_label_timer.start()
+
+    @Slot()
+    def _flush_measure_values(self) -> None:
+        """間引き中に届いた最新の結果を表示"""
+        result = self._pending_measure_result
+        if result is None:
+            return
+
+        self._pending_measure_result = None
+        self._update_measure_values(result)
+        self._measure_label_timer.start()
+
     def _update_measure_values(self, result: NEAExperimentResult) -> None:
         """測定結果で表示を更新"""
         measure_p = self.measure_panel
 
-        measure_p.elapsed_time_label.setValue(result.timestamp)
+        # 値が変わったラベルだけ再描画させる
+        measure_p.elapsed_time_label.set_if_changed(result.timestamp)
 
-        measure_p.pc_value_label.setValue(result.photocurrent)
-        measure_p.qe_value_label.setValue(result.quantum_efficiency)
-        measure_p.ext_pres_val.setValue(result.ext_pressure)
+        measure_p.pc_value_label.set_if_changed(result.photocurrent)
+        measure_p.qe_value_label.set_if_changed(result.quantum_efficiency)
+        measure_p.ext_pres_val.set_if_changed(result.ext_pressure)
 
         # AMD電源
-        measure_p.amd_value_labels[ElectricProperties.VOLTAGE].setValue(
-            result.amd_electricity.voltage
-        )
-        measure_p.amd_value_labels[ElectricProperties.CURRENT].setValue(
-            result.amd_electricity.current
-        )
-        measure_p.amd_value_labels[ElectricProperties.POWER].setValue(result.amd_electricity.power)
+        amd = result.amd_electricity
+        measure_p.amd_voltage_label.set_if_changed(amd.voltage)
+        measure_p.amd_current_label.set_if_changed(amd.current)
+        measure_p.amd_power_label.set_if_changed(amd.power)
 
     # =============================================================================
 
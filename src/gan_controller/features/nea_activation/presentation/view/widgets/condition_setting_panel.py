@@ -12,7 +12,10 @@ from PySide6.QtWidgets import (
 
 from gan_controller.core.domain.quantity import Length, Resistance, Time, Value, Voltage
 from gan_controller.features.nea_activation.domain.config import NEAConditionConfig
-from gan_controller.presentation.components.widgets import CheckableSpinBox
+from gan_controller.presentation.components.widgets import (
+    CheckableSpinBox,
+    create_double_spin_box,
+)
 
 
 class NEAConditionSettingsPanel(QGroupBox):
@@ -31,7 +34,6 @@ class NEAConditionSettingsPanel(QGroupBox):
         super().__init__("Condition Settings", parent)
 
         main_layout = QVBoxLayout(self)
-        self.setLayout(main_layout)
 
         setting_layout = self._create_settings_layout()
 
@@ -45,11 +47,11 @@ class NEAConditionSettingsPanel(QGroupBox):
 
         config_layout1 = QGridLayout()
         config_layout1.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.shunt_r_spin = QDoubleSpinBox(
-            value=10, minimum=1, maximum=10000, decimals=0, suffix=" kΩ"
+        self.shunt_r_spin = create_double_spin_box(
+            10, minimum=1, maximum=10000, decimals=0, suffix=" kΩ"
         )
-        self.laser_wavelength_spin = QDoubleSpinBox(
-            value=406, minimum=1, maximum=1000, decimals=0, suffix=" nm"
+        self.laser_wavelength_spin = create_double_spin_box(
+            406, minimum=1, maximum=1000, decimals=0, suffix=" nm"
         )
         self.fixed_background_checkable_spin = CheckableSpinBox(
             "BG固定 :", False, 1.5, suffix=" mV", minimum=0, single_step=0.1
@@ -64,11 +66,11 @@ class NEAConditionSettingsPanel(QGroupBox):
 
         config_layout2 = QGridLayout()
         config_layout2.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.stabilization_time_spin = QDoubleSpinBox(
-            minimum=0, maximum=3, value=1, decimals=1, singleStep=0.1, suffix=" s"
+        self.stabilization_time_spin = create_double_spin_box(
+            1, minimum=0, maximum=3, decimals=1, single_step=0.1, suffix=" s"
         )
-        self.integrated_interval_spin = QDoubleSpinBox(
-            minimum=0.1, maximum=3, value=0.1, decimals=1, singleStep=0.1, suffix=" s"
+        self.integrated_interval_spin = create_double_spin_box(
+            0.1, minimum=0.1, maximum=3, decimals=1, single_step=0.1, suffix=" s"
         )
         self.integrated_count_spin = QSpinBox(minimum=1, maximum=100, value=1)
         config_layout2.addWidget(QLabel("安定化時間 :"), 0, 0)
@@ -1,4 +1,4 @@
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtWidgets import (
     QDoubleSpinBox,
     QGridLayout,
@@ -16,6 +16,7 @@ from gan_controller.features.nea_activation.domain.config import NEAControlConfi
 from gan_controller.presentation.components.widgets import (
     CheckableSpinBox,
     SignificantFigureSpinBox,
+    create_double_spin_box,
 )
 
 _APPLY_DIRTY_STYLE = (
@@ -77,12 +78,9 @@ class NEAExecutionPanel(QGroupBox):
         laser_layout = QGridLayout()
         laser_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
-        self.laser_sv_spin = QDoubleSpinBox()
-        self.laser_sv_spin.setValue(10)
-        self.laser_sv_spin.setSuffix(" mW")
-        self.laser_sv_spin.setRange(0, 120)
-        self.laser_sv_spin.setDecimals(1)
-        self.laser_sv_spin.setSingleStep(0.1)
+        self.laser_sv_spin = create_double_spin_box(
+            10, minimum=0, maximum=120, decimals=1, single_step=0.1, suffix=" mW"
+        )
         self.laser_pv_spin = SignificantFigureSpinBox(sig_figs=3)
         self.laser_pv_spin.setValue(3.01)
         self.laser_pv_spin.setSuffix(" mW")
@@ -122,15 +120,21 @@ class NEAExecutionPanel(QGroupBox):
         return execution_layout
 
     def _connect_signals(self) -> None:
-        self.start_button.clicked.connect(self.start_requested)
-        self.stop_button.clicked.connect(self.stop_requested)
-        self.apply_button.clicked.connect(self.apply_requested)
+        # ボタン -> 要求シグナル (同一スレッドなので直接呼び出し)
+        direct = Qt.ConnectionType.DirectConnection
+        for clicked, requested in (
+            (self.start_button.clicked, self.start_requested),
+            (self.stop_button.clicked, self.stop_requested),
+            (self.apply_button.clicked, self.apply_requested),
+        ):
+            clicked.connect(requested, direct)
 
         self.amd_output_current_spin.check_box.stateChanged.connect(self._on_input_changed)
         self.amd_output_current_spin.spin_box.valueChanged.connect(self._on_input_changed)
         self.laser_sv_spin.valueChanged.connect(self._on_input_changed)
         self.laser_pv_spin.valueChanged.connect(self._on_input_changed)
 
+    @Slot()
     def _on_input_changed(self) -> None:
         # 停止中は変更検知を無効化
         if not self._dirty_tracking_enabled:
@@ -192,12 +196,19 @@ class NEAExecutionPanel(QGroupBox):
     # =============================================================================
 
     def get_config(self) -> NEAControlConfig:
-        return NEAControlConfig(
-            amd_enable=self.amd_output_current_spin.isChecked(),
-            amd_output_current=Current(self.amd_output_current_spin.value()),
-            laser_power_sv=Power(self.laser_sv_spin.value(), "m"),
-            laser_power_pv=Power(self.laser_pv_spin.value(), "m"),
-        )
+        return NEAControlConfig(**self._config_values())
+
+    def get_apply_config(self) -> NEAControlConfig:
+        """実験中の反映用の設定を取得 (入力範囲はスピンボックスで制限済みのため、検証を省略)"""
+        return NEAControlConfig.model_construct(**self._config_values())
+
+    def _config_values(self) -> dict:
+        return {
+            "amd_enable": self.amd_output_current_spin.isChecked(),
+            "amd_output_current": Current(self.amd_output_current_spin.value()),
+            "laser_power_sv": Power(self.laser_sv_spin.value(), "m"),
+            "laser_power_pv": Power(self.laser_pv_spin.value(), "m"),
+        }
 
     def set_config(self, config: NEAControlConfig) -> None:
         self._block_input_signals(True)
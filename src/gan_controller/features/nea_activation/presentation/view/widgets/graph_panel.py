@@ -1,27 +1,33 @@
+import math
+
+import numpy as np
 from PySide6.QtCore import Qt, Slot
+from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QSpinBox, QVBoxLayout, QWidget
 
 from gan_controller.features.nea_activation.domain.models import NEAExperimentResult
-from gan_controller.presentation.components.widgets import DualAxisGraph, GraphData
+from gan_controller.presentation.components.widgets import DualAxisGraph
 
 
 class NEAGraphPanel(QWidget):
     """実行制御およびモニタリング表示用ウィジェット"""
 
-    _history_pc: GraphData
-    _history_qe: GraphData
+    MAX_PLOT_POINTS = 2000  # 1ラインあたりの最大描画点数 (超えたら間引いて描画)
+
+    _layout: QVBoxLayout
 
     graph_pc: DualAxisGraph
-    graph_qe: DualAxisGraph
+    graph_qe: DualAxisGraph | None  # 最初にデータが来るまで作らない (それまでは _qe_placeholder)
+    _qe_placeholder: QWidget | None
+
+    _visible_x_span: float | None
+    _dirty: bool  # 非表示中に追加され、まだ描画していないデータがある
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        # 履歴データ (全データ) をここに保持
-        self._history_pc = GraphData()
-        self._history_qe = GraphData()
-
         layout = QVBoxLayout(self)
+        self._layout = layout
 
         # === 表示設定
         setting_layout = QHBoxLayout()
@@ -49,35 +55,69 @@ class NEAGraphPanel(QWidget):
         self.graph_pc.set_axis_scale("right", "log")
         self.graph_pc.set_axis_formatter("left", True)
         self.graph_pc.set_legend_location("upper left")
+        self.graph_pc.set_max_draw_points(self.MAX_PLOT_POINTS)
 
-        self.graph_qe = DualAxisGraph()
-        self.graph_qe.setMinimumSize(500, 300)
-        self.graph_qe.set_title("Quantum Efficiency")
-        self.graph_qe.set_axis_labels(
-            x_label="Time (min)", left_label="Quantum Efficiency (%)", right_label="Pressure (Pa)"
-        )
-        self.graph_qe.set_axis_scale("right", "log")
-        self.graph_qe.set_axis_formatter("left", True)
-        self.graph_qe.set_legend_location("upper left")
+        # QEグラフは図の初期化が重いので、最初にデータが来るまで同じ大きさの空枠で場所だけ確保する
+        self.graph_qe = None
+        self._qe_placeholder = QWidget()
+        self._qe_placeholder.setMinimumSize(500, 300)
 
         layout.addWidget(self.graph_pc)
         layout.addSpacing(10)
-        layout.addWidget(self.graph_qe)
+        layout.addWidget(self._qe_placeholder)
 
-        self._init_lines()
+        self._visible_x_span = None
+        self._init_pc_lines()
 
         # 範囲初期化
         self._on_update_graph_settings()
 
-    def _init_lines(self) -> None:
-        """グラフにプロットする線を定義"""
-        # PC Graph
+        self._dirty = False
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+
+        # 非表示中に溜まった分を表示と同時に反映
+        self._flush_plots()
+
+    def _ensure_graph_qe(self) -> DualAxisGraph:
+        """QEグラフを取得 (未作成なら作成して空枠と差し替える)"""
+        if self.graph_qe is not None:
+            return self.graph_qe
+
+        graph_qe = DualAxisGraph()
+        graph_qe.setMinimumSize(500, 300)
+        graph_qe.set_title("Quantum Efficiency")
+        graph_qe.set_axis_labels(
+            x_label="Time (min)", left_label="Quantum Efficiency (%)", right_label="Pressure (Pa)"
+        )
+        graph_qe.set_axis_scale("right", "log")
+        graph_qe.set_axis_formatter("left", True)
+        graph_qe.set_legend_location("upper left")
+        graph_qe.set_max_draw_points(self.MAX_PLOT_POINTS)
+        graph_qe.set_visible_x_span(self._visible_x_span)
+
+        if self._qe_placeholder is not None:
+            self._layout.replaceWidget(self._qe_placeholder, graph_qe)
+            self._qe_placeholder.deleteLater()
+            self._qe_placeholder = None
+
+        self.graph_qe = graph_qe
+        self._init_qe_lines()
+        return graph_qe
+
+    def _init_pc_lines(self) -> None:
+        """PCグラフにプロットする線を定義"""
         self.graph_pc.add_series(
             "pc", "left", "blue", marker="o", linestyle="None", legend_label="Photocurrent"
         )
         self.graph_pc.add_series("pres", "right", "black", legend_label="Pressure")
 
-        # QE Graph
+    def _init_qe_lines(self) -> None:
+        """QEグラフにプロットする線を定義"""
+        if self.graph_qe is None:
+            return
+
         self.graph_qe.add_series(
             "qe", "left", "green", marker="o", linestyle="None", legend_label="QE"
         )
@@ -85,49 +125,76 @@ class NEAGraphPanel(QWidget):
 
     def clear_graph(self) -> None:
         """グラフデータをクリアして再初期化"""
-        self._history_pc = GraphData()
-        self._history_qe = GraphData()
-
         self.graph_pc.clear_view()
-        self.graph_qe.clear_view()
+        if self.graph_qe is not None:
+            self.graph_qe.clear_view()
 
-        self._init_lines()  # ライン再設定
+        # ライン再設定
+        self._init_pc_lines()
+        self._init_qe_lines()
+        self._dirty = False
 
     def append_data(self, result: NEAExperimentResult) -> None:
-        t = result.timestamp
+        """1点追加 (1点だけなら配列を作らずスカラーのまま追加する)"""
+        t_min = result.timestamp.value_as("min")
+        pres = result.ext_pressure.base_value
+        pc = result.photocurrent.base_value
+        qe = result.quantum_efficiency.value_as("%")
 
         # PC, QE が負の場合は描画しない
-        pc_val = result.photocurrent.base_value
-        if pc_val <= 0:
-            pc_val = float("nan")
-
-        qe_val = result.quantum_efficiency.value_as("%")
-        if qe_val <= 0:
-            qe_val = float("nan")
-
-        #  データ追加
-        self._history_pc.append_point(
-            x_value=t.value_as("min"),
-            y_values={
-                "pc": pc_val,
-                "pres": result.ext_pressure.base_value,
-            },
-        )
-        self._history_qe.append_point(
-            x_value=t.value_as("min"),
-            y_values={
-                "qe": qe_val,
-                "pres": result.ext_pressure.base_value,
-            },
-        )
+        pc = pc if pc > 0 else math.nan
+        qe = qe if qe > 0 else math.nan
+
+        self.graph_pc.append_point(t_min, {"pc": pc, "pres": pres}, redraw=False)
+        self._ensure_graph_qe().append_point(t_min, {"qe": qe, "pres": pres}, redraw=False)
+        self._mark_dirty()
+
+    def append_batch(self, results: list[NEAExperimentResult]) -> None:
+        """複数の結果をまとめて追加し、1回だけ再描画する"""
+        if not results:
+            return
+
+        n = len(results)
+        t_min = np.fromiter((r.timestamp.value_as("min") for r in results), np.float64, n)
+        pres = np.fromiter((r.ext_pressure.base_value for r in results), np.float64, n)
+        pc = np.fromiter((r.photocurrent.base_value for r in results), np.float64, n)
+        qe = np.fromiter((r.quantum_efficiency.value_as("%") for r in results), np.float64, n)
+
+        # PC, QE が負の場合は描画しない
+        pc = np.where(pc <= 0, np.nan, pc)
+        qe = np.where(qe <= 0, np.nan, qe)
+
+        self.graph_pc.append_points(t_min, {"pc": pc, "pres": pres}, redraw=False)
+        self._ensure_graph_qe().append_points(t_min, {"qe": qe, "pres": pres}, redraw=False)
+        self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """
+        追加したデータを再描画する
+
+        描画頻度はコントローラー側で結果をまとめて渡すことで抑えているため、ここでは間引かない。
+        """
+        self._dirty = True
+        self._flush_plots()
+
+    def _flush_plots(self) -> None:
+        """前回描画以降にデータが追加されていれば再描画"""
+        if not self._dirty:
+            return
+
+        # 非表示中 (別タブ表示中など) は描画しても見えないので保留し、表示時にまとめて描画
+        # データ自体は append_batch で追加済みなので失われない
+        if not self.isVisible():
+            return
 
-        # グラフ更新
-        self.graph_pc.update_plot(self._history_pc)
-        self.graph_qe.update_plot(self._history_qe)
+        self._dirty = False
+        self.graph_pc.refresh()
+        if self.graph_qe is not None:
+            self.graph_qe.refresh()
 
     # =============================================================
 
-    @Slot(int)
+    @Slot()
     def _on_update_graph_settings(self) -> None:
         """グラフ表示設定の変更"""
         # 表示幅変更
@@ -137,6 +204,8 @@ class NEAGraphPanel(QWidget):
     def _change_time_window(self, window_sec: float) -> None:
         """グラフの表示幅を設定 (0以下の場合は全表示)"""
         val = float(window_sec) if window_sec > 0 else None
+        self._visible_x_span = val  # QEグラフ作成時にも反映する
 
         self.graph_pc.set_visible_x_span(val)
-        self.graph_qe.set_visible_x_span(val)
+        if self.graph_qe is not None:
+            self.graph_qe.set_visible_x_span(val)
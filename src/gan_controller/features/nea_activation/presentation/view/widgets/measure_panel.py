@@ -15,17 +15,30 @@ from gan_controller.core.domain.electricity import ElectricProperties
 from gan_controller.core.domain.quantity import Current, Pressure, Time, Value
 from gan_controller.presentation.components.widgets import ValueLabel
 
+_EP_C = ElectricProperties.CURRENT
+_EP_V = ElectricProperties.VOLTAGE
+_EP_P = ElectricProperties.POWER
+# AMD表示の並び順 (列番号)
+_AMD_COLUMNS = ((_EP_C, 0), (_EP_V, 1), (_EP_P, 2))
+
 
 class NEAMeasurePanel(QGroupBox):
     """モニタリング表示用ウィジェット"""
 
     # === 要素
     status_value_label: QLabel  # 動作状態
+    _palette_running: QPalette  # 実行中の文字色
+    _palette_idle: QPalette  # 停止中の文字色
+    _last_is_running: bool | None
 
     sequence_time_label: ValueLabel  # シーケンスの経過時間
     elapsed_time_label: ValueLabel  # 合計の経過時間
 
     amd_value_labels: dict[ElectricProperties, ValueLabel]
+    # 更新頻度が高いため、amd_value_labels の各要素を直接参照できるようにしておく
+    amd_voltage_label: ValueLabel
+    amd_current_label: ValueLabel
+    amd_power_label: ValueLabel
 
     pc_value_label: ValueLabel
     qe_value_label: ValueLabel
@@ -46,6 +59,11 @@ class NEAMeasurePanel(QGroupBox):
 
         # ====== 状態
         self.status_value_label = QLabel()
+        self._palette_running = QPalette(self.status_value_label.palette())
+        self._palette_running.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.green)
+        self._palette_idle = QPalette(self.status_value_label.palette())
+        self._palette_idle.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.gray)
+        self._last_is_running = None
         self.set_status("待機中", False)
         # フォント
         status_font = QFont()
@@ -88,7 +106,7 @@ class NEAMeasurePanel(QGroupBox):
         amd_group = QGroupBox("AMD")
         amd_layout = QGridLayout(amd_group)
         self.amd_value_labels = {}
-        for i, electric_prop in enumerate(ElectricProperties):
+        for electric_prop, i in _AMD_COLUMNS:
             header_text = f"{electric_prop.name} ({electric_prop.unit})"
             lbl = QLabel(header_text)
             lbl.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -99,6 +117,10 @@ class NEAMeasurePanel(QGroupBox):
             amd_layout.addWidget(lbl, 0, i)
             amd_layout.addWidget(self.amd_value_labels[electric_prop], 1, i)
 
+        self.amd_voltage_label = self.amd_value_labels[_EP_V]
+        self.amd_current_label = self.amd_value_labels[_EP_C]
+        self.amd_power_label = self.amd_value_labels[_EP_P]
+
         # 配置
         env_layout.addLayout(form_layout1)
         env_layout.addStretch()
@@ -115,10 +137,9 @@ class NEAMeasurePanel(QGroupBox):
         """ステータス表示を変更"""
         self.status_value_label.setText(status)
 
-        pal = self.status_value_label.palette()
-        if is_running:
-            pal.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.green)
-        else:
-            pal.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.gray)
-
-        self.status_value_label.setPalette(pal)
+        # 色は状態が変わったときだけ差し替える
+        if is_running != self._last_is_running:
+            self._last_is_running = is_running
+            self.status_value_label.setPalette(
+                self._palette_running if is_running else self._palette_idle
+            )
@@ -1,4 +1,4 @@
-from PySide6.QtCore import Slot
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import QMessageBox
 
 from gan_controller.core.domain.app_config import AppConfig
@@ -6,25 +6,72 @@ from gan_controller.features.setting.view.main_view import SettingMainView
 from gan_controller.presentation.components.tab_controller import ITabController
 
 
+class _SaveJobSignals(QObject):
+    """_SaveJob の結果通知用 (QRunnable は QObject ではないため分離)"""
+
+    # 完了通知を出すかどうか
+    finished = Signal(bool)
+    # エラーメッセージ
+    failed = Signal(str)
+
+
+class _SaveJob(QRunnable):
+    """設定ファイルの書き込みをワーカースレッドで行うジョブ (ディスクI/OをUIスレッドから外す)"""
+
+    def __init__(self, config: AppConfig, show_notify: bool) -> None:
+        super().__init__()
+        self.signals = _SaveJobSignals()
+
+        self._config = config
+        self._show_notify = show_notify
+
+    def run(self) -> None:
+        try:
+            self._config.save(raise_on_error=True)
+        except Exception as e:  # noqa: BLE001
+            self.signals.failed.emit(str(e))
+            return
+
+        self.signals.finished.emit(self._show_notify)
+
+
 class SettingsController(ITabController):
     _view: SettingMainView
-    _config: AppConfig
+    _config: AppConfig | None
+    _is_edited: bool  # ロード/保存後にUIが編集されたか
+
+    _save_pool: QThreadPool  # 書き込み用 (1スレッドで順に書く)
+    _is_saving: bool  # 書き込みジョブの実行中か
+    _pending_save: tuple[AppConfig, bool] | None  # 実行中に要求された保存 (最後の要求のみ残す)
 
     def __init__(self, view: SettingMainView) -> None:
         super().__init__()
 
         self._view = view
+        self._config = None
+        self._is_edited = False
+
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._is_saving = False
+        self._pending_save = None
+
         self._attach_view()
 
         # 初期ロード (通知なしで実行)
-        self.load_config(show_notify=False)
+        # ウィンドウの初回表示を待たせないよう、イベントループに戻ってから読み込む
+        QTimer.singleShot(0, self._on_initial_load)
 
     def _attach_view(self) -> None:
         self._view.load_requested.connect(self._on_load_clicked)
         self._view.save_requested.connect(self._on_save_clicked)
+        self._view.config_edited.connect(self._on_config_edited)
 
     def on_close(self) -> None:
-        self.save_config(show_notify=False)
+        if self._config is None:
+            return  # 初期ロード前 (Viewは既定値のまま) なので保存しない
+
+        self._save_config_now(show_notify=False)
 
     # ==========================================================
     # ビジネスロジック
@@ -42,8 +89,10 @@ class SettingsController(ITabController):
         """
         try:
             # ロジック: 読み込み & 状態更新
-            self._config = AppConfig.load()
-            self._view.set_full_config(self._config)
+            config = AppConfig.load()
+            self._config = config
+            self._view.set_full_config(config)
+            self._is_edited = False  # 反映した内容が基準になる
 
         except Exception as e:  # noqa: BLE001
             # AppConfig.load がエラーを握りつぶさず raise するように変更した場合に備える
@@ -62,30 +111,83 @@ class SettingsController(ITabController):
         """
         現在のViewの内容をファイルに保存する。
 
+        書き込みはワーカースレッドで行い、完了通知は書き込み後に出す。
+        書き込み中に再度保存された場合は、最後の内容だけを続けて書き込む。
+
         Returns:
-            bool: 保存に成功したらTrue
+            bool: 保存を受け付けたらTrue (Viewの内容から設定を作れなければFalse)
 
         """
         try:
-            # ロジック: Viewからデータ取得 -> 保存 -> 状態更新
             new_config = self._view.get_full_config()
-            new_config.save()
+        except Exception as e:  # noqa: BLE001
+            QMessageBox.critical(self._view, "保存エラー", f"保存に失敗しました:\n{e}")
+            return False
+
+        # 状態はすぐに更新し、ファイルへの反映を待たない
+        self._config = new_config
+        self._is_edited = False
+
+        self._pending_save = (new_config, show_notify)
+        if not self._is_saving:
+            self._start_pending_save()
 
+        return True
+
+    def _save_config_now(self, show_notify: bool) -> bool:
+        """
+        現在のViewの内容を、書き込み完了まで待って保存する。
+
+        保存直後に他の処理がファイルを読む場合 (タブ移動・終了時) に使う。
+        書き込み中のジョブを待ってから、最新の内容をその場で書き込む (待機中の保存は不要になる)。
+
+        Returns:
+            bool: 書き込みに成功したらTrue
+
+        """
+        self._save_pool.waitForDone()
+        self._pending_save = None
+
+        try:
+            new_config = self._view.get_full_config()
+            new_config.save(raise_on_error=True)
         except Exception as e:  # noqa: BLE001
             QMessageBox.critical(self._view, "保存エラー", f"保存に失敗しました:\n{e}")
             return False
 
-        else:
-            self._config = new_config
-            if show_notify:
-                self.status_message_requested.emit("設定を保存しました", 5000)
+        self._config = new_config
+        self._is_edited = False
+        if show_notify:
+            self.status_message_requested.emit("設定を保存しました", 5000)
 
-            return True
+        return True
+
+    def _start_pending_save(self) -> None:
+        if self._pending_save is None:
+            return
+
+        config, show_notify = self._pending_save
+        self._pending_save = None
+        self._is_saving = True
+
+        job = _SaveJob(config, show_notify)
+        job.signals.finished.connect(self._on_save_finished, Qt.ConnectionType.QueuedConnection)
+        job.signals.failed.connect(self._on_save_failed, Qt.ConnectionType.QueuedConnection)
+        self._save_pool.start(job)
 
     # ==========================================================
     # インターフェース / ヘルパー
     # ==========================================================
 
+    def _restore_view(self) -> None:
+        """Viewを保存済みの設定に戻す"""
+        if self._config is None:
+            self.load_config(show_notify=False)
+            return
+
+        self._view.set_full_config(self._config)
+        self._is_edited = False  # 反映した内容が基準になる
+
     def get_config(self) -> AppConfig:
         """現在の設定(保存済み)のコピーを返す"""
         if self._config is None:
@@ -94,8 +196,12 @@ class SettingsController(ITabController):
         return self._config.model_copy(deep=True)
 
     def is_modified(self) -> bool:
-        """UIの内容が、最後にロード/保存した内容と異なっているか判定"""
-        if self._config is None:
+        """
+        UIの内容が、最後にロード/保存した内容と異なっているか判定
+
+        ロード/保存後に入力欄が一度も変更されていなければ、UIから設定を作り直さずに済ませる。
+        """
+        if self._config is None or not self._is_edited:
             return False
 
         try:
@@ -123,11 +229,12 @@ class SettingsController(ITabController):
         ret = QMessageBox.question(self._view, title, msg, buttons, QMessageBox.StandardButton.Save)
 
         if ret == QMessageBox.StandardButton.Save:
-            return self.save_config(show_notify=True)  # 保存できたらタブ移動
+            # 移動先のタブはファイルから設定を読むため、書き込み完了を待ってから移動する
+            return self._save_config_now(show_notify=True)
 
         if ret == QMessageBox.StandardButton.Discard:
-            # 変更を破棄して移動
-            self.load_config(show_notify=False)
+            # 変更を破棄して移動 (保存済みの内容はメモリにあるので、ファイルは読み直さない)
+            self._restore_view()
             return True
 
         # キャンセル (移動しない)
@@ -137,6 +244,12 @@ class SettingsController(ITabController):
     # イベントハンドラ
     # ==========================================================
 
+    @Slot()
+    def _on_initial_load(self) -> None:
+        """初期ロード (ボタン等で先に読み込まれていれば何もしない)"""
+        if self._config is None:
+            self.load_config(show_notify=False)
+
     @Slot()
     def _on_load_clicked(self) -> None:
         """読み込みボタン押下時"""
@@ -146,3 +259,29 @@ class SettingsController(ITabController):
     def _on_save_clicked(self) -> None:
         """保存ボタン押下時"""
         self.save_config(show_notify=True)
+
+    @Slot(bool)
+    def _on_save_finished(self, show_notify: bool) -> None:
+        """書き込み完了時"""
+        self._is_saving = False
+        if show_notify:
+            self.status_message_requested.emit("設定を保存しました", 5000)
+
+        self._start_pending_save()
+
+    @Slot(str)
+    def _on_save_failed(self, message: str) -> None:
+        """書き込み失敗時"""
+        self._is_saving = False
+
+        # ファイルの内容を基準に戻し、未保存の変更として扱う
+        self._config = AppConfig.load()
+        self._is_edited = True
+        QMessageBox.critical(self._view, "保存エラー", f"保存に失敗しました:\n{message}")
+
+        self._start_pending_save()
+
+    @Slot()
+    def _on_config_edited(self) -> None:
+        """入力欄の変更時"""
+        self._is_edited = True
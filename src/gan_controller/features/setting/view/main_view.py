@@ -1,9 +1,13 @@
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
+    QAbstractSpinBox,
+    QDoubleSpinBox,
     QFrame,
     QHBoxLayout,
+    QLineEdit,
     QListWidget,
     QPushButton,
+    QSpinBox,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
@@ -44,6 +48,7 @@ class SettingMainView(QWidget):
     # === シグナル
     load_requested = Signal()
     save_requested = Signal()
+    config_edited = Signal()  # いずれかの入力欄が変更された
 
     def __init__(self) -> None:
         super().__init__()
@@ -101,10 +106,19 @@ class SettingMainView(QWidget):
         return widget
 
     def _init_connect(self) -> None:
-        self.btn_load.clicked.connect(self.load_requested.emit)
-        self.btn_save.clicked.connect(self.save_requested.emit)
+        self.btn_load.clicked.connect(self.load_requested)
+        self.btn_save.clicked.connect(self.save_requested)
         # サイドとページの一致処理
         self.sidebar_widget.currentRowChanged.connect(self.stack_widget.setCurrentIndex)
+        # 入力欄の変更通知 (SpinBox内部の QLineEdit は値変更側で拾う)
+        for edit in self.stack_widget.findChildren(QLineEdit):
+            if not isinstance(edit.parent(), QAbstractSpinBox):
+                edit.textChanged.connect(self.config_edited)
+        for spin in [
+            *self.stack_widget.findChildren(QSpinBox),
+            *self.stack_widget.findChildren(QDoubleSpinBox),
+        ]:
+            spin.valueChanged.connect(self.config_edited)
 
     # =============================================================================
 
@@ -121,6 +135,9 @@ class SettingMainView(QWidget):
         return AppConfig(common=common_config, devices=devices_config)
 
     def set_full_config(self, config: AppConfig) -> None:
+        # 反映による変更は編集ではないので config_edited を出さない
+        # (値が同じ入力欄は Qt 側で変更通知が出ないため、個別の比較は不要)
+        self.blockSignals(True)
         self.general_page.set_config(config.common)
 
         self.gm10_page.set_config(config.devices.gm10)
@@ -128,3 +145,4 @@ class SettingMainView(QWidget):
         self.aps_page.set_config(config.devices.aps)
         self.ibeam_page.set_config(config.devices.ibeam)
         self.pwux_page.set_config(config.devices.pwux)
+        self.blockSignals(False)
@@ -1,6 +1,7 @@
 import random
 import time
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from gan_controller.core.domain.quantity import Quantity, Volt, Voltage
 from gan_controller.infrastructure.hardware.drivers import GM10
@@ -12,6 +13,10 @@ class ILoggerAdapter(ABC):
     def read_voltage(self, channel: int | str) -> Quantity[Volt]:
         """指定チャンネルの電圧を読み取る"""
 
+    def read_voltages(self, channels: Sequence[int | str]) -> list[Quantity[Volt]]:
+        """複数チャンネルの電圧を読み取る (まとめて取得できる機器ではオーバーライドする)"""
+        return [self.read_voltage(ch) for ch in channels]
+
     @abstractmethod
     def read_integrated_voltage(
         self, channel: int | str, n: int, interval: float
@@ -27,6 +32,8 @@ class ILoggerAdapter(ABC):
 class GM10Adapter(ILoggerAdapter):
     def __init__(self, driver: GM10) -> None:
         self._driver = driver
+        # 単位 -> SI換算係数 (サンプルごとに Quantity を生成しないようにする)
+        self._scale_by_unit: dict[str, float] = {}
 
     def read_voltage(self, channel: int | str) -> Quantity[Volt]:
         if isinstance(channel, int) and channel <= 0:
@@ -42,6 +49,34 @@ class GM10Adapter(ILoggerAdapter):
             print(f"\033[33m[WARNING] GM10 Read Error (Ch: {channel}): {e}\033[0m")
             return Voltage(float("nan"))
 
+    def read_voltages(self, channels: Sequence[int | str]) -> list[Quantity[Volt]]:
+        """複数チャンネルを1回のFDataクエリ (最小~最大Chの範囲取得) でまとめて読み取る"""
+        ch_strs = [
+            f"{ch:04d}" if isinstance(ch, int) else ch
+            for ch in channels
+            if not (isinstance(ch, int) and ch <= 0)
+        ]
+        if not ch_strs:
+            return [Voltage(float("nan")) for _ in channels]
+
+        try:
+            # 4桁のCh文字列は辞書順 = 番号順
+            data = self._driver.read_channels(min(ch_strs), max(ch_strs))
+        except (RuntimeError, ValueError) as e:
+            print(f"\033[33m[WARNING] GM10 Read Error (Ch: {list(channels)}): {e}\033[0m")
+            return [Voltage(float("nan")) for _ in channels]
+
+        # 無効Ch (0以下) や応答に含まれないChは欠損値
+        results: list[Quantity[Volt]] = []
+        for ch in channels:
+            entry = data.get(f"{ch:04d}" if isinstance(ch, int) else ch)
+            if entry is None:
+                results.append(Voltage(float("nan")))
+            else:
+                results.append(Quantity(*entry))
+
+        return results
+
     def read_integrated_voltage(
         self, channel: int | str, n: int = 1, interval: float = 0.1
     ) -> Quantity[Volt]:
@@ -58,7 +93,8 @@ class GM10Adapter(ILoggerAdapter):
         if isinstance(channel, int) and channel <= 0:
             return Voltage(float("nan"))
 
-        results: list[float] = []
+        scale_by_unit = self._scale_by_unit
+        total = 0.0
         t0 = time.perf_counter()
         try:
             for i in range(n):
@@ -72,14 +108,17 @@ class GM10Adapter(ILoggerAdapter):
                 if sleep_time > 0:
                     time.sleep(sleep_time)
 
-                q = self.read_voltage(channel)  # 単体取得
-                results.append(q.base_value)  # V に正規化
+                raw_val, measure_unit = self._driver.read_channel(channel)  # 単体取得
+                scale = scale_by_unit.get(measure_unit)
+                if scale is None:
+                    scale = Quantity(1.0, measure_unit).base_value
+                    scale_by_unit[measure_unit] = scale
+                total += raw_val * scale  # V に正規化
 
-            result_avg = sum(results) / n
-            return Voltage(result_avg)  # 正規化してるので、そのまま変換
+            return Voltage(total / n)  # 正規化してるので、そのまま変換
 
         except (RuntimeError, ValueError) as e:
-            # 積算中にエラーが発生した場合 (チャンネル無効など)
+            # 積算中にエラーが発生した場合 (チャンネル無効、機器からのエラー応答など)
             print(f"GM10 Integrated Read Error (Ch: {channel}): {e}")
             return Voltage(float("nan"))
 
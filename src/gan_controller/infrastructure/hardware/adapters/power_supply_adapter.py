@@ -1,6 +1,7 @@
 import random
 from abc import ABC, abstractmethod
 
+from gan_controller.core.domain.electricity import ElectricMeasurement
 from gan_controller.core.domain.quantity import (
     Ampere,
     Current,
@@ -47,6 +48,14 @@ class IPowerSupplyAdapter(ABC):
     def measure_power(self) -> Quantity[Watt]:
         pass
 
+    def measure_all(self) -> ElectricMeasurement:
+        """電圧・電流・電力をまとめて測定 (まとめて取得できる機器ではオーバーライドする)"""
+        return ElectricMeasurement(
+            voltage=self.measure_voltage(),
+            current=self.measure_current(),
+            power=self.measure_power(),
+        )
+
     @abstractmethod
     def close(self) -> None:
         pass
@@ -83,6 +92,10 @@ class PFR100L50Adapter(IPowerSupplyAdapter):
         val = self._driver.measure_power()
         return Power(val)
 
+    def measure_all(self) -> ElectricMeasurement:
+        volt, curr, power = self._driver.measure_all()
+        return ElectricMeasurement(voltage=Voltage(volt), current=Current(curr), power=Power(power))
+
     def close(self) -> None:
         self._driver.close()
 
@@ -127,6 +127,12 @@ class PFR100L50:
         """出力電力の実測"""
         return float(self._query_command(":MEAS:POW?"))
 
+    def measure_all(self) -> tuple[float, float, float]:
+        """出力電圧・電流・電力の実測 (1回のクエリでまとめて取得)"""
+        resp = self._query_command(":MEAS:VOLT?;:MEAS:CURR?;:MEAS:POW?")
+        volt, curr, power = (float(v) for v in resp.split(";"))
+        return volt, curr, power
+
     def set_output(self, state: bool) -> None:
         """出力 On/Off設定"""
         command = "ON" if state else "OFF"
@@ -2,6 +2,7 @@ import datetime
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import BinaryIO
 
 from gan_controller.core.constants import JST, LOG_DIR
 
@@ -90,6 +91,15 @@ class LogFile:
         except OSError as e:
             print(f"Error writing to log file {self.path}: {e}")
 
+    def open_append(self) -> BinaryIO:
+        """
+        追記用にバイナリモードで開く
+
+        連続して書き込む場合に使う (書き込みごとの開閉を避ける)。
+        書き込む内容は呼び出し側で encoding に従ってエンコードする。
+        """
+        return self.path.open("ab")
+
 
 class DateLogDirectory:
     """日付ごとのディレクトリとファイル連番を管理するクラス"""
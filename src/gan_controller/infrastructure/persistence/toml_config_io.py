@@ -1,3 +1,5 @@
+import functools
+import tempfile
 import tomllib
 from collections.abc import MutableMapping
 from pathlib import Path
@@ -8,45 +10,115 @@ from pydantic import BaseModel
 from tomlkit import TOMLDocument, item
 from tomlkit.items import Item, Table
 
+# 定義から生成したまま手が加えられていないファイル (パス -> 書き込んだ内容)
+# 内容が一致する間は、既存ファイルの読み直し (tomlkit の解析) をせずに生成し直す
+_generated_documents: dict[Path, str] = {}
+
 
 def load_toml_config[T: BaseModel](model_cls: type[T], path: str | Path) -> T:
-    """TOMLファイルからPydanticモデルを読み込む"""
-    path_obj = Path(path)
-    if not path_obj.exists():
+    """
+    TOMLファイルからPydanticモデルを読み込む
+
+    ファイルが前回から変わっていなければ (更新時刻・サイズが同じ)、解析済みの結果のコピーを返す。
+    """
+    loaded = _read_file_config(model_cls, Path(path))
+    if loaded is None:
         return model_cls()
 
+    # 呼び出し側で変更されてもキャッシュに影響しないようにコピーを返す
+    return loaded[1].model_copy(deep=True)
+
+
+def _read_file_config[T: BaseModel](
+    model_cls: type[T], path: Path
+) -> tuple[dict[str, Any], T] | None:
+    """
+    ファイルの現在の内容 (解析結果, 検証後のモデル)。ファイルが無いか読めなければNone
+
+    キャッシュを共有するため、どちらも変更しないこと。
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    return _load_toml_config_cached(model_cls, str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_toml_config_cached[T: BaseModel](
+    model_cls: type[T], path: str, _mtime_ns: int, _size: int
+) -> tuple[dict[str, Any], T] | None:
+    """TOMLの解析と検証 (引数のファイル状態ごとにキャッシュ)"""
     try:
-        with path_obj.open("rb") as f:
+        with Path(path).open("rb") as f:
             data = tomllib.load(f)
-        return model_cls.model_validate(data)
+        return data, model_cls.model_validate(data)
     except Exception as e:  # noqa: BLE001
         print(f"Config load error ({model_cls.__name__}): {e}")
-        return model_cls()
+        return None
+
 
+def save_toml_config(
+    model_instance: BaseModel, path: str | Path, *, raise_on_error: bool = False
+) -> None:
+    """
+    PydanticモデルをTOMLファイルに保存する (コメント保持)
+
+    書き込みは同じディレクトリの一時ファイルに書いてから置き換える。
+    (別スレッドからの読み込みで、書きかけのファイルを読まないようにする)
 
-def save_toml_config(model_instance: BaseModel, path: str | Path) -> None:
-    """PydanticモデルをTOMLファイルに保存する (コメント保持)"""
+    Args:
+        model_instance: 保存するモデル
+        path: 保存先
+        raise_on_error: Trueなら保存失敗時に例外を送出する (Falseならエラー表示のみ)
+
+    """
     path_obj = Path(path)
     new_data = model_instance.model_dump(mode="json")
+
+    # ファイルの内容と同じなら書き換えない (tomlkit での読み直し・書き出しを省く)
+    # 検証後のモデルではなく解析結果と比べる。欠けたキーを既定値で補って読めるファイル
+    # (旧バージョンの設定) は、キーと説明コメントを追加するために書き直す
+    loaded = _read_file_config(type(model_instance), path_obj)
+    if loaded is not None and loaded[0] == new_data:
+        return
+
     path_obj.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        if path_obj.exists():
+        # 存在確認と読み込みを分けず、1回のオープンで済ませる
+        try:
+            current_text = path_obj.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            current_text = None
+        is_generated = current_text is None or current_text == _generated_documents.get(path_obj)
+
+        if is_generated:
+            # 新規作成、または前回生成したまま (Pydanticのdescriptionからコメント生成)
+            doc = _generate_new_document(model_instance, new_data)
+
+        else:
             # 既存ファイルがある場合は読み込んで更新 (コメント構造を維持するため)
-            with path_obj.open("r", encoding="utf-8") as f:
-                doc = tomlkit.load(f)
+            doc = tomlkit.parse(cast("str", current_text))
             _append_fields_with_comments(doc, model_instance, new_data)
 
+        # 書き込み
+        text = tomlkit.dumps(doc)
+        _write_text_atomic(path_obj, text)
+
+        if is_generated:
+            _generated_documents[path_obj] = text
         else:
-            # 新規作成 (Pydanticのdescriptionからコメント生成)
-            doc = _generate_new_document(model_instance, new_data)
+            _generated_documents.pop(path_obj, None)
 
-        # 書き込み
-        with path_obj.open("w", encoding="utf-8") as f:
-            tomlkit.dump(doc, f)
+        # 更新時刻の分解能が粗いファイルシステムでも古い内容を返さないように破棄
+        _load_toml_config_cached.cache_clear()
 
-    except Exception as e:  # noqa: BLE001
+    except Exception as e:
         print(f"Config save error ({model_instance.__class__.__name__}): {e}")
+        if raise_on_error:
+            raise
 
 
 # ==========================================
@@ -54,32 +126,59 @@ def save_toml_config(model_instance: BaseModel, path: str | Path) -> None:
 # ==========================================
 
 
+def _write_text_atomic(path: Path, text: str) -> None:
+    """一時ファイルに書き込んでから置き換える (読み込み側には旧内容か新内容のどちらかが見える)"""
+    tmp_path: Path | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+            f.write(text)
+
+        tmp_path.replace(path)
+
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _generate_new_document(model_instance: BaseModel, dump_data: dict[str, Any]) -> TOMLDocument:
     """Pydantic定義を元にコメント付きTOMLドキュメントを生成"""
     doc = tomlkit.document()
-    _append_fields_with_comments(doc, model_instance, dump_data)
+    _append_fields_with_comments(doc, model_instance, dump_data, is_new=True)
     return doc
 
 
 def _append_fields_with_comments(
-    container: Table | TOMLDocument, model_instance: BaseModel, current_data: dict[str, Any]
+    container: Table | TOMLDocument,
+    model_instance: BaseModel,
+    current_data: dict[str, Any],
+    is_new: bool = False,
 ) -> None:
-    """フィールドとコメントを再帰的に追加"""
-    model_class = type(model_instance)
-    for field_name, field_info in model_class.model_fields.items():
+    """
+    フィールドとコメントを再帰的に追加
+
+    is_new=True (新規に作ったテーブル) の場合は既存キーが無いので、キーの検索を省いて追加だけ行う
+    (tomlkit のキー検索は遅い)。
+    """
+    fields = type(model_instance).model_fields
+    field_values = model_instance.__dict__  # getattr を通さず直接参照
+    for field_name, field_info in fields.items():
         if field_name not in current_data:
             continue
 
-        sub_model = getattr(model_instance, field_name)
+        sub_model = field_values[field_name]
         value = current_data[field_name]
         description = field_info.description
 
         if isinstance(value, dict) and isinstance(sub_model, BaseModel):
             # ネストされたPydanticモデルの場合
-            _process_nested_model(container, field_name, value, sub_model, description)
+            _process_nested_model(container, field_name, value, sub_model, description, is_new)
         else:
             # 通常の値 (またはBaseModelではない辞書)
-            _process_simple_value(container, field_name, value, description)
+            _process_simple_value(container, field_name, value, description, is_new)
 
 
 def _process_nested_model(
@@ -88,9 +187,10 @@ def _process_nested_model(
     value: dict,
     sub_model: BaseModel,
     description: str | None,
+    is_new: bool = False,
 ) -> None:
     """ネストされたモデル(テーブル)の再帰処理"""
-    if key in container:
+    if not is_new and key in container:
         # === 既存データの場合
         existing_table = container[key]
 
@@ -109,7 +209,7 @@ def _process_nested_model(
             new_table.comment(description)
 
         # 再帰呼び出し
-        _append_fields_with_comments(new_table, sub_model, value)
+        _append_fields_with_comments(new_table, sub_model, value, is_new=True)
         container.add(key, new_table)
 
 
@@ -118,9 +218,10 @@ def _process_simple_value(
     key: str,
     value: Any,  # noqa: ANN401
     description: str | None,
+    is_new: bool = False,
 ) -> None:
     """単純な値の更新または追加"""
-    if key in container:
+    if not is_new and key in container:
         # [既存] 値のみ更新 (既存コメントを維持)
         container[key] = value
 
@@ -1,4 +1,8 @@
+import atexit
+import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
 
@@ -9,6 +13,27 @@ from gan_controller.presentation.app_feature import FeatureFactory
 from gan_controller.presentation.main_window import MainWindow
 
 
+def setup_logging() -> None:
+    """
+    各モジュールの logger 出力 (INFO以上) をコンソールに表示
+
+    出力は QueueListener のスレッドで行い、測定スレッドはキューに積むだけで戻る
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)  # 終了時に残りを書き出す
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
 def run_app(argv: list[str]) -> int:
     ensure_runtime_dirs()
 
@@ -35,6 +60,8 @@ def main() -> None:
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "0"
     os.environ["QT_SCALE_FACTOR"] = "1"
 
+    setup_logging()
+
     sys.exit(run_app(sys.argv))
 
 
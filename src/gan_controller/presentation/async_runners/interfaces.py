@@ -11,6 +11,9 @@ class IExperimentObserver(Protocol):
     def on_error(self, message: str) -> None: ...
     def on_finished(self) -> None: ...
     def is_interruption_requested(self) -> bool: ...
+    def wait_for_interruption(self, timeout: float) -> bool:
+        """中断要求が来るまで最大 timeout 秒待機する (中断要求があればTrue)"""
+        ...
 
     def on_message(self, message: str) -> None: ...
 
@@ -1,4 +1,6 @@
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+import threading
+
+from PySide6.QtCore import QObject, Qt, QThread, Signal, Slot
 
 from gan_controller.core.domain.result import ExperimentResult
 
@@ -23,6 +25,9 @@ class _WorkerObserver(IExperimentObserver):
     def is_interruption_requested(self) -> bool:
         return self._worker.interruption_requested
 
+    def wait_for_interruption(self, timeout: float) -> bool:
+        return self._worker.wait_for_interruption(timeout)
+
     def on_message(self, message: str) -> None:
         self._worker.message_logged.emit(message)
 
@@ -38,9 +43,18 @@ class _ExperimentWorker(QObject):
     def __init__(self, workflow: IExperimentWorkflow) -> None:
         super().__init__()
         self._workflow = workflow
-        self.interruption_requested = False
+        # 待機中のWorkflowを即座に起こせるよう、中断要求はEventで持つ
+        self._interruption_event = threading.Event()
         self._is_finished_emitted = False
 
+    @property
+    def interruption_requested(self) -> bool:
+        return self._interruption_event.is_set()
+
+    def wait_for_interruption(self, timeout: float) -> bool:
+        """中断要求が来るまで最大 timeout 秒待機 (中断要求があればTrue)"""
+        return self._interruption_event.wait(timeout)
+
     def emit_finished_once(self) -> None:
         if self._is_finished_emitted:
             return
@@ -50,7 +64,7 @@ class _ExperimentWorker(QObject):
 
     @Slot()
     def run(self) -> None:
-        self.interruption_requested = False
+        self._interruption_event.clear()
         self._is_finished_emitted = False
         observer = _WorkerObserver(self)
         try:
@@ -61,7 +75,7 @@ class _ExperimentWorker(QObject):
             self.emit_finished_once()
 
     def stop(self) -> None:
-        self.interruption_requested = True
+        self._interruption_event.set()
 
 
 class AsyncExperimentManager(QObject):
@@ -90,17 +104,20 @@ class AsyncExperimentManager(QObject):
         self._worker.moveToThread(self._thread)
 
         # シグナル接続
+        # Worker -> Manager はスレッドを跨ぐため、明示的にキュー接続にする
+        # (Manager のシグナルはメインスレッドで再送出される)
+        queued = Qt.ConnectionType.QueuedConnection
         self._thread.started.connect(self._worker.run)
-        self._worker.result_observed.connect(self.step_result_observed)
-        self._worker.error_occurred.connect(self.error_occurred)
-        self._worker.message_logged.connect(self.message_logged)
+        self._worker.result_observed.connect(self.step_result_observed, queued)
+        self._worker.error_occurred.connect(self.error_occurred, queued)
+        self._worker.message_logged.connect(self.message_logged, queued)
 
         # 終了処理のチェーン
         self._worker.finished.connect(self._thread.quit)
         self._worker.finished.connect(self._worker.deleteLater)
         self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.finished.connect(self.finished)
-        self._thread.finished.connect(self._cleanup)
+        self._thread.finished.connect(self.finished, queued)
+        self._thread.finished.connect(self._cleanup, queued)
 
         self._thread.start()
 
@@ -3,6 +3,7 @@ from .graph import DualAxisGraph, GraphData
 from .labeled_item import LabeledItem
 from .no_scroll_spinbox import NoScrollDoubleSpinBox, NoScrollSpinBox
 from .sigfig_lineedit import SignificantFigureSpinBox
+from .spinbox_factory import create_double_spin_box
 from .value_label import ValueLabel
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "NoScrollSpinBox",
     "SignificantFigureSpinBox",
     "ValueLabel",
+    "create_double_spin_box",
 ]
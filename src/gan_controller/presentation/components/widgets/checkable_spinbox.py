@@ -1,6 +1,8 @@
 from PySide6.QtGui import QPalette
 from PySide6.QtWidgets import QCheckBox, QDoubleSpinBox, QGridLayout, QWidget
 
+from .spinbox_factory import create_double_spin_box
+
 
 class CheckableSpinBox(QWidget):
     """チェックボックスに連動するSpinBox作成"""
@@ -26,14 +28,14 @@ class CheckableSpinBox(QWidget):
         # 構成要素
         self.check_box = QCheckBox(label_text)
         self.check_box.setChecked(checked)
-        self.spin_box = QDoubleSpinBox(
-            value=value,
+        self.spin_box = create_double_spin_box(
+            value,
             prefix=prefix,
             suffix=suffix,
             decimals=decimals,
             minimum=minimum,
             maximum=maximum,
-            singleStep=single_step,
+            single_step=single_step,
         )
 
         # 配置
@@ -0,0 +1,60 @@
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    LTTB (Largest-Triangle-Three-Buckets) で残す点のインデックスを求める
+
+    先頭と末尾の点は必ず残す。間の点はバケットに分け、前後のバケットの平均点とで作る
+    三角形の面積が最大になる点をバケットごとに1点選ぶ (ピークなどの形状が残りやすい)。
+    本来のLTTBは直前に選んだ点を使うが、全バケットを一括計算できるよう前バケットの平均点で代用する。
+    y が NaN の点は、バケット内が全て NaN の場合を除いて選ばない。
+
+    Args:
+        x: x座標 (昇順)
+        y: y座標
+        n_out: 残す点数
+
+    Returns:
+        np.ndarray: 残す点のインデックス (昇順)
+
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:  # noqa: PLR2004
+        return np.arange(n)
+
+    # 先頭・末尾を除いた点を n_out - 2 個のバケットに分ける
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+
+    # バケットごとの平均点 (y は NaN を除いて平均)
+    finite = ~np.isnan(y)
+    y_sum = np.add.reduceat(np.where(finite, y, 0.0)[: n - 1], starts)
+    y_count = np.add.reduceat(finite[: n - 1], starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_y = y_sum / y_count
+    avg_x = np.add.reduceat(x[: n - 1], starts) / sizes
+
+    # 各バケットの前後の点 (両端は先頭・末尾の点)
+    prev_x = np.concatenate(([x[0]], avg_x[:-1]))
+    prev_y = np.concatenate(([y[0]], avg_y[:-1]))
+    next_x = np.concatenate((avg_x[1:], [x[-1]]))
+    next_y = np.concatenate((avg_y[1:], [y[-1]]))
+
+    # バケットを最大サイズに揃えた2次元インデックス (はみ出した分は無効)
+    offsets = np.arange(sizes.max())
+    idx = starts[:, None] + offsets[None, :]
+    valid = offsets[None, :] < sizes[:, None]
+    idx = np.minimum(idx, n - 1)
+
+    px, py = prev_x[:, None], prev_y[:, None]
+    areas = np.abs((px - next_x[:, None]) * (y[idx] - py) - (px - x[idx]) * (next_y[:, None] - py))
+    areas[~valid | np.isnan(areas)] = -1.0  # 無効な点・NaN は選ばない
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    indices[1:-1] = starts + np.argmax(areas, axis=1)
+
+    return indices
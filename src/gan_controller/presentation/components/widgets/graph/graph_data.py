@@ -1,48 +1,156 @@
-import math
-
+import numpy as np
 import pandas as pd
 
+# 初期確保する点数 (不足したら倍々で拡張)
+DEFAULT_INITIAL_CAPACITY = 1024
+
 
 class GraphData:
-    _data: pd.DataFrame
+    """
+    グラフ描画用の系列データ
+
+    x と各系列の y を事前確保したNumPy配列で保持する。
+    追加は末尾への書き込みのみで、描画側には配列のビュー (コピーなし) を渡す。
+    """
+
+    # 描画ごとに参照されるため、インスタンス辞書を持たせない
+    __slots__ = ("_count", "_max_capacity", "_x", "_ys")
 
-    def __init__(self) -> None:
-        self._data = pd.DataFrame()
+    _x: np.ndarray
+    _ys: dict[str, np.ndarray]
+    _count: int
+    _max_capacity: int | None
+
+    def __init__(
+        self,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        max_capacity: int | None = None,
+    ) -> None:
+        """
+        Args:
+            initial_capacity: 初期確保する点数
+            max_capacity: 保持する最大点数 (超えた分は古い点から捨てる)。Noneなら無制限
+
+        """
+        if max_capacity is not None:
+            initial_capacity = min(initial_capacity, max_capacity)
+
+        self._x = np.empty(max(initial_capacity, 1), dtype=np.float64)
+        self._ys = {}
+        self._count = 0
+        self._max_capacity = max_capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def labels(self) -> list[str]:
+        """保持している系列名"""
+        return list(self._ys)
 
     def append_point(self, x_value: float, y_values: dict[str, float]) -> None:
-        new_row = {"x": x_value}
-        new_row.update(y_values)
-        new_df = pd.DataFrame([new_row])
+        """1点追加"""
+        i = self._count
+        if i >= len(self._x):
+            self._ensure_capacity(i + 1)
+            i = self._count  # 上限時は古い点が捨てられて位置が変わる
+
+        self._x[i] = x_value
+        ys_map = self._ys
+        for label, y in y_values.items():
+            ys = ys_map.get(label)
+            if ys is None:
+                ys = self._series(label)
+            ys[i] = y
+
+        # 今回値が無かった系列は欠損扱い
+        if len(y_values) != len(self._ys):
+            for label, ys in self._ys.items():
+                if label not in y_values:
+                    ys[i] = np.nan
 
-        if self._data.empty:
-            self._data = new_df
-        else:
-            self._data = pd.concat([self._data, new_df], ignore_index=True)
+        self._count = i + 1
+
+    def append_points(self, x_values: np.ndarray, y_values: dict[str, np.ndarray]) -> None:
+        """複数点をまとめて追加"""
+        n = len(x_values)
+        if n == 0:
+            return
+
+        # 上限を超える分は最新側だけ残す
+        if self._max_capacity is not None and n > self._max_capacity:
+            x_values = x_values[-self._max_capacity :]
+            y_values = {label: ys[-self._max_capacity :] for label, ys in y_values.items()}
+            n = self._max_capacity
+
+        self._ensure_capacity(self._count + n)
+
+        start = self._count
+        end = start + n
+        self._x[start:end] = x_values
+        for label, ys in y_values.items():
+            self._series(label)[start:end] = ys
+
+        # 今回値が無かった系列は欠損扱い
+        if len(y_values) != len(self._ys):
+            for label, ys in self._ys.items():
+                if label not in y_values:
+                    ys[start:end] = np.nan
+
+        self._count = end
+
+    def x_view(self) -> np.ndarray:
+        """xの有効範囲のビュー (コピーなし)"""
+        return self._x[: self._count]
+
+    def y_view(self, label: str) -> np.ndarray:
+        """指定系列の有効範囲のビュー (コピーなし)"""
+        return self._ys[label][: self._count]
 
     def get_data(self) -> pd.DataFrame:
         """生の全データを取得"""
-        return self._data
+        data = {"x": self.x_view()}
+        data.update({label: self.y_view(label) for label in self._ys})
+        return pd.DataFrame(data)
 
-    def get_downsampled_data(self, max_points: int) -> "GraphData":
-        """
-        指定された点数以下になるようにデータを間引いて取得する。
+    # =========================================================================================
 
-        :param max_points: 最大データ点数
-        :return: 間引かれたGraphData (コピー)
-        """
-        new_instance = GraphData()
-        decimated_data = self._decimate(max_points)
+    def _series(self, label: str) -> np.ndarray:
+        """系列の配列を取得 (初出の系列は過去分を欠損値で確保)"""
+        ys = self._ys.get(label)
+        if ys is None:
+            ys = np.full(len(self._x), np.nan, dtype=np.float64)
+            self._ys[label] = ys
+
+        return ys
+
+    def _ensure_capacity(self, required: int) -> None:
+        """必要点数を書き込めるように配列を拡張 (上限時は古い点を捨てる)"""
+        capacity = len(self._x)
+        if required <= capacity:
+            return
+
+        if self._max_capacity is None or capacity < self._max_capacity:
+            new_capacity = max(capacity * 2, required)
+            if self._max_capacity is not None:
+                new_capacity = min(new_capacity, self._max_capacity)
 
-        new_instance._data = decimated_data
-        return new_instance
+            self._x = self._resized(self._x, new_capacity)
+            self._ys = {label: self._resized(ys, new_capacity) for label, ys in self._ys.items()}
 
-    def _decimate(self, max_points: int) -> pd.DataFrame:
-        """データ点が max_points 以下になるように間引いたGraphDataを新たに返す"""
-        total_len = len(self._data)
+            capacity = new_capacity
+            if required <= capacity:
+                return
 
-        if total_len <= max_points:
-            return self._data.copy()
+        # 上限到達: 古い点を捨てて前に詰める (毎回シフトしないように半分以上まとめて捨てる)
+        drop = min(max(required - capacity, capacity // 2, 1), self._count)
+        keep = self._count - drop
+        self._x[:keep] = self._x[drop : self._count]
+        for ys in self._ys.values():
+            ys[:keep] = ys[drop : self._count]
+        self._count = keep
 
-        # 間引きステップ数の計算
-        step = math.ceil(total_len / max_points)
-        return self._data.iloc[::step].copy()
+    def _resized(self, arr: np.ndarray, new_capacity: int) -> np.ndarray:
+        new_arr = np.full(new_capacity, np.nan, dtype=np.float64)
+        new_arr[: self._count] = arr[: self._count]
+        return new_arr
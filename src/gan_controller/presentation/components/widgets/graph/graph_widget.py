@@ -1,3 +1,4 @@
+import functools
 from typing import Any, Literal
 
 import numpy as np
@@ -9,8 +10,13 @@ from PySide6.QtCore import QSize, QTimer
 from PySide6.QtGui import QResizeEvent
 from PySide6.QtWidgets import QVBoxLayout, QWidget
 
+from .downsample import lttb_indices
 from .graph_data import GraphData
 
+# データがX軸の右端を超えたときに先へ確保する余白 (表示幅に対する割合)
+# 点を追加するたびに軸範囲が変わると全体再描画になるため、余白分はライン部分だけ再描画する
+X_HEADROOM_RATIO = 0.1
+
 
 class DebouncedFigureCanvas(FigureCanvasQTAgg):
     """リサイズ時の再描画を遅延させ、ウィンドウ操作を軽量化するCanvas"""
@@ -18,8 +24,8 @@ class DebouncedFigureCanvas(FigureCanvasQTAgg):
     def __init__(self, figure: Figure) -> None:
         super().__init__(figure)
 
-        # 遅延実行用のタイマー
-        self._resize_timer = QTimer()
+        # 遅延実行用のタイマー (Canvasと一緒に破棄する)
+        self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
         # 100ms待機 (サイズ変更から規定の時間経ったら、グラフ再描画)
         self._resize_timer.setInterval(100)
@@ -27,6 +33,8 @@ class DebouncedFigureCanvas(FigureCanvasQTAgg):
 
         # 最新の「サイズ」を保持
         self._pending_size: QSize | None = None
+        # 破棄済み (release 後) は描画しない
+        self._released = False
 
     def resizeEvent(self, event: QResizeEvent) -> None:  # noqa: N802
         """グラフ描画を即時実行せず、QWidgetのサイズ変更だけ先に行って描画を予約する"""
@@ -39,6 +47,26 @@ class DebouncedFigureCanvas(FigureCanvasQTAgg):
         # タイマーをリセット (サイズ変更からの時間計測)
         self._resize_timer.start()
 
+    def draw(self) -> None:
+        """描画 (破棄後は何もしない)"""
+        if self._released:
+            return
+
+        try:
+            super().draw()
+        except RuntimeError:
+            # 描画中に破棄された場合、最後の Qt への再描画要求が失敗するだけなので無視する
+            if not self._released:
+                raise
+
+    def release(self) -> None:
+        """破棄時の後始末 (予約済みの描画・リサイズ処理を取り消す)"""
+        self._released = True
+        self._resize_timer.stop()
+        self._pending_size = None
+        # draw_idle で予約された描画は、この値が False なら何もせずに終わる
+        self._draw_pending = False
+
     def _perform_delayed_resize(self) -> None:
         """タイマー発火後に呼ばれる描画処理"""
         if self._pending_size:
@@ -50,6 +78,13 @@ class DebouncedFigureCanvas(FigureCanvasQTAgg):
             super().resizeEvent(new_event)
 
 
+def _release_canvas(canvas: DebouncedFigureCanvas, cids: tuple[int, ...]) -> None:
+    """DualAxisGraph の破棄時に Canvas の予約処理とコールバックを外す"""
+    canvas.release()
+    for cid in cids:
+        canvas.mpl_disconnect(cid)
+
+
 class DualAxisGraph(QWidget):
     """2軸データ(左・右) を表示するグラフウィジェット"""
 
@@ -63,9 +98,11 @@ class DualAxisGraph(QWidget):
 
     _series_map: dict[str, dict]
     _visible_x_span: int | float | None
+    _max_draw_points: int | None
 
     _legend_loc: str
     _current_data_source: GraphData | None
+    _background: Any  # ライン以外を描画済みの背景 (blit用)
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -86,10 +123,21 @@ class DualAxisGraph(QWidget):
         # key: ラベル名, value: { 'line': Line2D, 'axis': 'left'|'right', ... }
         self._series_map: dict[str, dict] = {}
         self._visible_x_span: int | float | None = None  # x軸の表示幅
+        self._max_draw_points: int | None = None  # 1ラインあたりの最大描画点数
 
         self._legend_loc: str = "best"  # 凡例場所
         self._current_data_source: GraphData | None = None  # 現在表示しているデータ
 
+        # ラインは animated にして背景から外し、全体描画のたびに背景を保存して上に描き足す
+        self._background = None
+        self._canvas_cids = (
+            self.canvas.mpl_connect("draw_event", self._on_draw),
+            # サイズ変更後は再描画されるまで古い背景を使わない
+            self.canvas.mpl_connect("resize_event", self._on_resize),
+        )
+        # 破棄後に予約済みの描画が走らないよう、破棄時に描画予約とコールバックを外す
+        self.destroyed.connect(functools.partial(_release_canvas, self.canvas, self._canvas_cids))
+
         self._sci_formatter = FuncFormatter(self._sci_mathtext)
         self._init_styles()
 
@@ -138,6 +186,7 @@ class DualAxisGraph(QWidget):
             "label": display_name,
             "color": color,
             "linewidth": 1.5,
+            "animated": True,
             **kwargs,
         }
         if marker is not None:
@@ -151,50 +200,197 @@ class DualAxisGraph(QWidget):
 
         self.set_legend_location()
 
-    def _update_axes_limits(self) -> None:
-        """現在のデータとvisible_x_spanに基づいて軸の表示範囲を更新"""
-        if self._current_data_source is None:
-            return
+    def _update_axes_limits(self, force: bool = False) -> bool:
+        """
+        現在のデータとvisible_x_spanに基づいて軸の表示範囲を更新
 
-        df = self._current_data_source.get_data()
-        if df.empty or "x" not in df.columns:
-            return
+        X軸はデータが表示範囲の右端を超えたとき (または force 指定時) だけ、余白付きで更新する。
+
+        Returns:
+            bool: 表示範囲が変わった場合はTrue
+
+        """
+        if self._current_data_source is None or len(self._current_data_source) == 0:
+            return False
+
+        old_limits = (self.ax_left.get_xlim(), self.ax_left.get_ylim(), self.ax_right.get_ylim())
 
         # Y軸のオートスケール
         self.ax_left.relim()
-        self.ax_left.autoscale_view()
+        self.ax_left.autoscale_view(scalex=False)
         self.ax_right.relim()
-        self.ax_right.autoscale_view()
+        self.ax_right.autoscale_view(scalex=False)
+
+        x_data = self._current_data_source.x_view()
+        x_min = float(np.nanmin(x_data))
+        current_x = float(x_data[-1])
+        if force or current_x > old_limits[0][1]:
+            self._set_x_limits(x_min, current_x)
+
+        new_limits = (self.ax_left.get_xlim(), self.ax_left.get_ylim(), self.ax_right.get_ylim())
+        return new_limits != old_limits
+
+    def _set_x_limits(self, x_min: float, current_x: float) -> None:
+        """最新点の先に余白をとってX軸範囲を設定"""
+        if self._visible_x_span is not None:
+            right = current_x + self._visible_x_span * X_HEADROOM_RATIO
+            left = max(x_min, right - self._visible_x_span)
+        else:
+            left = x_min
+            right = current_x + (current_x - x_min) * X_HEADROOM_RATIO
 
-        x_data = df["x"].values
-        if self._visible_x_span is not None and len(x_data) > 1:
-            current_x = x_data[-1]
-            min_x = max(min(x_data), current_x - self._visible_x_span)
-            self.ax_left.set_xlim(min_x, current_x)
+        if right <= left:
+            # 1点のみなど幅が取れない場合は matplotlib の自動調整に任せる
+            self.ax_left.set_xlim(left, current_x)
         else:
-            self.ax_left.set_xlim(min(x_data), max(x_data))
+            self.ax_left.set_xlim(left, right)
 
     def update_plot(self, data_source: GraphData) -> None:
         """データソースをもとにグラフを再描画"""
         # データソースを保持 (span変更時の即時反映用)
         self._current_data_source = data_source
-
-        df = data_source.get_data()
-        if df.empty or "x" not in df.columns:
+        if len(data_source) == 0:
             return
 
         # データ更新
-        x_data = df["x"].values
-        for label, meta in self._series_map.items():
-            if label in df.columns:
-                y_data = df[label].values
-                meta["line"].set_data(x_data, y_data)
+        self._set_lines_data(data_source)
 
         # 軸範囲の更新
-        self._update_axes_limits()
+        self._update_axes_limits(force=True)
         self.figure.tight_layout()
         self.canvas.draw_idle()
 
+    def append_point(self, x_value: float, y_values: dict[str, float], redraw: bool = True) -> None:
+        """
+        1点追加して描画を更新する。
+
+        データはグラフ側で保持し、ラインには保持配列のビューをそのまま渡す。
+        redraw=False の場合は追加のみ行い、描画は refresh() 呼び出しまで保留する。
+        """
+        if self._current_data_source is None:
+            self._current_data_source = GraphData()
+
+        self._current_data_source.append_point(x_value, y_values)
+
+        if redraw:
+            self.refresh()
+
+    def append_points(
+        self, x_values: np.ndarray, y_values: dict[str, np.ndarray], redraw: bool = True
+    ) -> None:
+        """複数点をまとめて追加して描画を更新する (redraw=False の場合は描画を保留)"""
+        if self._current_data_source is None:
+            self._current_data_source = GraphData()
+
+        self._current_data_source.append_points(x_values, y_values)
+
+        if redraw:
+            self.refresh()
+
+    def refresh(self) -> None:
+        """
+        保持しているデータでラインを更新して再描画する。
+
+        軸範囲が変わらなければ、保存済みの背景にラインだけを描き足す (blit)。
+        ラインは軸の内側にクリップされるので、書き換えるのは軸の領域だけ。
+        """
+        if self._current_data_source is None or len(self._current_data_source) == 0:
+            return
+
+        self._set_lines_data(self._current_data_source)
+        limits_changed = self._update_axes_limits()
+
+        if limits_changed or self._background is None:
+            self.canvas.draw_idle()  # 目盛り等も変わるので全体を再描画
+            return
+
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.ax_left.bbox)
+
+    def _on_draw(self, _event: object) -> None:
+        """全体描画後に背景を保存し、ラインを描き足す"""
+        self._background = self.canvas.copy_from_bbox(self.ax_left.bbox)
+        self._draw_lines()
+
+    def _clear_downsampled(self) -> None:
+        for meta in self._series_map.values():
+            meta.pop("downsampled", None)
+
+    def _on_resize(self, _event: object) -> None:
+        self._background = None
+
+    def _draw_lines(self) -> None:
+        for meta in self._series_map.values():
+            self.figure.draw_artist(meta["line"])
+
+    def _set_lines_data(self, data_source: GraphData) -> None:
+        """
+        各ラインにデータをセット
+
+        表示幅が決まっている場合は、表示され得る範囲 (最新点から表示幅以内) だけを渡す。
+        最大描画点数以下ならビューをそのまま渡し、超える場合はLTTBで間引いた点を渡す。
+        """
+        x_data = data_source.x_view()
+        start = self._visible_start_index(x_data)
+        x_data = x_data[start:]
+        labels = data_source.labels
+        max_points = self._effective_max_points()
+        for label, meta in self._series_map.items():
+            if label not in labels:
+                continue
+
+            y_data = data_source.y_view(label)[start:]
+            if max_points is None or len(x_data) <= max_points:
+                meta["line"].set_data(x_data, y_data)
+            else:
+                meta["line"].set_data(*self._downsampled(meta, x_data, y_data, max_points))
+
+    def _visible_start_index(self, x_data: np.ndarray) -> int:
+        """
+        表示され得る最初の点の位置 (表示幅が無ければ0)
+
+        X軸の右端は常に最新点以上なので、最新点から表示幅より前の点は表示されない。
+        線が左端で途切れないように、範囲外の点を1点だけ含める。
+        """
+        if self._visible_x_span is None or len(x_data) == 0:
+            return 0
+
+        first_visible = float(x_data[-1]) - self._visible_x_span
+        return max(int(np.searchsorted(x_data, first_visible)) - 1, 0)
+
+    def _effective_max_points(self) -> int | None:
+        """実際に使う最大描画点数 (軸の横幅1pxあたり最大2点まで。それ以上は重なって見えない)"""
+        if self._max_draw_points is None:
+            return None
+
+        pixel_width = int(self.ax_left.bbox.width)
+        if pixel_width <= 0:
+            return self._max_draw_points
+
+        return min(self._max_draw_points, 2 * pixel_width)
+
+    def _downsampled(
+        self, meta: dict, x_data: np.ndarray, y_data: np.ndarray, max_points: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """LTTBで間引いたデータ (データが変わらない間は前回の結果を使う)"""
+        # 追加のみ (上限時は先頭側を捨てる) なので、点数と両端のxが同じなら同じデータ
+        cache_key = (len(x_data), float(x_data[0]), float(x_data[-1]), max_points)
+        cached = meta.get("downsampled")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1], cached[2]
+
+        # 対数軸は表示上の形状に合わせて対数で面積を比較する
+        ax = self.ax_left if meta["target_axis"] == "left" else self.ax_right
+        shape_y = y_data
+        if ax.get_yscale() == "log":
+            shape_y = np.log10(np.where(y_data > 0, y_data, np.nan))
+
+        idx = lttb_indices(x_data, shape_y, max_points)
+        result = (x_data[idx], y_data[idx])
+        meta["downsampled"] = (cache_key, *result)
+        return result
+
     def clear_view(self) -> None:
         """表示をクリア"""
         self._current_data_source = None
@@ -204,6 +400,7 @@ class DualAxisGraph(QWidget):
             series["line"].remove()
 
         self._series_map.clear()
+        self._background = None
         self.canvas.draw_idle()
 
     # =========================================================================================
@@ -236,6 +433,7 @@ class DualAxisGraph(QWidget):
         """軸のスケール設定 (線形 or 対数)"""
         ax = self.ax_left if target == "left" else self.ax_right
         ax.set_yscale(scale)
+        self._clear_downsampled()  # 間引きは軸スケールに依存する
 
     def set_legend_location(self, loc: str | None = None, fontsize: str = "x-small") -> None:
         """凡例の場所指定 (matplotlibのloc準拠: 'upper right', 'upper left' etc)"""
@@ -270,6 +468,13 @@ class DualAxisGraph(QWidget):
 
         self.canvas.draw_idle()
 
+    def set_max_draw_points(self, max_points: int | None) -> None:
+        """1ラインあたりの最大描画点数を設定する (超えた分はLTTBで間引く。Noneなら全点を描画)"""
+        self._max_draw_points = max_points
+        self._clear_downsampled()
+        if self._current_data_source:
+            self.update_plot(self._current_data_source)
+
     def set_visible_x_span(self, visible_x_span: float | None) -> None:
         """
         グラフのX軸の表示幅を設定する。
@@ -280,8 +485,10 @@ class DualAxisGraph(QWidget):
         """
         self._visible_x_span = visible_x_span
         if self._current_data_source:
-            # キャッシュされているデータを使って軸範囲だけ更新
-            self._update_axes_limits()
+            # 描画範囲が変わるので、保持しているデータからラインを作り直して軸範囲を更新
+            self._set_lines_data(self._current_data_source)
+            self._update_axes_limits(force=True)
+            self._background = None
             self.canvas.draw_idle()
 
     def set_series_legend_label(self, series_key: str, new_label: str) -> None:
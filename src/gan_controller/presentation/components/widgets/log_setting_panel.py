@@ -1,4 +1,4 @@
-from PySide6.QtCore import QEvent, Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QGroupBox,
@@ -21,6 +21,7 @@ class CommonLogSettingPanel(QGroupBox):
 
     next_num_label: QLabel
     _preview_refresh_timer: QTimer
+    _values: dict  # 入力値のキャッシュ (変更シグナルで更新)
 
     # 設定変更通知用シグナル
     config_changed = Signal()
@@ -30,12 +31,16 @@ class CommonLogSettingPanel(QGroupBox):
     def __init__(self, title: str = "Log Setting", parent: QWidget | None = None) -> None:
         super().__init__(title, parent)
         self._init_ui()
+        self._values = {
+            "update_date_folder": self.chk_date_update.isChecked(),
+            "update_major_number": self.chk_major_update.isChecked(),
+            "comment": self.comment_edit.text(),
+        }
         self._init_signals()
         self._init_timer()
 
     def _init_ui(self) -> None:
         self._main_layout = QVBoxLayout(self)
-        self.setLayout(self._main_layout)
 
         checks_layout = QHBoxLayout()
         self.chk_date_update = QCheckBox("日付フォルダ更新")
@@ -68,8 +73,23 @@ class CommonLogSettingPanel(QGroupBox):
         self._main_layout.addLayout(comment_layout)
 
     def _init_signals(self) -> None:
-        self.chk_date_update.toggled.connect(self._on_changed)
-        self.chk_major_update.toggled.connect(self._on_changed)
+        self.chk_date_update.toggled.connect(self._on_date_update_toggled)
+        self.chk_major_update.toggled.connect(self._on_major_update_toggled)
+        self.comment_edit.textChanged.connect(self._on_comment_changed)
+
+    @Slot(bool)
+    def _on_date_update_toggled(self, checked: bool) -> None:
+        self._values["update_date_folder"] = checked
+        self._on_changed()
+
+    @Slot(bool)
+    def _on_major_update_toggled(self, checked: bool) -> None:
+        self._values["update_major_number"] = checked
+        self._on_changed()
+
+    @Slot(str)
+    def _on_comment_changed(self, text: str) -> None:
+        self._values["comment"] = text
 
     def _on_changed(self) -> None:
         self.config_changed.emit()
@@ -80,6 +100,7 @@ class CommonLogSettingPanel(QGroupBox):
         self._preview_refresh_timer.timeout.connect(self._emit_preview_refresh_if_needed)
         self._preview_refresh_timer.start()
 
+    @Slot()
     def _emit_preview_refresh_if_needed(self) -> None:
         if self.isVisible() and self.isEnabled():
             self.preview_refresh_requested.emit()
@@ -112,12 +133,8 @@ class CommonLogSettingPanel(QGroupBox):
     # =======================================================================================
 
     def get_values(self) -> dict:
-        """現在のUIの値を辞書形式で返す"""
-        return {
-            "update_date_folder": self.chk_date_update.isChecked(),
-            "update_major_number": self.chk_major_update.isChecked(),
-            "comment": self.comment_edit.text(),
-        }
+        """現在のUIの値を辞書形式で返す (ウィジェットには問い合わせず、キャッシュのコピーを返す)"""
+        return dict(self._values)
 
     def set_values(self, update_date: bool, major_update: bool, comment: str) -> None:
         """値をUIにセットする"""
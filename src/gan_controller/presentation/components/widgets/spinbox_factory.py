@@ -0,0 +1,31 @@
+from PySide6.QtWidgets import QDoubleSpinBox, QWidget
+
+
+def create_double_spin_box(
+    value: float = 0.0,
+    *,
+    minimum: float = 0.0,
+    maximum: float = 99.99,
+    decimals: int = 2,
+    single_step: float = 1.0,
+    prefix: str = "",
+    suffix: str = "",
+    parent: QWidget | None = None,
+) -> QDoubleSpinBox:
+    """
+    QDoubleSpinBox を作成して設定をまとめて反映する
+
+    コンストラクタ引数での設定は指定順に反映されるため、範囲より先に値を渡すと
+    既定の範囲 (0 ~ 99.99) で丸められてしまう。
+    桁数 → 範囲 → 刻み・表示 → 値 の順に、シグナルを止めたまま設定する。
+    """
+    spin = QDoubleSpinBox(parent)
+    spin.blockSignals(True)
+    spin.setDecimals(decimals)
+    spin.setRange(minimum, maximum)
+    spin.setSingleStep(single_step)
+    spin.setPrefix(prefix)
+    spin.setSuffix(suffix)
+    spin.setValue(value)
+    spin.blockSignals(False)
+    return spin
@@ -1,9 +1,12 @@
+import math
 from collections.abc import Callable
 from typing import Any
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QLabel, QWidget
 
+from gan_controller.core.domain.quantity import Quantity
+
 # フォーマッター型定義
 FormatterType = str | Callable[[Any], str]
 
@@ -28,9 +31,13 @@ class ValueLabel(QLabel):
         """)
 
         self._default_formatter = formatter
+        self._last_value: Any = None
+        self._has_last_value = False  # 既定のフォーマットで表示した値を保持しているか
         self.setValue(value)
 
     def setValue(self, value: Any, formatter: FormatterType | None = None) -> None:  # noqa: ANN401, N802
+        self._last_value = value
+        self._has_last_value = formatter is None
         # 表示形式に特別な指定があれば、それでフォーマット
         fmt = formatter if formatter is not None else self._default_formatter
 
@@ -51,3 +58,30 @@ class ValueLabel(QLabel):
             text = str(value)
 
         self.setText(text)
+
+    def set_if_changed(self, value: Any) -> bool:  # noqa: ANN401
+        """
+        前回表示した値から変化している場合のみ表示を更新する。
+
+        Returns:
+            bool: 表示を更新した場合はTrue
+
+        """
+        if self._has_last_value and _is_same_value(self._last_value, value):
+            return False
+
+        self.setValue(value)
+        return True
+
+
+def _is_same_value(old: Any, new: Any) -> bool:  # noqa: ANN401
+    """表示が変わらない値かどうか (浮動小数点は許容誤差付きで比較)"""
+    if isinstance(old, Quantity) and isinstance(new, Quantity):
+        if (old.unit, old.display_prefix) != (new.unit, new.display_prefix):
+            return False
+        return math.isclose(old.base_value, new.base_value, rel_tol=1e-9)
+
+    if isinstance(old, float) and isinstance(new, float):
+        return math.isclose(old, new, rel_tol=1e-9)
+
+    return type(old) is type(new) and old == new
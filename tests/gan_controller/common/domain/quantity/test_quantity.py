@@ -67,6 +67,17 @@ class TestQuantity:
         with pytest.raises(ValueError, match="cannot be used with unit 'V'"):
             Quantity(10, "%V")
 
+    def test_repeated_unit(self) -> None:
+        """同じ単位文字列で繰り返し生成しても結果が変わらないか (解析結果のキャッシュ)"""
+        for value in (1.0, 2.5):
+            q = Quantity(value, "mV")
+            assert q.base_value == pytest.approx(value * 1e-3)
+            assert q.unit == "V"
+            assert format(q, ".1f") == f"{value:.1f} mV"
+
+        with pytest.raises(ValueError, match="Invalid unit"):
+            Quantity(10, "invalid_unit")  # 失敗はキャッシュされず毎回エラーになる
+
 
 class TestFactory:
     def test_factory_time(self) -> None:
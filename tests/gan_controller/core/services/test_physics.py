@@ -0,0 +1,20 @@
+import pytest
+
+from gan_controller.core.constants import ELEMENTARY_CHARGE, PLANCK_CONSTANT, SPEED_OF_LIGHT
+from gan_controller.core.services.physics import calculate_quantum_efficiency
+
+
+def test_calculate_quantum_efficiency_matches_formula() -> None:
+    current, power, wavelength_nm = 1.2e-6, 3.01e-3, 406.0
+
+    expected = (current * PLANCK_CONSTANT * SPEED_OF_LIGHT) / (
+        ELEMENTARY_CHARGE * power * wavelength_nm * 1e-9
+    )
+
+    assert calculate_quantum_efficiency(current, power, wavelength_nm) == pytest.approx(
+        expected * 100.0
+    )
+
+
+def test_calculate_quantum_efficiency_returns_zero_without_power() -> None:
+    assert calculate_quantum_efficiency(1e-6, 0.0, 406.0) == 0.0
@@ -0,0 +1,26 @@
+import datetime
+from pathlib import Path
+
+from gan_controller.core.constants import JST
+from gan_controller.features.heat_cleaning.domain.config import ProtocolConfig
+from gan_controller.features.heat_cleaning.infrastructure.persistence.recorder import (
+    HCLogRecorder,
+)
+from gan_controller.infrastructure.persistence.log_manager import LogFile
+
+
+def test_record_header_writes_whole_header_at_once(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]HC-20260101000000.dat")
+    writes: list[str] = []
+    log_file.write = writes.append  # type: ignore[method-assign]
+    config = ProtocolConfig()
+    recorder = HCLogRecorder(log_file, config)
+
+    recorder.record_header(datetime.datetime(2026, 1, 1, 12, 34, 56, tzinfo=JST))
+
+    assert len(writes) == 1
+    lines = writes[0].splitlines()
+    assert lines[0] == "#Heat Cleaning monitor"
+    assert "#Time:\t12:34:56" in lines
+    assert sum(line.startswith("#Sequence") for line in lines) == len(config.get_sequences())
+    assert lines[-1] == "\t".join(c.header for c in recorder.columns)
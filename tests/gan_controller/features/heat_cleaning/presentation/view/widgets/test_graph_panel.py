@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import numpy as np
+from pytestqt.qtbot import QtBot
+
+from gan_controller.core.domain.electricity import ElectricMeasurement
+from gan_controller.core.domain.quantity import Current, Power, Pressure, Temperature, Time, Voltage
+from gan_controller.features.heat_cleaning.presentation.view.widgets.graph_panel import HCGraphPanel
+
+
+def _result(t_hour: float, heater_w: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        timestamp_total=Time(t_hour, "hour"),
+        temperature_case=Temperature(500.0),
+        pressure_ext=Pressure(1e-7),
+        pressure_sip=Pressure(2e-7),
+        electricity_hc=ElectricMeasurement(Voltage(1.0), Current(heater_w), Power(heater_w)),
+        electricity_amd=ElectricMeasurement(Voltage(0.0), Current(0.0), Power(0.0)),
+    )
+
+
+def test_append_data_accumulates_in_graphs(qtbot: QtBot) -> None:
+    panel = HCGraphPanel()
+    qtbot.addWidget(panel)
+
+    panel.append_data(_result(0.0, 1.0))
+    panel.append_data(_result(0.5, 2.0))
+
+    data = panel.graph_power._current_data_source  # noqa: SLF001
+    assert data is not None
+    np.testing.assert_allclose(data.x_view(), [0.0, 0.5])
+    np.testing.assert_allclose(data.y_view("heater_power"), [1.0, 2.0])
+
+    data = panel.graph_pressure._current_data_source  # noqa: SLF001
+    assert data is not None
+    np.testing.assert_allclose(data.y_view("sip_pres"), [2e-7, 2e-7])
+
+    # クリアで保持データも捨てる
+    panel.clear_graph()
+    assert panel.graph_power._current_data_source is None  # noqa: SLF001
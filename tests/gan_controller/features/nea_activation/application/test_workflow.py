@@ -1,8 +1,12 @@
 import datetime
-import queue
+import logging
+import time
+from collections import deque
 from types import SimpleNamespace
 
 import pytest
+import pyvisa
+import pyvisa.constants
 
 from gan_controller.core.domain.quantity import Current, Resistance, Time, Value, Voltage
 from gan_controller.core.domain.result import ExperimentResult
@@ -27,6 +31,9 @@ class _DummyObserver(IExperimentObserver):
     def is_interruption_requested(self) -> bool:
         return False
 
+    def wait_for_interruption(self, _timeout: float) -> bool:
+        return False
+
     def on_message(self, message: str) -> None:
         pass
 
@@ -38,6 +45,9 @@ class _DummyRecorder:
     def record_header(self, _start_time: datetime.datetime) -> None:
         self.header_called = True
 
+    def close(self) -> None:
+        pass
+
     def record_data(self, result: object, comment: str = "") -> None:
         pass
 
@@ -81,7 +91,7 @@ def test_execute_initializes_facade_before_measurement_loop(
     facade = _DummyFacade()
     backend = _DummyBackend(facade)
     recorder = _DummyRecorder()
-    workflow = NEAActivationWorkflow(backend, recorder, config, queue.Queue())
+    workflow = NEAActivationWorkflow(backend, recorder, config, deque(maxlen=1))
 
     loop_called = False
 
@@ -107,6 +117,8 @@ class _MeasurementFacade:
         self.photocurrent_reads = 0
         self.last_dark_voltage = None
         self.last_dark_current = None
+        self.sensor_reads = 0
+        self.last_sensors = None
 
     def set_laser_emission(self, enable: bool) -> None:
         self.emission_calls.append(enable)
@@ -117,9 +129,14 @@ class _MeasurementFacade:
         self.photocurrent_reads += 1
         return Voltage(12.0, "m"), Current(1.2e-6)
 
+    def read_sensors(self) -> SimpleNamespace:
+        self.sensor_reads += 1
+        return SimpleNamespace(ext_pressure=3.0)
+
     def read_metrics(self, **kwargs: object) -> SimpleNamespace:
         self.last_dark_voltage = kwargs["dark_pc_voltage"]
         self.last_dark_current = kwargs["dark_pc"]
+        self.last_sensors = kwargs["sensors"]
         return SimpleNamespace(quantum_efficiency=1.0, photocurrent=2.0, ext_pressure=3.0)
 
     def apply_control_params(self, _params: NEAControlConfig) -> None:
@@ -142,14 +159,78 @@ def test_execute_single_measurement_fixed_background_skips_laser_control(
 
     facade = _MeasurementFacade()
     recorder = _DummyRecorder()
-    workflow = NEAActivationWorkflow(_DummyBackend(_DummyFacade()), recorder, config, queue.Queue())
+    workflow = NEAActivationWorkflow(
+        _DummyBackend(_DummyFacade()), recorder, config, deque(maxlen=1)
+    )
     workflow._observer = _DummyObserver()  # noqa: SLF001
 
     monkeypatch.setattr(workflow, "_notify_result", lambda _result: None)
 
-    success = workflow._execute_single_measurement(facade, start_perf=0.0)  # noqa: SLF001
+    success = workflow._execute_single_measurement(facade, start_ns=0)  # noqa: SLF001
 
     assert success is True
     assert facade.emission_calls == []
     assert facade.photocurrent_reads == 1
     assert facade.last_dark_voltage == config.condition.fixed_background_volt
+    assert facade.sensor_reads == 1
+    assert facade.last_sensors is not None
+
+
+def test_get_latest_config_from_queue_returns_only_latest() -> None:
+    request_queue: deque[NEAControlConfig] = deque(maxlen=1)
+    workflow = NEAActivationWorkflow(
+        _DummyBackend(_DummyFacade()), _DummyRecorder(), NEAConfig(), request_queue
+    )
+
+    first = NEAControlConfig()
+    second = NEAControlConfig()
+    request_queue.append(first)
+    request_queue.append(second)
+
+    assert workflow._get_latest_config_from_queue() is second  # noqa: SLF001
+    assert workflow._get_latest_config_from_queue() is None  # noqa: SLF001
+
+
+def test_sensor_read_error_is_raised_in_caller_thread() -> None:
+    config = NEAConfig()
+    config.condition.stabilization_time = Time(0)
+
+    facade = _MeasurementFacade()
+
+    def _fail() -> None:
+        msg = "sensor failure"
+        raise RuntimeError(msg)
+
+    facade.read_sensors = _fail  # type: ignore[method-assign]
+    workflow = NEAActivationWorkflow(
+        _DummyBackend(_DummyFacade()), _DummyRecorder(), config, deque(maxlen=1)
+    )
+    workflow._observer = _DummyObserver()  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match="sensor failure"):
+        workflow._execute_single_measurement(facade, start_ns=0)  # noqa: SLF001
+
+    # 読み取りに失敗しても Dark の積分測定までは進まない
+    assert facade.emission_calls == [True, False]
+    assert facade.photocurrent_reads == 1
+
+
+def test_timeout_warnings_are_rate_limited(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    workflow = NEAActivationWorkflow(
+        _DummyBackend(_DummyFacade()), _DummyRecorder(), NEAConfig(), deque(maxlen=1)
+    )
+    error = pyvisa.errors.VisaIOError(pyvisa.constants.VI_ERROR_TMO)
+    now_ns = [0]
+    monkeypatch.setattr(time, "perf_counter_ns", lambda: now_ns[0])
+
+    with caplog.at_level(logging.WARNING):
+        for _ in range(3):
+            workflow._handle_visa_error(error)  # noqa: SLF001
+        now_ns[0] = NEAActivationWorkflow.TIMEOUT_WARNING_INTERVAL_NS
+        workflow._handle_visa_error(error)  # noqa: SLF001
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert len(messages) == 2
+    assert messages[1].endswith("2 suppressed)")
@@ -0,0 +1,86 @@
+from unittest.mock import MagicMock
+
+from gan_controller.core.domain.app_config import DevicesConfig
+from gan_controller.core.domain.quantity import Current, Power
+from gan_controller.features.nea_activation.domain.config import NEAControlConfig
+from gan_controller.features.nea_activation.domain.models import NEADevices
+from gan_controller.features.nea_activation.infrastructure.hardware.facade import (
+    NEAHardwareFacade,
+)
+
+
+def _create_facade() -> tuple[NEAHardwareFacade, MagicMock, MagicMock]:
+    laser = MagicMock()
+    aps = MagicMock()
+    devices = NEADevices(logger=MagicMock(), aps=aps, laser=laser)
+    return NEAHardwareFacade(devices, DevicesConfig()), laser, aps
+
+
+def test_apply_control_params_writes_only_changed_values() -> None:
+    facade, laser, aps = _create_facade()
+    params = NEAControlConfig(amd_enable=True, amd_output_current=Current(3.5))
+
+    facade.apply_control_params(params)
+    assert laser.set_channel_power.call_count == 1
+    assert aps.set_current.call_count == 1
+    assert aps.set_output.call_count == 1
+
+    # 同じ値の再適用では何も書き込まない
+    facade.apply_control_params(params.model_copy())
+    assert laser.set_channel_power.call_count == 1
+    assert aps.set_current.call_count == 1
+    assert aps.set_output.call_count == 1
+
+    # 変わった項目だけ書き込む
+    facade.apply_control_params(params.model_copy(update={"laser_power_sv": Power(20, "m")}))
+    assert laser.set_channel_power.call_count == 2
+    assert aps.set_current.call_count == 1
+
+    facade.apply_control_params(params.model_copy(update={"amd_enable": False}))
+    aps.set_output.assert_called_with(False)
+    assert aps.set_output.call_count == 2
+
+
+def test_apply_control_params_rewrites_all_after_emergency_stop() -> None:
+    facade, laser, aps = _create_facade()
+    params = NEAControlConfig(amd_enable=True)
+
+    facade.apply_control_params(params)
+    facade.emergency_stop()
+    facade.apply_control_params(params)
+
+    assert laser.set_channel_power.call_count == 2
+    assert aps.set_current.call_count == 2
+    aps.set_output.assert_called_with(True)
+
+
+def test_apply_control_params_writes_current_when_output_is_enabled() -> None:
+    """出力OFF中に変えた電流値は、同じ値のままONにしても書き込まれる"""
+    facade, _, aps = _create_facade()
+    params = NEAControlConfig(amd_enable=True, amd_output_current=Current(1.0))
+    facade.apply_control_params(params)
+
+    facade.apply_control_params(params.model_copy(update={"amd_enable": False}))
+    disabled = params.model_copy(update={"amd_enable": False, "amd_output_current": Current(2.0)})
+    facade.apply_control_params(disabled)
+    assert aps.set_current.call_count == 1
+
+    facade.apply_control_params(disabled.model_copy(update={"amd_enable": True}))
+    assert aps.set_current.call_count == 2
+    assert aps.set_current.call_args.args[0].base_value == 2.0
+    aps.set_output.assert_called_with(True)
+
+
+def test_apply_control_params_compares_in_base_units() -> None:
+    """表示接頭辞に依らず、わずかな変更も書き込む"""
+    facade, _, aps = _create_facade()
+    params = NEAControlConfig(amd_enable=True, amd_output_current=Current(1.0))
+    facade.apply_control_params(params)
+
+    facade.apply_control_params(params.model_copy(update={"amd_output_current": Current(1.0001)}))
+    assert aps.set_current.call_count == 2
+
+    facade.apply_control_params(
+        params.model_copy(update={"amd_output_current": Current(1000.2, "m")})
+    )
+    assert aps.set_current.call_count == 3
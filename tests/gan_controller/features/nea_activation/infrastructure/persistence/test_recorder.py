@@ -0,0 +1,121 @@
+import datetime
+import io
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from gan_controller.core.constants import JST
+from gan_controller.core.domain.quantity import Value
+from gan_controller.features.nea_activation.domain.config import NEAConfig
+from gan_controller.features.nea_activation.infrastructure.persistence.recorder import (
+    NEALogRecorder,
+)
+from gan_controller.infrastructure.persistence.log_manager import LogFile
+
+
+def test_close_flushes_header_written_by_writer_thread(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat")
+    recorder = NEALogRecorder(log_file, NEAConfig())
+
+    recorder.record_header(datetime.datetime(2026, 1, 1, tzinfo=JST))
+    recorder.close()
+
+    text = log_file.path.read_text(encoding="utf-8")
+    assert text.startswith("#NEA activation monitor\n")
+    assert text.endswith("\t".join(c.header for c in recorder.columns) + "\n")
+
+
+def test_close_without_writes_does_not_create_file(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat")
+    recorder = NEALogRecorder(log_file, NEAConfig())
+
+    recorder.close()
+
+    assert not log_file.path.exists()
+
+
+def test_record_data_formats_row_with_column_formats(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat")
+    recorder = NEALogRecorder(log_file, NEAConfig())
+    q = Value(1.5)
+    result = SimpleNamespace(
+        timestamp=q,
+        laser_power_sv=q,
+        laser_power_pv=q,
+        quantum_efficiency=Value(1.5, "%"),
+        photocurrent=q,
+        photocurrent_voltage=q,
+        ext_pressure=q,
+        sip_pressure=q,
+        extraction_voltage=q,
+        bright_pc=q,
+        bright_pc_voltage=q,
+        dark_pc=q,
+        dark_pc_voltage=q,
+        amd_electricity=SimpleNamespace(voltage=q, current=q),
+    )
+
+    recorder.record_data(result, "ev")  # type: ignore[arg-type]
+    recorder.close()
+
+    expected = "\t".join(c.fmt.format(c.extractor(result, "ev")) for c in recorder.columns)  # type: ignore[arg-type]
+    assert log_file.path.read_text(encoding="utf-8") == expected + "\n"
+
+
+def test_writer_keeps_file_open_between_writes(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat")
+    recorder = NEALogRecorder(log_file, NEAConfig())
+    opened: list[object] = []
+    original_open = log_file.open_append
+
+    def _counting_open() -> object:
+        f = original_open()
+        opened.append(f)
+        return f
+
+    log_file.open_append = _counting_open  # type: ignore[method-assign]
+
+    recorder.record_header(datetime.datetime(2026, 1, 1, tzinfo=JST))
+    recorder._write("extra\n")  # noqa: SLF001
+    recorder.close()
+
+    assert len(opened) == 1
+    assert log_file.path.read_text(encoding="utf-8").endswith("extra\n")
+
+
+def test_write_failure_on_last_batch_does_not_block_close(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat")
+    recorder = NEALogRecorder(log_file, NEAConfig())
+
+    class _FailingFile(io.BytesIO):
+        def write(self, _data: object) -> int:
+            msg = "disk full"
+            raise OSError(msg)
+
+    log_file.open_append = _FailingFile  # type: ignore[method-assign]
+
+    # 終了合図を含むバッチの書き込みで失敗させる
+    recorder._write_queue.put(b"row\n")  # noqa: SLF001
+    recorder._write_queue.put(None)  # noqa: SLF001
+    writer = threading.Thread(target=recorder._drain, daemon=True)  # noqa: SLF001
+    writer.start()
+    writer.join(timeout=3)
+
+    assert not writer.is_alive()
+
+
+def test_encoding_error_is_raised_to_caller(tmp_path: Path) -> None:
+    log_file = LogFile(tmp_path / "[1.0]NEA-20260101000000.dat", encoding="shift_jis")
+    config = NEAConfig()
+    config.log.comment = "sample \u2603"  # shift_jis で表せない文字
+    recorder = NEALogRecorder(log_file, config)
+
+    # 書き込みスレッドで黙って失敗せず、記録した側にエラーが返る
+    with pytest.raises(UnicodeEncodeError):
+        recorder.record_header(datetime.datetime(2026, 1, 1, tzinfo=JST))
+
+    recorder._write("row\n")  # noqa: SLF001
+    recorder.close()
+    assert log_file.path.read_text(encoding="shift_jis") == "row\n"
@@ -78,7 +78,7 @@ def test_experiment_start_fixed_background_disables_laser_connection(
         lambda: AppConfig(common=CommonConfig(is_simulation_mode=False), devices=DevicesConfig()),
     )
     monkeypatch.setattr(
-        "gan_controller.features.nea_activation.presentation.controller.RealNEAHardwareBackend",
+        "gan_controller.features.nea_activation.infrastructure.hardware.backend.RealNEAHardwareBackend",
         _FakeRealBackend,
     )
     monkeypatch.setattr(
@@ -94,10 +94,32 @@ def test_experiment_start_fixed_background_disables_laser_connection(
 
 def test_preview_refresh_signal_triggers_log_preview_update(
     qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[bool] = []
+
+    def _spy_update_log_preview(_self: NEAActivationController, *, use_cache: bool = True) -> None:
+        calls.append(use_cache)
+
+    monkeypatch.setattr(NEAActivationController, "_update_log_preview", _spy_update_log_preview)
+
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    controller = NEAActivationController(view)
+
+    baseline = len(calls)
+    view.log_setting_panel.preview_refresh_requested.emit()
+
+    # 更新要求ではキャッシュを使わずに取得し直す
+    assert controller is not None
+    assert calls[baseline:] == [False]
+
+
+def test_config_changed_burst_is_coalesced_into_single_preview_update(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     calls = {"count": 0}
 
-    def _spy_update_log_preview(_self: NEAActivationController) -> None:
+    def _spy_update_log_preview(_self: NEAActivationController, **_kwargs: object) -> None:
         calls["count"] += 1
 
     monkeypatch.setattr(NEAActivationController, "_update_log_preview", _spy_update_log_preview)
@@ -105,9 +127,79 @@ def test_preview_refresh_signal_triggers_log_preview_update(
     view = NEAActivationMainView()
     qtbot.addWidget(view)
     controller = NEAActivationController(view)
+    qtbot.waitUntil(lambda: not controller._preview_timer.isActive())  # noqa: SLF001
 
     baseline = calls["count"]
-    view.log_setting_panel.preview_refresh_requested.emit()
+    for _ in range(5):
+        view.log_setting_panel.config_changed.emit()
+
+    qtbot.waitUntil(lambda: calls["count"] > baseline)
+    qtbot.wait(200)
 
-    assert controller is not None
     assert calls["count"] == baseline + 1
+
+
+def test_stale_preview_result_is_ignored(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    controller = NEAActivationController(view)
+    controller._preview_request_id = 5  # noqa: SLF001
+
+    view.log_setting_panel.set_preview_text("-")
+    controller._on_preview_ready(4, ("utf-8", False, False), (1, 2))  # noqa: SLF001
+    assert view.log_setting_panel.next_num_label.text() == "-"
+
+    controller._on_preview_ready(5, ("utf-8", False, False), (3, 4))  # noqa: SLF001
+    assert view.log_setting_panel.next_num_label.text() == "3.4"
+
+
+def test_preview_started_before_cache_clear_is_not_cached(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    controller = NEAActivationController(view)
+    key = ("utf-8", False, False)
+    request_id = controller._preview_request_id  # noqa: SLF001
+
+    # 取得中に実験開始/終了でキャッシュが破棄されたら、古い結果は戻さない
+    controller._clear_log_number_cache()  # noqa: SLF001
+    controller._on_preview_ready(request_id, key, (1, 2))  # noqa: SLF001
+    assert controller._get_cached_log_number(key) is None  # noqa: SLF001
+
+
+def test_results_are_flushed_to_view_in_batch(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    controller = NEAActivationController(view)
+
+    batches: list[list[object]] = []
+    view.update_view_batch = batches.append  # type: ignore[method-assign]
+
+    results = [object(), object(), object()]
+    for result in results:
+        controller.on_result(result)  # type: ignore[arg-type]
+
+    qtbot.waitUntil(lambda: len(batches) >= 1)
+
+    assert batches == [results]
+
+
+def test_on_close_saves_config_only_when_changed(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    saved: list[NEAConfig] = []
+    monkeypatch.setattr(NEAConfig, "save", lambda self, _path=None: saved.append(self))
+
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    controller = NEAActivationController(view)
+    controller._last_saved_config_json = view.get_full_config().model_dump_json()  # noqa: SLF001
+
+    controller.on_close()
+    assert saved == []
+
+    config = view.get_full_config()
+    config.log.update_major_number = not config.log.update_major_number
+    view.set_full_config(config)
+
+    controller.on_close()
+    assert len(saved) == 1
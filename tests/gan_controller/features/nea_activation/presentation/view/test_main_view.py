@@ -0,0 +1,53 @@
+from pytestqt.qtbot import QtBot
+
+from gan_controller.features.nea_activation.presentation.view import NEAActivationMainView
+
+
+def test_graph_refresh_deferred_while_hidden(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+    graph_panel = view.graph_panel
+
+    refreshed: list[str] = []
+    graph_panel.graph_pc.refresh = lambda: refreshed.append("pc")
+    graph_qe = graph_panel._ensure_graph_qe()  # noqa: SLF001
+    graph_qe.refresh = lambda: refreshed.append("qe")
+
+    # 非表示中は描画を保留
+    graph_panel._dirty = True  # noqa: SLF001
+    graph_panel._flush_plots()  # noqa: SLF001
+    assert refreshed == []
+
+    # 表示されたら保留分を描画
+    view.show()
+    qtbot.waitExposed(view)
+    assert refreshed == ["pc", "qe"]
+
+
+def test_measure_labels_throttled_but_show_latest(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+
+    shown: list[object] = []
+    view._update_measure_values = shown.append  # noqa: SLF001
+
+    # 間隔内の連続した結果は、最初の1件だけすぐ表示
+    for result in ("r1", "r2", "r3"):
+        view._show_measure_values(result)  # noqa: SLF001
+    assert shown == ["r1"]
+
+    # 間隔が明けたら最新の結果を表示 (途中の結果は飛ばす)
+    qtbot.waitUntil(lambda: len(shown) == 2)
+    assert shown == ["r1", "r3"]
+
+
+def test_set_full_config_checkbox_only_change_round_trips(qtbot: QtBot) -> None:
+    view = NEAActivationMainView()
+    qtbot.addWidget(view)
+
+    config = view.get_full_config()
+    config.condition.is_fixed_background = not config.condition.is_fixed_background
+
+    # チェック状態だけが変わった設定も反映される
+    view.set_full_config(config)
+    assert view.get_full_config().condition == config.condition
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import numpy as np
+from pytestqt.qtbot import QtBot
+
+from gan_controller.core.domain.quantity import Current, Pressure, Time, Value
+from gan_controller.features.nea_activation.presentation.view.widgets import NEAGraphPanel
+
+
+def _result(t_sec: float, pc: float, qe_percent: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        timestamp=Time(t_sec),
+        ext_pressure=Pressure(1e-8),
+        photocurrent=Current(pc),
+        quantum_efficiency=Value(qe_percent, "%"),
+    )
+
+
+def test_single_and_batch_append_store_same_data(qtbot: QtBot) -> None:
+    """1点ずつ追加しても、まとめて追加しても同じデータになる (0以下は NaN)"""
+    results = [_result(0, 1e-6, 2.0), _result(60, -1e-9, 0.0), _result(120, 2e-6, 3.0)]
+
+    single = NEAGraphPanel()
+    qtbot.addWidget(single)
+    for r in results:
+        single.append_data(r)
+
+    batch = NEAGraphPanel()
+    qtbot.addWidget(batch)
+    batch.append_batch(results)
+
+    for panel in (single, batch):
+        data = panel.graph_pc._current_data_source  # noqa: SLF001
+        assert data is not None
+        np.testing.assert_allclose(data.x_view(), [0.0, 1.0, 2.0])
+        np.testing.assert_allclose(data.y_view("pc"), [1e-6, np.nan, 2e-6])
+
+        assert panel.graph_qe is not None
+        data = panel.graph_qe._current_data_source  # noqa: SLF001
+        assert data is not None
+        np.testing.assert_allclose(data.y_view("qe"), [2.0, np.nan, 3.0])
+
+
+def test_qe_graph_built_on_first_data(qtbot: QtBot) -> None:
+    """QEグラフは最初のデータ追加時に作られ、表示幅の設定も引き継ぐ"""
+    panel = NEAGraphPanel()
+    qtbot.addWidget(panel)
+    assert panel.graph_qe is None
+
+    panel.time_window_spin.setValue(5)
+    panel.clear_graph()  # 未作成でもクリアできる
+    assert panel.graph_qe is None
+
+    panel.append_data(_result(0, 1e-6, 2.0))
+    assert panel.graph_qe is not None
+    assert panel.graph_qe._visible_x_span == 5.0  # noqa: SLF001
+
+
+def test_append_batch_redraws_once(qtbot: QtBot) -> None:
+    """まとめて追加した結果は、各グラフ1回の再描画ですぐ反映する"""
+    panel = NEAGraphPanel()
+    qtbot.addWidget(panel)
+    panel.show()
+    qtbot.waitExposed(panel)
+
+    refreshed: list[str] = []
+    panel.graph_pc.refresh = lambda: refreshed.append("pc")
+    graph_qe = panel._ensure_graph_qe()  # noqa: SLF001
+    graph_qe.refresh = lambda: refreshed.append("qe")
+
+    panel.append_batch([_result(0, 1e-6, 2.0), _result(60, 2e-6, 3.0)])
+    assert refreshed == ["pc", "qe"]
+    assert not panel._dirty  # noqa: SLF001
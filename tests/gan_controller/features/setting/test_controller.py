@@ -0,0 +1,159 @@
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QMessageBox
+from pytestqt.qtbot import QtBot
+
+from gan_controller.core.domain.app_config import AppConfig
+from gan_controller.features.setting.controller import SettingsController
+from gan_controller.features.setting.view.main_view import SettingMainView
+
+
+def _create_controller(qtbot: QtBot) -> tuple[SettingMainView, SettingsController]:
+    """初期ロードまで済ませたコントローラを作る"""
+    view = SettingMainView()
+    qtbot.addWidget(view)
+    controller = SettingsController(view)
+    qtbot.waitUntil(lambda: controller._config is not None)  # noqa: SLF001
+    return view, controller
+
+
+def test_initial_load_is_deferred(qtbot: QtBot) -> None:
+    view = SettingMainView()
+    qtbot.addWidget(view)
+    controller = SettingsController(view)
+
+    # 構築直後はまだ読み込まず、ロード前の変更判定・終了処理では何もしない
+    assert controller._config is None  # noqa: SLF001
+    assert not controller.is_modified()
+    controller.on_close()
+
+    qtbot.waitUntil(lambda: controller._config is not None)  # noqa: SLF001
+    assert view.get_full_config() == controller._config  # noqa: SLF001
+
+
+def test_is_modified_tracks_edits(qtbot: QtBot) -> None:
+    view, controller = _create_controller(qtbot)
+
+    # ロード直後 (反映による変更通知は除く) は変更なし
+    assert not controller._is_edited  # noqa: SLF001
+    assert not controller.is_modified()
+
+    view.gm10_page.ext_ch_spin.setValue(view.gm10_page.ext_ch_spin.value() + 1)
+    assert controller._is_edited  # noqa: SLF001
+    assert controller.is_modified()
+
+    # 元の値に戻したら、編集はあっても内容としては変更なし
+    view.gm10_page.ext_ch_spin.setValue(view.gm10_page.ext_ch_spin.value() - 1)
+    assert not controller.is_modified()
+
+
+def test_save_runs_in_background_and_keeps_last_request(
+    qtbot: QtBot, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "app_config.toml"
+    original_save = AppConfig.save
+    monkeypatch.setattr(
+        AppConfig, "save", lambda self, **kwargs: original_save(self, path, **kwargs)
+    )
+
+    view, controller = _create_controller(qtbot)
+    messages: list[str] = []
+    controller.status_message_requested.connect(lambda msg, _ms: messages.append(msg))
+
+    # 書き込み中に保存が続いたら、最後の内容だけを書き込む
+    view.gm10_page.visa_edit.setText("first")
+    assert controller.save_config()
+    view.gm10_page.visa_edit.setText("second")
+    assert controller.save_config()
+    view.gm10_page.visa_edit.setText("last")
+    assert controller.save_config()
+    assert not controller.is_modified()  # 状態は書き込み完了を待たずに更新
+
+    qtbot.waitUntil(lambda: not controller._is_saving)  # noqa: SLF001
+    assert AppConfig.load(path).devices.gm10.visa == "last"
+    assert messages == ["設定を保存しました"] * 2  # 最初の書き込み + まとめた1回
+
+
+def test_save_on_switch_writes_before_leaving(
+    qtbot: QtBot, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "app_config.toml"
+    original_save = AppConfig.save
+    monkeypatch.setattr(
+        AppConfig, "save", lambda self, **kwargs: original_save(self, path, **kwargs)
+    )
+    monkeypatch.setattr(QMessageBox, "question", lambda *_args: QMessageBox.StandardButton.Save)
+
+    view, controller = _create_controller(qtbot)
+
+    # 書き込み中の保存があっても、移動時には最新の内容が書き込み済み
+    view.gm10_page.visa_edit.setText("first")
+    assert controller.save_config()
+    view.gm10_page.visa_edit.setText("switched")
+    assert controller.try_switch_from()
+    assert AppConfig.load(path).devices.gm10.visa == "switched"
+    assert not controller.is_modified()
+
+
+def test_save_failure_on_switch_keeps_tab(
+    qtbot: QtBot, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "app_config.toml"
+    path.mkdir()  # ファイルとして書き込めない
+    original_save = AppConfig.save
+    monkeypatch.setattr(
+        AppConfig, "save", lambda self, **kwargs: original_save(self, path, **kwargs)
+    )
+    monkeypatch.setattr(QMessageBox, "question", lambda *_args: QMessageBox.StandardButton.Save)
+    errors: list[str] = []
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args: errors.append(args[2]))
+
+    view, controller = _create_controller(qtbot)
+
+    # 移動前にエラーを表示し、タブに留まる
+    view.gm10_page.visa_edit.setText("changed")
+    assert not controller.try_switch_from()
+    assert len(errors) == 1
+    assert controller.is_modified()
+
+
+def test_discard_restores_view_without_reloading(
+    qtbot: QtBot, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    view, controller = _create_controller(qtbot)
+    saved_visa = view.gm10_page.visa_edit.text()
+
+    view.gm10_page.visa_edit.setText("edited")
+    monkeypatch.setattr(QMessageBox, "question", lambda *_args: QMessageBox.StandardButton.Discard)
+    monkeypatch.setattr(AppConfig, "load", lambda *_args: pytest.fail("reloaded from file"))
+
+    assert controller.try_switch_from()
+    assert view.gm10_page.visa_edit.text() == saved_visa
+    assert not controller.is_modified()
+
+
+def test_save_failure_is_reported(
+    qtbot: QtBot, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "app_config.toml"
+    path.mkdir()  # ファイルとして書き込めない
+    original_save = AppConfig.save
+    monkeypatch.setattr(
+        AppConfig, "save", lambda self, **kwargs: original_save(self, path, **kwargs)
+    )
+    errors: list[str] = []
+    monkeypatch.setattr(QMessageBox, "critical", lambda *args: errors.append(args[2]))
+
+    view, controller = _create_controller(qtbot)
+    messages: list[str] = []
+    controller.status_message_requested.connect(lambda msg, _ms: messages.append(msg))
+
+    view.gm10_page.visa_edit.setText("changed")
+    assert controller.save_config()
+    qtbot.waitUntil(lambda: not controller._is_saving)  # noqa: SLF001
+
+    # 完了通知は出さず、エラー表示と未保存扱いにする
+    assert messages == []
+    assert len(errors) == 1
+    assert controller.is_modified()
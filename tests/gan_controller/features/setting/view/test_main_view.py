@@ -0,0 +1,62 @@
+from pytestqt.qtbot import QtBot
+
+from gan_controller.core.domain.app_config import AppConfig
+from gan_controller.features.setting.view.main_view import SettingMainView
+
+
+def test_set_full_config_does_not_report_edits(qtbot: QtBot) -> None:
+    view = SettingMainView()
+    qtbot.addWidget(view)
+    edited: list[bool] = []
+    view.config_edited.connect(lambda: edited.append(True))
+
+    config = AppConfig()
+    config.devices.gm10.visa = "changed"
+    config.devices.gm10.ext_ch = 5
+    view.set_full_config(config)
+    assert edited == []
+    assert view.get_full_config() == config
+
+    # 入力欄の操作は通知する
+    view.gm10_page.ext_ch_spin.setValue(6)
+    assert edited == [True]
+
+
+def test_every_page_input_reports_edits(qtbot: QtBot) -> None:
+    """get_full_config が読む入力欄は、どれを変更しても変更通知が出る"""
+    view = SettingMainView()
+    qtbot.addWidget(view)
+    edited: list[bool] = []
+    view.config_edited.connect(lambda: edited.append(True))
+
+    pfr_pages = [view.hps_page, view.aps_page]
+    edits = [
+        view.gm10_page.visa_edit,
+        *(page.visa_address_edit for page in pfr_pages),
+        view.general_page.encode_edit,
+    ]
+    spins = [
+        view.gm10_page.ext_ch_spin,
+        view.gm10_page.sip_ch_spin,
+        view.gm10_page.hv_ch_spin,
+        view.gm10_page.pc_ch_spin,
+        view.gm10_page.tc_ch_spin,
+        *(
+            spin
+            for page in pfr_pages
+            for spin in (page.unit_spin, page.v_limit_spin, page.ovp_spin, page.ocp_spin)
+        ),
+        view.ibeam_page.com_number_edit,
+        view.ibeam_page.beam_channel_spin,
+        view.pwux_page.com_number_edit,
+    ]
+
+    for edit in edits:
+        edited.clear()
+        edit.setText(edit.text() + "x")
+        assert edited, edit.objectName()
+
+    for spin in spins:
+        edited.clear()
+        spin.setValue(spin.minimum() if spin.value() != spin.minimum() else spin.maximum())
+        assert edited, spin.objectName()
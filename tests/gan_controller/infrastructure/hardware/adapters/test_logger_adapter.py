@@ -0,0 +1,49 @@
+import math
+
+import pytest
+
+from gan_controller.infrastructure.hardware.adapters.logger_adapter import GM10Adapter
+
+
+class _FakeGM10:
+    def __init__(self, samples: list[tuple[float, str]]) -> None:
+        self._samples = iter(samples)
+
+    def read_channel(self, _channel: int | str) -> tuple[float, str]:
+        return next(self._samples)
+
+
+def test_read_integrated_voltage_normalizes_units() -> None:
+    driver = _FakeGM10([(1.0, "mV"), (3.0, "mV"), (0.002, "V"), (2.0, "mV")])
+    adapter = GM10Adapter(driver)  # type: ignore[arg-type]
+
+    first = adapter.read_integrated_voltage(1, n=2, interval=1e-6)
+    second = adapter.read_integrated_voltage(1, n=2, interval=1e-6)
+
+    assert first.base_value == pytest.approx(2e-3)
+    assert second.base_value == pytest.approx(2e-3)
+    # 換算係数は呼び出しをまたいで再利用される
+    assert set(adapter._scale_by_unit) == {"mV", "V"}  # noqa: SLF001
+
+
+class _FakeRangeGM10:
+    def __init__(self, data: dict[str, tuple[float, str]]) -> None:
+        self._data = data
+        self.range_queries: list[tuple[int | str, int | str]] = []
+
+    def read_channels(self, start_ch: int | str, end_ch: int | str) -> dict[str, tuple[float, str]]:
+        self.range_queries.append((start_ch, end_ch))
+        return self._data
+
+
+def test_read_voltages_uses_single_range_query() -> None:
+    driver = _FakeRangeGM10({"0002": (5.0, "mV"), "0003": (1.0, "V"), "0005": (2.0, "V")})
+    adapter = GM10Adapter(driver)  # type: ignore[arg-type]
+
+    ext, sip, hv, missing = adapter.read_voltages((5, 2, -1, 4))
+
+    assert driver.range_queries == [("0002", "0005")]
+    assert ext.base_value == pytest.approx(2.0)
+    assert sip.base_value == pytest.approx(5e-3)
+    assert math.isnan(hv.base_value)
+    assert math.isnan(missing.base_value)
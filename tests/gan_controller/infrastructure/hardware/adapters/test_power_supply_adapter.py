@@ -0,0 +1,35 @@
+from gan_controller.infrastructure.hardware.adapters.power_supply_adapter import (
+    MockPowerSupplyAdapter,
+    PFR100L50Adapter,
+)
+
+
+class _FakeDriver:
+    def __init__(self) -> None:
+        self.queries = 0
+
+    def measure_all(self) -> tuple[float, float, float]:
+        self.queries += 1
+        return 2.0, 0.5, 1.0
+
+
+def test_pfr100l50_measure_all_uses_single_query() -> None:
+    driver = _FakeDriver()
+    adapter = PFR100L50Adapter(driver)  # type: ignore[arg-type]
+
+    measurement = adapter.measure_all()
+
+    assert driver.queries == 1
+    assert measurement.voltage.base_value == 2.0
+    assert measurement.current.base_value == 0.5
+    assert measurement.power.base_value == 1.0
+
+
+def test_measure_all_falls_back_to_individual_measurements() -> None:
+    adapter = MockPowerSupplyAdapter()
+
+    measurement = adapter.measure_all()
+
+    assert measurement.voltage.base_value == 0.0
+    assert measurement.current.base_value == 0.0
+    assert measurement.power.base_value == 0.0
@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel
+
+from gan_controller.infrastructure.persistence.toml_config_io import (
+    load_toml_config,
+    save_toml_config,
+)
+
+
+class _Config(BaseModel):
+    name: str = "default"
+    count: int = 0
+
+
+def test_load_returns_independent_copies(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text('name = "a"\ncount = 1\n', encoding="utf-8")
+
+    first = load_toml_config(_Config, path)
+    first.count = 99
+
+    # 返り値を書き換えてもキャッシュには影響しない
+    assert load_toml_config(_Config, path) == _Config(name="a", count=1)
+
+
+def test_load_reflects_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text('name = "a"\ncount = 1\n', encoding="utf-8")
+    assert load_toml_config(_Config, path).name == "a"
+
+    # 保存したら次の読み込みで新しい内容を返す
+    save_toml_config(_Config(name="b", count=2), path)
+    assert load_toml_config(_Config, path) == _Config(name="b", count=2)
+
+    # 外部での書き換え (サイズが変わる) も反映する
+    path.write_text('name = "ccc"\ncount = 3\n', encoding="utf-8")
+    assert load_toml_config(_Config, path) == _Config(name="ccc", count=3)
+
+
+def test_load_missing_file_returns_default(tmp_path: Path) -> None:
+    assert load_toml_config(_Config, tmp_path / "missing.toml") == _Config()
+
+
+def test_save_skips_unchanged_config(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    save_toml_config(_Config(name="a", count=1), path)
+
+    # 内容が同じなら書き換えない (更新時刻が変わらない)
+    os.utime(path, ns=(0, 0))
+    save_toml_config(_Config(name="a", count=1), path)
+    assert path.stat().st_mtime_ns == 0
+
+    # 変わっていれば書き換える
+    save_toml_config(_Config(name="a", count=2), path)
+    assert load_toml_config(_Config, path) == _Config(name="a", count=2)
+
+
+def test_save_adds_keys_missing_from_older_file(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.write_text('name = "a"\n', encoding="utf-8")  # count の無い古い形式
+
+    # 読み込み結果と同じ内容でも、足りないキーは書き足す
+    config = load_toml_config(_Config, path)
+    assert config == _Config(name="a")
+    save_toml_config(config, path)
+    assert "count = 0" in path.read_text(encoding="utf-8")
+
+
+def test_save_keeps_user_comments_after_external_edit(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    save_toml_config(_Config(name="a", count=1), path)
+    save_toml_config(_Config(name="b", count=1), path)  # 生成したままのファイルは作り直す
+    assert load_toml_config(_Config, path) == _Config(name="b", count=1)
+
+    # 外部で書き加えられたコメントは、以降の保存でも残す
+    path.write_text("# memo\n" + path.read_text(encoding="utf-8"), encoding="utf-8")
+    save_toml_config(_Config(name="c", count=2), path)
+    assert path.read_text(encoding="utf-8").startswith("# memo")
+    assert load_toml_config(_Config, path) == _Config(name="c", count=2)
+
+
+def test_save_replaces_file_without_leaving_temp_files(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    save_toml_config(_Config(name="a", count=1), path)
+    save_toml_config(_Config(name="b", count=2), path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config.toml"]
+    assert load_toml_config(_Config, path) == _Config(name="b", count=2)
+
+
+def test_save_raises_only_when_requested(tmp_path: Path) -> None:
+    path = tmp_path / "config.toml"
+    path.mkdir()  # ファイルとして書き込めない
+
+    save_toml_config(_Config(name="a"), path)  # 既定ではエラー表示のみ
+    with pytest.raises(OSError):  # noqa: PT011
+        save_toml_config(_Config(name="a"), path, raise_on_error=True)
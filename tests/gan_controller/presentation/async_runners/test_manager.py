@@ -1,3 +1,6 @@
+import threading
+import time
+
 from gan_controller.presentation.async_runners.interfaces import IExperimentObserver, IExperimentWorkflow
 from gan_controller.presentation.async_runners.manager import _ExperimentWorker
 
@@ -69,3 +72,18 @@ def test_worker_emits_finished_once_on_normal_completion() -> None:
 
     assert finished_count == 1
     assert errors == []
+
+
+def test_worker_stop_wakes_waiting_workflow() -> None:
+    worker = _ExperimentWorker(_WorkflowNoOp())
+    assert worker.wait_for_interruption(0.01) is False
+
+    timer = threading.Timer(0.05, worker.stop)
+    timer.start()
+    start = time.perf_counter()
+    interrupted = worker.wait_for_interruption(5.0)
+    timer.join()
+
+    assert interrupted is True
+    assert worker.interruption_requested
+    assert time.perf_counter() - start < 1.0
@@ -0,0 +1,33 @@
+import numpy as np
+
+from gan_controller.presentation.components.widgets.graph.downsample import lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_peak() -> None:
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[437] = 10.0  # 単発のピーク
+
+    idx = lttb_indices(x, y, 50)
+
+    assert len(idx) == 50
+    assert idx[0] == 0
+    assert idx[-1] == 999
+    assert np.all(np.diff(idx) > 0)
+    assert 437 in idx
+
+
+def test_lttb_returns_all_points_when_not_needed() -> None:
+    x = np.arange(10, dtype=float)
+
+    assert np.array_equal(lttb_indices(x, x, 20), np.arange(10))
+
+
+def test_lttb_skips_nan_points() -> None:
+    x = np.arange(100, dtype=float)
+    y = np.sin(x)
+    y[::2] = np.nan
+
+    idx = lttb_indices(x, y, 20)
+
+    assert not np.isnan(y[idx[1:-1]]).any()
@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+
+from gan_controller.presentation.components.widgets.graph.graph_data import GraphData
+
+
+def test_append_point_grows_beyond_initial_capacity() -> None:
+    data = GraphData(initial_capacity=2)
+
+    for i in range(5):
+        data.append_point(float(i), {"a": float(i * 10)})
+
+    assert len(data) == 5
+    assert data.x_view().tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert data.y_view("a").tolist() == [0.0, 10.0, 20.0, 30.0, 40.0]
+
+
+def test_missing_series_is_filled_with_nan() -> None:
+    data = GraphData()
+
+    data.append_point(0.0, {"a": 1.0})
+    data.append_point(1.0, {"b": 2.0})
+
+    assert math.isnan(data.y_view("a")[1])
+    assert math.isnan(data.y_view("b")[0])
+    assert data.y_view("b")[1] == 2.0
+
+
+def test_max_capacity_drops_oldest_points() -> None:
+    data = GraphData(initial_capacity=2, max_capacity=4)
+
+    for i in range(6):
+        data.append_point(float(i), {"a": float(i)})
+
+    assert len(data) <= 4
+    assert data.x_view()[-1] == 5.0
+    assert data.x_view().tolist() == sorted(data.x_view().tolist())
+
+
+def test_append_points_over_max_capacity_keeps_latest() -> None:
+    data = GraphData(initial_capacity=2, max_capacity=4)
+    data.append_point(0.0, {"a": 0.0})
+
+    data.append_points(np.arange(1.0, 7.0), {"a": np.arange(1.0, 7.0)})
+
+    assert len(data) == 4
+    assert data.x_view().tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert data.y_view("a").tolist() == [3.0, 4.0, 5.0, 6.0]
+
+
+def test_graph_data_has_no_instance_dict() -> None:
+    assert not hasattr(GraphData(), "__dict__")
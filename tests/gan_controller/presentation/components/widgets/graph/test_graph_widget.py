@@ -0,0 +1,135 @@
+import numpy as np
+from matplotlib.backend_bases import ResizeEvent
+from pytestqt.qtbot import QtBot
+
+from gan_controller.presentation.components.widgets.graph.graph_widget import DualAxisGraph
+
+
+def test_append_point_blits_when_axes_limits_are_unchanged(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+    graph.add_series("a", "left")
+    graph.show()
+
+    graph.append_point(0.0, {"a": 1.0})
+    graph.append_point(10.0, {"a": 2.0})
+    graph.canvas.draw()
+    assert graph._background is not None  # noqa: SLF001
+
+    draw_requests: list[bool] = []
+    graph.canvas.draw_idle = lambda: draw_requests.append(True)  # type: ignore[method-assign]
+
+    # 余白内 & Y範囲内の点は背景を使った部分描画で済む
+    graph.append_point(10.5, {"a": 1.5})
+    assert draw_requests == []
+    assert graph._series_map["a"]["line"].get_xdata()[-1] == 10.5  # noqa: SLF001
+
+    # 右端を超えたら全体を再描画
+    graph.append_point(100.0, {"a": 1.5})
+    assert draw_requests == [True]
+
+
+def test_resize_invalidates_saved_background(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+    graph.add_series("a", "left")
+    graph.show()
+
+    graph.append_point(0.0, {"a": 1.0})
+    graph.append_point(10.0, {"a": 2.0})
+    graph.canvas.draw()
+    assert graph._background is not None  # noqa: SLF001
+
+    ResizeEvent("resize_event", graph.canvas)._process()  # noqa: SLF001
+    assert graph._background is None  # noqa: SLF001
+
+    draw_requests: list[bool] = []
+    graph.canvas.draw_idle = lambda: draw_requests.append(True)  # type: ignore[method-assign]
+
+    # 背景が無い間は部分描画せず全体を再描画する
+    graph.append_point(10.5, {"a": 1.5})
+    assert draw_requests == [True]
+
+
+def test_max_draw_points_decimates_lines_and_keeps_latest_point(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+    graph.add_series("a", "left")
+    graph.set_max_draw_points(10)
+
+    x = np.arange(95, dtype=float)
+    graph.append_points(x, {"a": x * 2}, redraw=False)
+    graph.refresh()
+
+    line = graph._series_map["a"]["line"]  # noqa: SLF001
+    assert len(line.get_xdata()) <= 10
+    assert line.get_xdata()[-1] == 94.0
+    assert line.get_ydata()[-1] == 188.0
+
+
+def test_visible_span_limits_line_data_to_window(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+    graph.add_series("a", "left")
+    graph.set_visible_x_span(10.0)
+
+    x = np.arange(100, dtype=float)
+    graph.append_points(x, {"a": x}, redraw=False)
+    graph.refresh()
+
+    # 表示幅より前の点は、線をつなぐ1点を除いて渡さない
+    line = graph._series_map["a"]["line"]  # noqa: SLF001
+    np.testing.assert_array_equal(line.get_xdata(), np.arange(88, 100, dtype=float))
+
+    # 全期間表示に戻すと全点を渡す
+    graph.set_visible_x_span(None)
+    assert len(line.get_xdata()) == 100
+
+
+def test_max_draw_points_capped_by_axes_pixel_width(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+
+    graph.set_max_draw_points(100_000)
+    max_points = graph._effective_max_points()  # noqa: SLF001
+    assert max_points == 2 * int(graph.ax_left.bbox.width)
+
+    graph.set_max_draw_points(10)
+    assert graph._effective_max_points() == 10  # noqa: SLF001
+
+
+def test_blit_only_repaints_axes_area(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    qtbot.addWidget(graph)
+    graph.add_series("a", "left")
+    graph.show()
+
+    graph.append_point(0.0, {"a": 1.0})
+    graph.append_point(10.0, {"a": 2.0})
+    graph.canvas.draw()
+
+    blitted: list[object] = []
+    graph.canvas.blit = lambda bbox=None: blitted.append(bbox)  # type: ignore[method-assign]
+
+    graph.append_point(10.5, {"a": 1.5})
+    assert blitted == [graph.ax_left.bbox]
+
+    # 表示幅を変えたら背景を取り直す
+    graph.set_visible_x_span(5.0)
+    assert graph._background is None  # noqa: SLF001
+
+
+def test_destroyed_graph_cancels_pending_draw(qtbot: QtBot) -> None:
+    graph = DualAxisGraph()
+    canvas = graph.canvas
+    graph.add_series("a", "left")
+    graph.append_point(0.0, {"a": 1.0})
+    canvas.draw_idle()
+    assert canvas._draw_pending  # noqa: SLF001
+
+    # 破棄されたら予約済みの描画を取り消し、以降の描画要求も無視する
+    graph.deleteLater()
+    del graph
+    qtbot.waitUntil(lambda: canvas._released)  # noqa: SLF001
+    assert not canvas._draw_pending  # noqa: SLF001
+    canvas.draw()
@@ -53,3 +53,29 @@ def test_disabled_widget_skips_preview_refresh_emit(qtbot: QtBot) -> None:
     panel._emit_preview_refresh_if_needed()  # noqa: SLF001
 
     assert calls == []
+
+
+def test_get_values_follows_user_input_and_set_values(qtbot: QtBot) -> None:
+    panel = CommonLogSettingPanel()
+    qtbot.addWidget(panel)
+    panel._preview_refresh_timer.stop()  # noqa: SLF001
+
+    panel.chk_date_update.setChecked(True)
+    panel.comment_edit.setText("memo")
+    assert panel.get_values() == {
+        "update_date_folder": True,
+        "update_major_number": False,
+        "comment": "memo",
+    }
+
+    panel.set_values(update_date=False, major_update=True, comment="other")
+    values = panel.get_values()
+    assert values == {
+        "update_date_folder": False,
+        "update_major_number": True,
+        "comment": "other",
+    }
+
+    # 返り値を書き換えてもキャッシュには影響しない
+    values["comment"] = "changed"
+    assert panel.get_values()["comment"] == "other"
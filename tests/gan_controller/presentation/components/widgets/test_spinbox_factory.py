@@ -0,0 +1,25 @@
+from pytestqt.qtbot import QtBot
+
+from gan_controller.presentation.components.widgets import create_double_spin_box
+
+
+def test_value_is_applied_after_range(qtbot: QtBot) -> None:
+    spin = create_double_spin_box(406, minimum=1, maximum=1000, decimals=0, suffix=" nm")
+    qtbot.addWidget(spin)
+
+    # 既定の上限 (99.99) で丸められない
+    assert spin.value() == 406
+    assert spin.maximum() == 1000
+    assert spin.suffix() == " nm"
+
+
+def test_signals_unblocked_after_building(qtbot: QtBot) -> None:
+    spin = create_double_spin_box(1.5, decimals=1, single_step=0.1)
+    qtbot.addWidget(spin)
+    assert spin.singleStep() == 0.1
+
+    # 作成後は通常どおり通知される
+    emitted: list[float] = []
+    spin.valueChanged.connect(emitted.append)
+    spin.setValue(2.0)
+    assert emitted == [2.0]
@@ -0,0 +1,23 @@
+from pytestqt.qtbot import QtBot
+
+from gan_controller.core.domain.quantity import Current
+from gan_controller.presentation.components.widgets.value_label import ValueLabel
+
+
+def test_set_if_changed_skips_same_value(qtbot: QtBot) -> None:
+    label = ValueLabel(Current(1.0), ".2e")
+    qtbot.addWidget(label)
+
+    assert not label.set_if_changed(Current(1.0))
+    assert label.set_if_changed(Current(2.0))
+    assert label.text() == format(Current(2.0), ".2e")
+
+
+def test_set_if_changed_updates_after_custom_formatter(qtbot: QtBot) -> None:
+    label = ValueLabel(1.0, ".1f")
+    qtbot.addWidget(label)
+
+    label.setValue(1.0, ".3f")
+
+    assert label.set_if_changed(1.0)
+    assert label.text() == "1.0"